@@ -0,0 +1,135 @@
+"""Micro-benchmark of the JSON decoders on synthetic responses per endpoint.
+
+Run with `python benchmarks/json_decoders.py`, decoders that are not installed are
+skipped. Payloads mimic the size and shape of real responses.
+"""
+
+import json
+import random
+import timeit
+
+from geckoterminal_api.decoding import DECODERS, JSONLoads
+
+ADDRESS = "0x60594a405d53811d3bc4766596efd80fd545a270"
+
+
+def ohlcv(candles: int = 1000) -> dict:
+    start = 1_700_000_000
+    ohlcv_list = [
+        [
+            start - i * 60,
+            *(random.uniform(1, 2) for _ in range(4)),
+            random.uniform(0, 1e6),
+        ]
+        for i in range(candles)
+    ]
+    return {
+        "data": {
+            "id": "ohlcv",
+            "type": "ohlcv_request_response",
+            "attributes": {"ohlcv_list": ohlcv_list},
+        },
+        "meta": {"base": {"address": ADDRESS}, "quote": {"address": ADDRESS}},
+    }
+
+
+def trades(count: int = 300) -> dict:
+    return {
+        "data": [
+            {
+                "id": f"eth_{i}_{ADDRESS}_{i}",
+                "type": "trade",
+                "attributes": {
+                    "block_number": 19_000_000 + i,
+                    "tx_hash": f"0x{i:064x}",
+                    "tx_from_address": ADDRESS,
+                    "from_token_amount": str(random.uniform(0, 100)),
+                    "to_token_amount": str(random.uniform(0, 100)),
+                    "price_from_in_usd": str(random.uniform(0, 4000)),
+                    "price_to_in_usd": str(random.uniform(0, 4000)),
+                    "block_timestamp": "2024-01-01T00:00:00Z",
+                    "kind": "buy" if i % 2 else "sell",
+                    "volume_in_usd": str(random.uniform(0, 1e5)),
+                },
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def pools(count: int = 20) -> dict:
+    return {
+        "data": [
+            {
+                "id": f"eth_{ADDRESS}{i}",
+                "type": "pool",
+                "attributes": {
+                    "name": "WETH / USDC 0.05%",
+                    "address": ADDRESS,
+                    "base_token_price_usd": str(random.uniform(0, 4000)),
+                    "reserve_in_usd": str(random.uniform(0, 1e8)),
+                    "pool_created_at": "2024-01-01T00:00:00Z",
+                    "price_change_percentage": {"h1": "0.1", "h24": "-1.2"},
+                    "transactions": {"h1": {"buys": 10, "sells": 12}},
+                    "volume_usd": {"h1": "1000.5", "h24": "250000.1"},
+                },
+                "relationships": {
+                    "base_token": {"data": {"id": f"eth_{ADDRESS}", "type": "token"}},
+                    "quote_token": {"data": {"id": f"eth_{ADDRESS}", "type": "token"}},
+                    "dex": {"data": {"id": "uniswap_v3", "type": "dex"}},
+                },
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def token_price(count: int = 30) -> dict:
+    return {
+        "data": {
+            "id": "prices",
+            "type": "simple_token_price",
+            "attributes": {
+                "token_prices": {
+                    f"0x{i:040x}": str(random.uniform(0, 10)) for i in range(count)
+                }
+            },
+        }
+    }
+
+
+PAYLOADS = {
+    "network_pool_ohlcv": ohlcv,
+    "network_pool_trades": trades,
+    "network_trending_pools": pools,
+    "network_addresses_token_price": token_price,
+}
+
+
+def main() -> None:
+    random.seed(0)
+    decoders: dict[str, JSONLoads] = {}
+    for name, factory in DECODERS.items():
+        loads = factory()
+        if loads is not None:
+            decoders[name] = loads
+    print(f"{'endpoint':32} {'bytes':>8} " + " ".join(f"{n:>10}" for n in decoders))
+    for endpoint, payload in PAYLOADS.items():
+        body = json.dumps(payload()).encode()
+        timings = {}
+        for name, loads in decoders.items():
+            runs, total = timeit.Timer(
+                lambda loads=loads, body=body: loads(body)
+            ).autorange()
+            timings[name] = total / runs
+        baseline = timings["json"]
+        cells = " ".join(
+            f"{timings[n] * 1e6:7.0f}us"
+            + (f" x{baseline / timings[n]:.1f}" if n != "json" else "")
+            for n in decoders
+        )
+        print(f"{endpoint:32} {len(body):8} {cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 from .api import GeckoTerminalAPI
 from .async_api import AsyncGeckoTerminalAPI
+from .cache import DEFAULT_TTLS, ResponseCache
+from .engine import AsyncEngine
 from .exceptions import GeckoTerminalAPIError, GeckoTerminalParameterWarning
+from .hub import PollingHub
 from .limits import (
     CURRENCIES,
     DAY_AGGREGATES,
@@ -10,23 +13,54 @@ from .limits import (
     MINUTE_AGGREGATES,
     OHLCV_LIMIT,
     POOL_INCLUDES,
+    RATE_LIMIT,
     TIMEFRAMES,
     TOKENS,
 )
+from .models import OHLCV, Dex, Network, Pool, Resource, Token, Trade
+from .ohlcv import AsyncOHLCVSync, OHLCVSeries, OHLCVSync
+from .prices import PriceWatcher
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .scheduler import PriorityScheduler
+from .store import OHLCVStore
+from .streams import NewPoolWatcher, TradeStream
 
 __all__ = [
     "CURRENCIES",
     "DAY_AGGREGATES",
+    "DEFAULT_TTLS",
     "HOUR_AGGREGATES",
     "MAX_ADDRESSES",
     "MAX_PAGE",
     "MINUTE_AGGREGATES",
+    "OHLCV",
     "OHLCV_LIMIT",
     "POOL_INCLUDES",
+    "RATE_LIMIT",
     "TIMEFRAMES",
     "TOKENS",
+    "AsyncEngine",
     "AsyncGeckoTerminalAPI",
+    "AsyncOHLCVSync",
+    "Dex",
     "GeckoTerminalAPI",
     "GeckoTerminalAPIError",
     "GeckoTerminalParameterWarning",
+    "Network",
+    "NewPoolWatcher",
+    "OHLCVSeries",
+    "OHLCVStore",
+    "OHLCVSync",
+    "PollingHub",
+    "Pool",
+    "PriceWatcher",
+    "PriorityScheduler",
+    "RateLimiter",
+    "Resource",
+    "ResponseCache",
+    "RetryPolicy",
+    "Token",
+    "Trade",
+    "TradeStream",
 ]
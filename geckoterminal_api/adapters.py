@@ -0,0 +1,80 @@
+import socket
+from typing import override
+
+from requests.adapters import HTTPAdapter
+from urllib3.poolmanager import ProxyManager
+
+
+def keepalive_socket_options(
+    idle: int, interval: int = 10, count: int = 5
+) -> list[tuple[int, int, int]]:
+    """Socket options enabling TCP keep-alive probes where the platform has them
+
+    Args:
+    ----
+        idle: Seconds a connection is idle before the first probe
+        interval: Seconds between probes
+        count: Unanswered probes after which the connection is dropped
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Linux and Windows name the idle time TCP_KEEPIDLE, macOS TCP_KEEPALIVE
+    idle_name = "TCP_KEEPIDLE" if hasattr(socket, "TCP_KEEPIDLE") else "TCP_KEEPALIVE"
+    for name, value in (
+        (idle_name, idle),
+        ("TCP_KEEPINTVL", interval),
+        ("TCP_KEEPCNT", count),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class SocketOptionsAdapter(HTTPAdapter):
+    """`HTTPAdapter` setting extra socket options on every new connection"""
+
+    __attrs__ = [*HTTPAdapter.__attrs__, "socket_options"]  # noqa: RUF012
+
+    def __init__(
+        self,
+        socket_options: list[tuple[int, int, int]],
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+    ) -> None:
+        """
+        Args:
+        ----
+            socket_options: (level, option, value) triples passed to `setsockopt`
+            pool_connections: Number of hosts to keep connection pools for
+            pool_maxsize: Connections kept open per host
+            pool_block: Wait for a free connection when all `pool_maxsize` are in
+                use instead of opening one that is discarded after the request
+        """
+        # Set before HTTPAdapter.__init__, which creates the pool manager. Keeps
+        # urllib3's default of disabling Nagle's algorithm
+        self.socket_options = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            *socket_options,
+        ]
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    @override
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = False,
+        **pool_kwargs: object,
+    ) -> None:
+        pool_kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+    @override
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: object) -> ProxyManager:
+        proxy_kwargs["socket_options"] = self.socket_options
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
@@ -1,9 +1,23 @@
+import contextlib
+import contextvars
 import datetime
 import json
+import threading
+import time
+import weakref
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import TYPE_CHECKING, TypeVar
 
 import requests
 
+from .adapters import SocketOptionsAdapter, keepalive_socket_options
+from .cache import ResponseCache, request_key
+from .coalesce import SingleFlight
+from .decoding import JSONLoads, get_json_loads
 from .exceptions import GeckoTerminalAPIError
+from .jsonapi import merge_responses
 from .limits import (
     CURRENCIES,
     DAY_AGGREGATES,
@@ -19,20 +33,100 @@ from .limits import (
     TOKEN_INFO_INCLUDES,
     TOKENS,
 )
+from .models import to_models
+from .ohlcv import (
+    backfill_windows,
+    fill_gaps,
+    find_gaps,
+    merge_ohlcv_responses,
+    repair_windows,
+)
+from .pagination import iter_pages
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .store import OHLCVStore
 from .validation import validate
 
+if TYPE_CHECKING:
+    from .engine import AsyncEngine
+
+T = TypeVar("T")
+
+Timeout = float | tuple[float, float] | None
+
 
 class GeckoTerminalAPI:
-    """RESTful Python client for GeckoTerminal API."""
+    """RESTful Python client for GeckoTerminal API.
+
+    A client can be shared between threads. Requests go through one
+    `requests.Session` whose connection pool holds `pool_maxsize` connections per
+    host; with more threads than that, extra connections are opened and discarded
+    after use, or with `pool_block` threads wait for a free one. The rate limiter,
+    cache and request coalescing are thread-safe. With `session_per_thread` every
+    thread gets its own session and pool instead, e.g. when the session is
+    customized in ways that are not thread-safe.
+    """
 
     def __init__(
-        self, api_version: str | None = None, proxies: dict[str, str] | None = None
+        self,
+        api_version: str | None = None,
+        proxies: dict[str, str] | None = None,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        max_concurrency: int = 4,
+        engine: "AsyncEngine | None" = None,
+        pool_connections: int = 10,
+        pool_maxsize: int | None = None,
+        pool_block: bool = False,
+        timeout: Timeout = 30,
+        tcp_keepalive: int | None = None,
+        session_per_thread: bool = False,
+        json_loads: JSONLoads | None = None,
+        models: bool = False,
     ) -> None:
         """
         Args:
         ----
             api_version: GeckoTerminal API version, if None latest will be used
             proxies: Proxies to use for the requests
+            rate_limiter: Token-bucket limiter used to pace outgoing requests, if
+                None requests are sent immediately
+            retry_policy: Policy for retrying rate limited and transient server
+                errors with backoff, if None errors are raised immediately
+            cache: In-memory response cache with per-endpoint TTLs, if None every
+                call is sent to the API
+            coalesce_requests: Share one in-flight request between threads making
+                identical calls, callers receive the same result object
+            max_concurrency: Maximum number of requests a single call may run in
+                parallel, e.g. when fetching more than `MAX_ADDRESSES` addresses or
+                in `batch()`. The connection pool is sized to keep this many
+                connections open for reuse
+            engine: Background event loop whose `AsyncGeckoTerminalAPI` sends the
+                requests instead of this client's session. Its rate limiter, retry
+                policy, cache and coalescing apply, those of this client are unused
+            pool_connections: Number of hosts to keep connection pools for
+                (default 10)
+            pool_maxsize: Connections kept open for reuse, if None the larger of 10
+                and `max_concurrency`. Size it to the number of threads sharing
+                the client
+            pool_block: Wait for a free connection when all `pool_maxsize` are in
+                use, instead of opening one that is discarded after the request
+                (default False)
+            timeout: Default request timeout in seconds, or (connect, read)
+                timeouts, None to wait forever (default 30), see `request_timeout()`
+            tcp_keepalive: Seconds an idle connection waits before sending TCP
+                keep-alive probes, if None keep-alive probes are not enabled
+            session_per_thread: Give every thread its own session and connection
+                pool instead of sharing one (default False)
+            json_loads: Function decoding a raw response body, if None orjson or
+                msgspec when installed, otherwise the stdlib `json` module, see
+                `get_json_loads()`
+            models: Return the `data` and `included` resources of responses as
+                typed models with lazily decoded attributes, see `Resource`
+                (default False)
         """
         self.base_url = "https://api.geckoterminal.com/api/v2"
         self.accept_header = (
@@ -40,13 +134,92 @@ class GeckoTerminalAPI:
             if api_version
             else "application/json"
         )
-        self._session = requests.Session()
-        if proxies:
-            self._session.proxies = proxies
+        self.proxies = proxies
+        self.pool_connections = pool_connections
+        # One pooled connection per worker thread, the default pool keeps 10
+        self.pool_maxsize = (
+            pool_maxsize if pool_maxsize is not None else max(10, max_concurrency)
+        )
+        self.pool_block = pool_block
+        self.timeout = timeout
+        self.tcp_keepalive = tcp_keepalive
+        self._thread_sessions = threading.local() if session_per_thread else None
+        # Weak, so sessions of finished threads can be garbage collected
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
+        self._session = self._new_session()
+        # Per client, so an override never leaks into other clients
+        self._request_timeout: contextvars.ContextVar[Timeout] = contextvars.ContextVar(
+            "geckoterminal_request_timeout", default=None
+        )
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self.max_concurrency = max_concurrency
+        self.engine = engine
+        self.json_loads = json_loads or get_json_loads()
+        self.models = models
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = SocketOptionsAdapter(
+            keepalive_socket_options(self.tcp_keepalive)
+            if self.tcp_keepalive is not None
+            else [],
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if self.proxies:
+            session.proxies = self.proxies
+        with self._sessions_lock:
+            self._sessions.add(session)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """Session used by the calling thread"""
+        if self._thread_sessions is None:
+            return self._session
+        session = getattr(self._thread_sessions, "session", None)
+        if session is None:
+            session = self._thread_sessions.session = self._new_session()
+        return session
+
+    def request_timeout(
+        self, timeout: float | tuple[float, float]
+    ) -> contextlib.AbstractContextManager[None]:
+        """Context manager overriding the timeout of requests made inside it
+
+        Applies to requests this client makes from the current thread, other clients
+        are not affected. Calls fanned out to worker threads (e.g. `batch()`) use
+        the client's default timeout. It has no effect with an `engine`, whose
+        async client applies its own timeout.
+
+        ```python
+        with gt.request_timeout(5):
+            gt.network_pool_address("eth", "0x60594a405d53811d3bc4766596efd80fd545a270")
+        ```
+        """
+        return _timeout_context(self._request_timeout, timeout)
+
+    def close(self) -> None:
+        """Close the sessions and their pooled connections"""
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
 
     def _get(self, endpoint: str, params: dict | None = None) -> dict:
         """Private method to send a GET request to the specified endpoint.
 
+        Responses are served from and stored in the response cache, if enabled.
+        Concurrent identical requests share one in-flight call if coalescing is
+        enabled. With an engine the request is sent by its async client.
+
         Args:
         ----
             endpoint (str): The API endpoint to send the request to.
@@ -62,34 +235,161 @@ class GeckoTerminalAPI:
             GeckoTerminalAPIError: If the API response status code is not 200, it raises
                 an exception with the status code and error message.
         """
-        response = self._session.get(
-            url=self.base_url + endpoint,
-            params=params,
-            headers={"accept": self.accept_header},
-            timeout=30,
-        )
+        if self.engine is not None:
+            return self._as_models(self.engine.get(endpoint, params))
+        key = request_key(endpoint, params)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        if self._single_flight is not None:
+            return self._single_flight.do(
+                key, lambda: self._fetch(key, endpoint, params)
+            )
+        return self._fetch(key, endpoint, params)
 
-        match response.status_code:
-            case 200:
-                return response.json()
-            case 404:
-                errors = ",".join(
-                    r["title"] for r in json.loads(response.text)["errors"]
-                )
-                raise GeckoTerminalAPIError(
-                    status=response.status_code,
-                    err=errors,
-                )
-            case 429:
-                raise GeckoTerminalAPIError(
-                    status=response.status_code,
-                    err="Rate Limited",
-                )
-            case _:
-                raise GeckoTerminalAPIError(
-                    status=response.status_code,
-                    err=response.text,
+    def _fetch(self, key: str, endpoint: str, params: dict | None) -> dict:
+        """Request and decode a response, storing it in the cache if enabled"""
+        body = self._request(endpoint, params)
+        data = self._as_models(self.json_loads(body))
+        if self.cache is not None:
+            self.cache.set(key, endpoint, data, len(body))
+        return data
+
+    def _as_models(self, response: dict) -> dict:
+        """Convert the resources of a response to models, if enabled"""
+        return to_models(response) if self.models else response
+
+    def _get_chunked(
+        self, addresses: list[str], fetch: Callable[[list[str]], dict]
+    ) -> dict:
+        """Fetch `addresses` in `MAX_ADDRESSES` chunks on a thread pool and merge"""
+        chunks = [
+            addresses[i : i + MAX_ADDRESSES]
+            for i in range(0, len(addresses), MAX_ADDRESSES)
+        ]
+        if len(chunks) <= 1:
+            return fetch(addresses)
+        return merge_responses(self._map_concurrent(fetch, chunks))
+
+    def _map_concurrent(self, func: Callable[[T], dict], items: list[T]) -> list[dict]:
+        """Call `func` on each item on a thread pool of `max_concurrency` workers"""
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_concurrency, len(items)))
+        ) as executor:
+            return list(executor.map(func, items))
+
+    def _iter_resources(
+        self, fetch: Callable[..., dict], lookahead: int
+    ) -> Iterator[dict]:
+        for page in iter_pages(fetch, lookahead=lookahead):
+            yield from page["data"]
+
+    def _request(self, endpoint: str, params: dict | None = None) -> bytes:
+        """Send a GET request, with rate limiting and retries, and return the body"""
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            timeout = self._request_timeout.get()
+            response = self.session.get(
+                url=self.base_url + endpoint,
+                params=params,
+                headers={"accept": self.accept_header},
+                timeout=timeout if timeout is not None else self.timeout,
+            )
+            if self.retry_policy and self.retry_policy.should_retry(
+                response.status_code, attempt
+            ):
+                time.sleep(
+                    self.retry_policy.delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
                 )
+                continue
+
+            match response.status_code:
+                case 200:
+                    return response.content
+                case 404:
+                    errors = ",".join(
+                        r["title"] for r in json.loads(response.text)["errors"]
+                    )
+                    raise GeckoTerminalAPIError(
+                        status=response.status_code,
+                        err=errors,
+                    )
+                case 429:
+                    raise GeckoTerminalAPIError(
+                        status=response.status_code,
+                        err="Rate Limited",
+                    )
+                case _:
+                    raise GeckoTerminalAPIError(
+                        status=response.status_code,
+                        err=response.text,
+                    )
+
+    def _call(self, call: tuple[str, dict]) -> dict:
+        name, kwargs = call
+        method: Callable[..., dict] | None = (
+            None if name.startswith("_") else getattr(self, name, None)
+        )
+        if not callable(method) or name in {"batch", "batch_as_completed"}:
+            msg = f"{name} is not an API method"
+            raise ValueError(msg)
+        return method(**kwargs)
+
+    def batch(self, calls: list[tuple[str, dict]]) -> list[dict | Exception]:
+        """Run many API calls concurrently on `max_concurrency` threads
+
+        Args:
+        ----
+            calls: (method name, keyword arguments) pairs e.g.
+                [("network_pool_address", {"network": "eth", "address": "0x..."})]
+
+        Returns:
+        -------
+            list[dict | Exception]: Result of each call in the order of `calls`, or
+                the exception it raised
+        """
+        results: list[dict | Exception] = [{} for _ in calls]
+        for index, result in self.batch_as_completed(calls):
+            results[index] = result
+        return results
+
+    def batch_as_completed(
+        self, calls: list[tuple[str, dict]]
+    ) -> Iterator[tuple[int, dict | Exception]]:
+        """Run many API calls concurrently, yielding results as they complete
+
+        Calls that have not started are cancelled when the generator is closed.
+
+        Args:
+        ----
+            calls: (method name, keyword arguments) pairs, see `batch()`
+
+        Returns:
+        -------
+            Iterator[tuple[int, dict | Exception]]: (index in `calls`, result or
+                the exception the call raised) pairs in completion order
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_concurrency, len(calls)))
+        )
+        try:
+            futures = {
+                executor.submit(self._call, call): index
+                for index, call in enumerate(calls)
+            }
+            for future in as_completed(futures):
+                exception = future.exception()
+                if exception is not None and not isinstance(exception, Exception):
+                    raise exception
+                yield futures[future], exception or future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def networks(self, page: int = 1) -> dict:
         """Get list of supported networks
@@ -172,7 +472,7 @@ class GeckoTerminalAPI:
             },
         )
 
-    @validate(max_addresses=MAX_ADDRESSES, include_list=NETWORK_POOL_INCLUDES)
+    @validate(include_list=NETWORK_POOL_INCLUDES)
     def network_pools_multi_address(
         self, network: str, addresses: list[str], include: list | None = None
     ) -> dict:
@@ -181,7 +481,8 @@ class GeckoTerminalAPI:
         Args:
         ----
             network: Network id from `networks()` e.g. eth, solana, arbitrum
-            addresses: List of pool addresses
+            addresses: List of pool addresses, more than `MAX_ADDRESSES` are fetched
+                in chunks and merged into one response
                 e.g. ["0x60594a405d53811d3bc4766596efd80fd545a270",
                 "0x88e6a0c2ddd26feeb64f039a2c41296fcb3f5640"]
             include: List of related resources to include in response. Available
@@ -189,11 +490,14 @@ class GeckoTerminalAPI:
         """
         if include is None:
             include = ["base_token", "quote_token", "dex"]
-        return self._get(
-            endpoint=f"/networks/{network}/pools/multi/{','.join(addresses)}",
-            params={
-                "include": ",".join(include),
-            },
+        return self._get_chunked(
+            addresses,
+            lambda chunk: self._get(
+                endpoint=f"/networks/{network}/pools/multi/{','.join(chunk)}",
+                params={
+                    "include": ",".join(include),
+                },
+            ),
         )
 
     @validate(max_page=MAX_PAGE, include_list=NETWORK_POOL_INCLUDES)
@@ -306,19 +610,22 @@ class GeckoTerminalAPI:
             },
         )
 
-    @validate(max_addresses=MAX_ADDRESSES)
     def network_addresses_token_price(self, network: str, addresses: list[str]) -> dict:
         """Get current USD prices of multiple tokens on a network
 
         Args:
         ----
             network: Network id from `networks()` e.g. eth, solana, arbitrum
-            addresses: List of token addresses
+            addresses: List of token addresses, more than `MAX_ADDRESSES` are fetched
+                in chunks and merged into one response
                 e.g. ["0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
                 "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"]
         """
-        return self._get(
-            endpoint=f"/simple/networks/{network}/token_price/{','.join(addresses)}",
+        return self._get_chunked(
+            addresses,
+            lambda chunk: self._get(
+                endpoint=f"/simple/networks/{network}/token_price/{','.join(chunk)}",
+            ),
         )
 
     @validate(max_page=MAX_PAGE, include_list=NETWORK_POOL_INCLUDES)
@@ -367,7 +674,7 @@ class GeckoTerminalAPI:
             params={"include": ",".join(include)},
         )
 
-    @validate(max_addresses=MAX_ADDRESSES, include_list=TOKEN_INCLUDES)
+    @validate(include_list=TOKEN_INCLUDES)
     def network_tokens_multi_address(
         self, network: str, addresses: list[str], include: list | None = None
     ) -> dict:
@@ -376,7 +683,8 @@ class GeckoTerminalAPI:
         Args:
         ----
             network: Network id from `networks()` e.g. eth, solana, arbitrum
-            addresses: List of token addresses
+            addresses: List of token addresses, more than `MAX_ADDRESSES` are fetched
+                in chunks and merged into one response
                 e.g. ["0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",
                 "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"]
             include: List of related resources to include in response. Available
@@ -384,9 +692,12 @@ class GeckoTerminalAPI:
         """
         if include is None:
             include = TOKEN_INCLUDES
-        return self._get(
-            endpoint=f"/networks/{network}/tokens/multi/{','.join(addresses)}",
-            params={"include": ",".join(include)},
+        return self._get_chunked(
+            addresses,
+            lambda chunk: self._get(
+                endpoint=f"/networks/{network}/tokens/multi/{','.join(chunk)}",
+                params={"include": ",".join(include)},
+            ),
         )
 
     def network_tokens_address_info(self, network: str, address: str) -> dict:
@@ -478,6 +789,152 @@ class GeckoTerminalAPI:
             params=params,
         )
 
+    def network_pool_ohlcv_backfill(
+        self,
+        network: str,
+        pool_address: str,
+        timeframe: str,
+        *,
+        start: int,
+        end: int | None = None,
+        aggregate: int = 1,
+        currency: str = "usd",
+        token: str = "base",
+        store: OHLCVStore | None = None,
+    ) -> dict:
+        """Get OHLCV data of a pool over a time range of any length
+
+        The range is split into `before_timestamp` windows of up to `OHLCV_LIMIT`
+        candles which are fetched on a thread pool (at most `max_concurrency` at a time,
+        paced by the rate limiter if set). Boundary candles are de-duplicated.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            pool_address: Address of pool
+                e.g. 0x60594a405d53811d3bc4766596efd80fd545a270
+            timeframe: Timeframe of OHLCV data e.g. day, hour, minute
+            start: Start of the range (seconds since epoch)
+            end: End of the range (seconds since epoch), if None now
+            aggregate: Aggregate of OHLCV data e.g. day (1), hour ([1, 4, 12])
+                and minute ([1, 5, 15]) (default 1)
+            currency: Currency of OHLCV data e.g. usd, token (default usd)
+            token: Token of OHLCV data e.g. base, quote (default base)
+            store: On-disk candle store, stored candles are served locally and only
+                the missing sub-ranges are fetched and then stored
+
+        Returns:
+        -------
+            dict: A `network_pool_ohlcv()` response whose `ohlcv_list` holds every
+                candle in [start, end], newest first.
+        """
+        if end is None:
+            end = int(datetime.datetime.now(tz=datetime.UTC).timestamp())
+
+        def fetch(window: tuple[int, int]) -> dict:
+            return self.network_pool_ohlcv(
+                network=network,
+                pool_address=pool_address,
+                timeframe=timeframe,
+                aggregate=aggregate,
+                before_timestamp=window[0],
+                limit=window[1],
+                currency=currency,
+                token=token,
+            )
+
+        if store is None:
+            windows = backfill_windows(start, end, timeframe, aggregate)
+            return self._as_models(
+                merge_ohlcv_responses(self._map_concurrent(fetch, windows), start, end)
+            )
+
+        key = (network, pool_address, timeframe, aggregate, currency, token)
+        ranges = store.missing(key, start, end)
+        windows = [
+            window
+            for range_start, range_end in ranges
+            for window in backfill_windows(range_start, range_end, timeframe, aggregate)
+        ]
+        responses = self._map_concurrent(fetch, windows)
+        envelope = store.envelope(key) if not responses else None
+        if not responses and envelope is None:
+            # Fully stored, but without an envelope, e.g. the store predates them
+            responses = [fetch((end, 1))]
+        if responses:
+            store.put_envelope(key, responses[0])
+            fetched = merge_ohlcv_responses(responses)
+            store.put(key, fetched["data"]["attributes"]["ohlcv_list"], ranges)
+        stored = {"data": {"attributes": {"ohlcv_list": store.get(key, start, end)}}}
+        head = responses if envelope is None else [envelope]
+        return self._as_models(merge_ohlcv_responses([*head, stored], start, end))
+
+    def network_pool_ohlcv_repair(
+        self,
+        network: str,
+        pool_address: str,
+        timeframe: str,
+        response: dict,
+        *,
+        start: int | None = None,
+        end: int | None = None,
+        aggregate: int = 1,
+        currency: str = "usd",
+        token: str = "base",
+        fill: bool = False,
+    ) -> dict:
+        """Re-fetch the missing candles of an OHLCV series
+
+        Gaps found by `find_gaps()` are re-fetched, gaps close to each other share
+        one request window (see `repair_windows()`). Gaps still missing afterwards
+        are periods without trades and with `fill` they are filled forward by
+        `fill_gaps()`, which leaves the series evenly spaced.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            pool_address: Address of pool
+                e.g. 0x60594a405d53811d3bc4766596efd80fd545a270
+            timeframe: Timeframe of OHLCV data e.g. day, hour, minute
+            response: Response of `network_pool_ohlcv()` or
+                `network_pool_ohlcv_backfill()` for the same pool and parameters
+            start: Earliest timestamp the series should cover, if None its first candle
+            end: Latest timestamp the series should cover, if None its last candle
+            aggregate: Aggregate of OHLCV data e.g. day (1), hour ([1, 4, 12])
+                and minute ([1, 5, 15]) (default 1)
+            currency: Currency of OHLCV data e.g. usd, token (default usd)
+            token: Token of OHLCV data e.g. base, quote (default base)
+            fill: Fill gaps that could not be re-fetched forward (default False)
+
+        Returns:
+        -------
+            dict: `response` with the repaired `ohlcv_list`, newest first
+        """
+        candles = response["data"]["attributes"]["ohlcv_list"]
+        gaps = find_gaps(candles, timeframe, aggregate, start, end)
+
+        def fetch(window: tuple[int, int]) -> dict:
+            return self.network_pool_ohlcv(
+                network=network,
+                pool_address=pool_address,
+                timeframe=timeframe,
+                aggregate=aggregate,
+                before_timestamp=window[0],
+                limit=window[1],
+                currency=currency,
+                token=token,
+            )
+
+        windows = repair_windows(gaps, timeframe, aggregate)
+        responses = self._map_concurrent(fetch, windows)
+        repaired = merge_ohlcv_responses([response, *responses], start, end)
+        if fill:
+            attributes = repaired["data"]["attributes"]
+            attributes["ohlcv_list"] = fill_gaps(
+                attributes["ohlcv_list"], timeframe, aggregate
+            )
+        return self._as_models(repaired)
+
     def network_pool_trades(
         self,
         network: str,
@@ -500,3 +957,203 @@ class GeckoTerminalAPI:
                 "trade_volume_in_usd_greater_than": trade_volume_in_usd_greater_than,
             },
         )
+
+    def iter_trending_pools(
+        self,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> Iterator[dict]:
+        """Iterate over trending pools across all networks, page by page
+
+        Pages are fetched up to `lookahead` pages ahead on a thread pool and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex, network (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(self.trending_pools, include=include), lookahead
+        )
+
+    def iter_network_trending_pools(
+        self,
+        network: str,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> Iterator[dict]:
+        """Iterate over trending pools on a network, page by page
+
+        Pages are fetched up to `lookahead` pages ahead on a thread pool and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(self.network_trending_pools, network=network, include=include),
+            lookahead,
+        )
+
+    def iter_network_pools(
+        self,
+        network: str,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> Iterator[dict]:
+        """Iterate over top pools on a network, page by page
+
+        Pages are fetched up to `lookahead` pages ahead on a thread pool and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(self.network_pools, network=network, include=include), lookahead
+        )
+
+    def iter_network_dex_pools(
+        self,
+        network: str,
+        dex: str,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> Iterator[dict]:
+        """Iterate over top pools on a network's dex, page by page
+
+        Pages are fetched up to `lookahead` pages ahead on a thread pool and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            dex: Dex id from `dexes()` e.g. sushiswap, raydium, uniswap_v3
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(self.network_dex_pools, network=network, dex=dex, include=include),
+            lookahead,
+        )
+
+    def iter_network_new_pools(
+        self,
+        network: str,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> Iterator[dict]:
+        """Iterate over new pools on a network, page by page
+
+        Pages are fetched up to `lookahead` pages ahead on a thread pool and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(self.network_new_pools, network=network, include=include), lookahead
+        )
+
+    def iter_new_pools(
+        self,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> Iterator[dict]:
+        """Iterate over new pools across all networks, page by page
+
+        Pages are fetched up to `lookahead` pages ahead on a thread pool and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex, network (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(partial(self.new_pools, include=include), lookahead)
+
+    def iter_search_network_pool(
+        self,
+        query: str,
+        network: str | None = None,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> Iterator[dict]:
+        """Iterate over pools matching a search query, page by page
+
+        Pages are fetched up to `lookahead` pages ahead on a thread pool and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            query: Search query: can be pool address, token address, or token symbol
+                e.g. "ETH"
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(
+                self.search_network_pool, query=query, network=network, include=include
+            ),
+            lookahead,
+        )
+
+    def iter_network_token_pools(
+        self,
+        network: str,
+        token_address: str,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> Iterator[dict]:
+        """Iterate over top pools for a token on a network, page by page
+
+        Pages are fetched up to `lookahead` pages ahead on a thread pool and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            token_address: Address of token
+                e.g. 0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(
+                self.network_token_pools,
+                network=network,
+                token_address=token_address,
+                include=include,
+            ),
+            lookahead,
+        )
+
+
+@contextlib.contextmanager
+def _timeout_context(
+    var: contextvars.ContextVar[Timeout], timeout: float | tuple[float, float]
+) -> Generator[None]:
+    token = var.set(timeout)
+    try:
+        yield
+    finally:
+        var.reset(token)
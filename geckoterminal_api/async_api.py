@@ -1,10 +1,20 @@
+import asyncio
+import contextlib
 import datetime
 import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import partial
+from typing import TypeVar
 
 import aiohttp
 from aiohttp import ClientSession
 
+from .batching import AsyncBatcher
+from .cache import ResponseCache, request_key
+from .coalesce import AsyncSingleFlight
+from .decoding import JSONLoads, get_json_loads
 from .exceptions import GeckoTerminalAPIError
+from .jsonapi import merge_responses, split_by_address
 from .limits import (
     CURRENCIES,
     DAY_AGGREGATES,
@@ -20,20 +30,93 @@ from .limits import (
     TOKEN_INFO_INCLUDES,
     TOKENS,
 )
+from .models import to_models
+from .ohlcv import (
+    backfill_windows,
+    fill_gaps,
+    find_gaps,
+    merge_ohlcv_responses,
+    repair_windows,
+)
+from .pagination import aiter_pages
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .scheduler import PriorityScheduler, request_priority
+from .store import OHLCVStore
 from .validation import validate
 
+T = TypeVar("T")
+
 
 class AsyncGeckoTerminalAPI:
     """Asynchronous RESTful Python client for GeckoTerminal API."""
 
     def __init__(
-        self, api_version: str | None = None, proxy: str | None = None
+        self,
+        api_version: str | None = None,
+        proxy: str | None = None,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        stale_while_revalidate: bool = False,
+        coalesce_requests: bool = False,
+        max_concurrency: int = 4,
+        batch_window: float | None = None,
+        scheduler: PriorityScheduler | None = None,
+        session: ClientSession | None = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: int | None = 10,
+        happy_eyeballs_delay: float | None = 0.25,
+        timeout: aiohttp.ClientTimeout | None = None,
+        json_loads: JSONLoads | None = None,
+        models: bool = False,
     ) -> None:
         """
         Args:
         ----
             api_version: GeckoTerminal API version, if None latest will be used
             proxy: Proxy to use for the requests
+            rate_limiter: Token-bucket limiter used to pace outgoing requests, if
+                None requests are sent immediately
+            retry_policy: Policy for retrying rate limited and transient server
+                errors with backoff, if None errors are raised immediately
+            cache: In-memory response cache with per-endpoint TTLs, if None every
+                call is sent to the API
+            stale_while_revalidate: Serve expired cache entries within their stale
+                window immediately and refresh them in a background task
+            coalesce_requests: Share one in-flight request between concurrent
+                identical calls, callers receive the same result object
+            max_concurrency: Maximum number of requests a single call may run
+                concurrently, e.g. when fetching more than `MAX_ADDRESSES` addresses
+            batch_window: If set, `network_pool_address()` and `network_token()`
+                calls made within this many seconds of each other are batched into
+                multi-address requests per network
+            scheduler: Admits requests by priority lane, see `priority()`, if None
+                requests are sent in the order they are made
+            session: Shared session to send requests with, it is not closed by
+                `close()`. If None the client creates its own session with a
+                connector configured by the options below
+            limit: Maximum number of open connections (default 100)
+            limit_per_host: Maximum number of open connections to the API host,
+                0 for no limit besides `limit` (default 0)
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+                (default 15)
+            ttl_dns_cache: Seconds resolved addresses are cached, None to cache
+                forever (default 10)
+            happy_eyeballs_delay: Seconds before trying the next address when
+                connecting (RFC 8305), None to try addresses one after another
+                (default 0.25)
+            timeout: Total, connect and read timeouts of a request, if None
+                aiohttp's default (5 minutes total, 30 seconds to connect)
+            json_loads: Function decoding a raw response body, if None orjson or
+                msgspec when installed, otherwise the stdlib `json` module, see
+                `get_json_loads()`
+            models: Return the `data` and `included` resources of responses as
+                typed models with lazily decoded attributes, see `Resource`
+                (default False)
         """
         self.base_url = "https://api.geckoterminal.com/api/v2"
         self.accept_header = (
@@ -42,16 +125,63 @@ class AsyncGeckoTerminalAPI:
             else "application/json"
         )
         self.proxy = proxy
-        self._session: None | ClientSession = None
+        self._session: None | ClientSession = session
+        self._owns_session = session is None
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.happy_eyeballs_delay = happy_eyeballs_delay
+        self.timeout = timeout
+        self.json_loads = json_loads or get_json_loads()
+        self.models = models
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.stale_while_revalidate = stale_while_revalidate
+        self._revalidating: dict[str, asyncio.Task] = {}
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self.max_concurrency = max_concurrency
+        self._batcher = (
+            AsyncBatcher(self._fetch_batch, window=batch_window)
+            if batch_window is not None
+            else None
+        )
+        self.scheduler = scheduler
+
+    @staticmethod
+    def priority(lane: str) -> contextlib.AbstractContextManager[None]:
+        """Context manager sending the requests made inside it in `lane`
+
+        With a `PriorityScheduler`, "interactive" requests are admitted before
+        "normal" ones (the default), and those before "bulk" ones. Tasks created
+        inside the block inherit the lane.
+
+        ```python
+        with client.priority("bulk"):
+            await client.network_pool_ohlcv_backfill(...)
+        ```
+        """
+        return request_priority(lane)
 
     async def close(self) -> None:
-        if self._session:
+        if self._batcher is not None:
+            self._batcher.close()
+        for task in self._revalidating.values():
+            task.cancel()
+        self._revalidating.clear()
+        if self._session and self._owns_session:
             await self._session.close()
-        self._session = None
+            self._session = None
 
     async def _get(self, endpoint: str, params: dict | None = None) -> dict:
         """Asynchronous method to send a GET request to the specified endpoint.
 
+        Responses are served from and stored in the response cache, if enabled. In
+        stale-while-revalidate mode an expired entry within its stale window is
+        returned as is, and a single background task refreshes it. Concurrent
+        identical requests share one in-flight call if coalescing is enabled.
+
         Args:
         ----
             endpoint (str): The API endpoint to send the request to.
@@ -67,35 +197,149 @@ class AsyncGeckoTerminalAPI:
             GeckoTerminalAPIError: If the API response status code is not 200, it raises
                 an exception with the status code and error message.
         """
+        key = request_key(endpoint, params)
+        if self.cache is not None:
+            if self.stale_while_revalidate:
+                cached, fresh = self.cache.lookup(key)
+                if cached is not None and not fresh:
+                    self._revalidate(key, endpoint, params)
+            else:
+                cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        if self._single_flight is not None:
+            return await self._single_flight.do(
+                key, lambda: self._fetch(key, endpoint, params)
+            )
+        return await self._fetch(key, endpoint, params)
+
+    async def _fetch(self, key: str, endpoint: str, params: dict | None) -> dict:
+        """Request and decode a response, storing it in the cache if enabled"""
+        body = await self._request(endpoint, params)
+        data = self._as_models(self.json_loads(body))
+        if self.cache is not None:
+            self.cache.set(key, endpoint, data, len(body))
+        return data
+
+    def _as_models(self, response: dict) -> dict:
+        """Convert the resources of a response to models, if enabled"""
+        return to_models(response) if self.models else response
+
+    async def _get_chunked(
+        self, addresses: list[str], fetch: Callable[[list[str]], Awaitable[dict]]
+    ) -> dict:
+        """Fetch `addresses` in `MAX_ADDRESSES` chunks concurrently and merge"""
+        chunks = [
+            addresses[i : i + MAX_ADDRESSES]
+            for i in range(0, len(addresses), MAX_ADDRESSES)
+        ]
+        if len(chunks) <= 1:
+            return await fetch(addresses)
+        return merge_responses(await self._map_concurrent(fetch, chunks))
+
+    async def _map_concurrent(
+        self, func: Callable[[T], Awaitable[dict]], items: list[T]
+    ) -> list[dict]:
+        """Await `func` on each item, at most `max_concurrency` at a time"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def call(item: T) -> dict:
+            async with semaphore:
+                return await func(item)
+
+        return await asyncio.gather(*(call(item) for item in items))
+
+    async def _fetch_batch(self, group: tuple, addresses: list[str]) -> dict:
+        """Resolve a batch of single pool or token lookups with one multi request"""
+        kind, network, include = group
+        fetch = (
+            self.network_pools_multi_address
+            if kind == "pools"
+            else self.network_tokens_multi_address
+        )
+        return split_by_address(
+            await fetch(network=network, addresses=addresses, include=list(include))
+        )
+
+    def _revalidate(self, key: str, endpoint: str, params: dict | None) -> None:
+        """Refresh a stale cache entry in the background, once per key"""
+        if self.cache is None or key in self._revalidating:
+            return
+        task = asyncio.create_task(self._fetch(key, endpoint, params))
+        self._revalidating[key] = task
+        task.add_done_callback(lambda t: self._revalidated(key, t))
+
+    def _revalidated(self, key: str, task: asyncio.Task) -> None:
+        # A failed refresh keeps serving the stale entry until its window ends
+        if self._revalidating.get(key) is task:
+            del self._revalidating[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _iter_resources(
+        self, fetch: Callable[..., Awaitable[dict]], lookahead: int
+    ) -> AsyncIterator[dict]:
+        async for page in aiter_pages(fetch, lookahead=lookahead):
+            for resource in page["data"]:
+                yield resource
+
+    async def _request(self, endpoint: str, params: dict | None = None) -> bytes:
+        """Send a GET request, with rate limiting and retries, and return the body"""
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=self.ttl_dns_cache,
+                    happy_eyeballs_delay=self.happy_eyeballs_delay,
+                ),
+                timeout=self.timeout,
+            )
         get_params = {
             "url": self.base_url + endpoint,
             "params": params,
             "headers": {"accept": self.accept_header},
             "proxy": self.proxy,
         }
-        async with self._session.get(**get_params) as response:  # pyright: ignore [reportArgumentType]
-            match response.status:
-                case 200:
-                    return await response.json()
-                case 404:
-                    errors = ",".join(
-                        r["title"] for r in json.loads(await response.text())["errors"]
-                    )
-                    raise GeckoTerminalAPIError(
-                        status=response.status,
-                        err=errors,
-                    )
-                case 429:
-                    raise GeckoTerminalAPIError(
-                        status=response.status,
-                        err="Rate Limited",
-                    )
-                case _:
-                    raise GeckoTerminalAPIError(
-                        status=response.status, err=await response.text()
-                    )
+        attempt = 0
+        while True:
+            attempt += 1
+            async with (
+                self.scheduler.slot()
+                if self.scheduler is not None
+                else contextlib.nullcontext()
+            ):
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async()
+                async with self._session.get(**get_params) as response:  # pyright: ignore [reportArgumentType]
+                    if not (
+                        self.retry_policy
+                        and self.retry_policy.should_retry(response.status, attempt)
+                    ):
+                        match response.status:
+                            case 200:
+                                return await response.read()
+                            case 404:
+                                errors = ",".join(
+                                    r["title"]
+                                    for r in json.loads(await response.text())["errors"]
+                                )
+                                raise GeckoTerminalAPIError(
+                                    status=response.status,
+                                    err=errors,
+                                )
+                            case 429:
+                                raise GeckoTerminalAPIError(
+                                    status=response.status,
+                                    err="Rate Limited",
+                                )
+                            case _:
+                                raise GeckoTerminalAPIError(
+                                    status=response.status, err=await response.text()
+                                )
+                    retry_after = response.headers.get("Retry-After")
+            await asyncio.sleep(self.retry_policy.delay(attempt, retry_after))
 
     async def networks(self, page: int = 1) -> dict:
         """Get list of supported networks
@@ -173,6 +417,8 @@ class AsyncGeckoTerminalAPI:
         """
         if include is None:
             include = NETWORK_POOL_INCLUDES
+        if self._batcher is not None:
+            return await self._batcher.load(("pools", network, tuple(include)), address)
         return await self._get(
             endpoint=f"/networks/{network}/pools/{address}",
             params={
@@ -180,7 +426,7 @@ class AsyncGeckoTerminalAPI:
             },
         )
 
-    @validate(max_addresses=MAX_ADDRESSES, include_list=NETWORK_POOL_INCLUDES)
+    @validate(include_list=NETWORK_POOL_INCLUDES)
     async def network_pools_multi_address(
         self, network: str, addresses: list[str], include: list | None = None
     ) -> dict:
@@ -189,7 +435,8 @@ class AsyncGeckoTerminalAPI:
         Args:
         ----
             network: Network id from `networks()` e.g. eth, solana, arbitrum
-            addresses: List of pool addresses
+            addresses: List of pool addresses, more than `MAX_ADDRESSES` are fetched
+                in chunks and merged into one response
                 e.g. ["0x60594a405d53811d3bc4766596efd80fd545a270",
                 "0x88e6a0c2ddd26feeb64f039a2c41296fcb3f5640"]
             include: List of related resources to include in response. Available
@@ -197,11 +444,14 @@ class AsyncGeckoTerminalAPI:
         """
         if include is None:
             include = NETWORK_POOL_INCLUDES
-        return await self._get(
-            endpoint=f"/networks/{network}/pools/multi/{','.join(addresses)}",
-            params={
-                "include": ",".join(include),
-            },
+        return await self._get_chunked(
+            addresses,
+            lambda chunk: self._get(
+                endpoint=f"/networks/{network}/pools/multi/{','.join(chunk)}",
+                params={
+                    "include": ",".join(include),
+                },
+            ),
         )
 
     @validate(max_page=MAX_PAGE, include_list=NETWORK_POOL_INCLUDES)
@@ -314,7 +564,6 @@ class AsyncGeckoTerminalAPI:
             },
         )
 
-    @validate(max_addresses=MAX_ADDRESSES)
     async def network_addresses_token_price(
         self, network: str, addresses: list[str]
     ) -> dict:
@@ -323,12 +572,16 @@ class AsyncGeckoTerminalAPI:
         Args:
         ----
             network: Network id from `networks()` e.g. eth, solana, arbitrum
-            addresses: List of token addresses
+            addresses: List of token addresses, more than `MAX_ADDRESSES` are fetched
+                in chunks and merged into one response
                 e.g. ["0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
                 "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"]
         """
-        return await self._get(
-            endpoint=f"/simple/networks/{network}/token_price/{','.join(addresses)}",
+        return await self._get_chunked(
+            addresses,
+            lambda chunk: self._get(
+                endpoint=f"/simple/networks/{network}/token_price/{','.join(chunk)}",
+            ),
         )
 
     @validate(max_page=MAX_PAGE, include_list=NETWORK_POOL_INCLUDES)
@@ -372,12 +625,16 @@ class AsyncGeckoTerminalAPI:
         """
         if include is None:
             include = TOKEN_INCLUDES
+        if self._batcher is not None:
+            return await self._batcher.load(
+                ("tokens", network, tuple(include)), address
+            )
         return await self._get(
             endpoint=f"/networks/{network}/tokens/{address}",
             params={"include": ",".join(include)},
         )
 
-    @validate(max_addresses=MAX_ADDRESSES, include_list=TOKEN_INCLUDES)
+    @validate(include_list=TOKEN_INCLUDES)
     async def network_tokens_multi_address(
         self, network: str, addresses: list[str], include: list | None = None
     ) -> dict:
@@ -386,7 +643,8 @@ class AsyncGeckoTerminalAPI:
         Args:
         ----
             network: Network id from `networks()` e.g. eth, solana, arbitrum
-            addresses: List of token addresses
+            addresses: List of token addresses, more than `MAX_ADDRESSES` are fetched
+                in chunks and merged into one response
                 e.g. ["0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",
                 "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"]
             include: List of related resources to include in response. Available
@@ -394,9 +652,12 @@ class AsyncGeckoTerminalAPI:
         """
         if include is None:
             include = TOKEN_INCLUDES
-        return await self._get(
-            endpoint=f"/networks/{network}/tokens/multi/{','.join(addresses)}",
-            params={"include": ",".join(include)},
+        return await self._get_chunked(
+            addresses,
+            lambda chunk: self._get(
+                endpoint=f"/networks/{network}/tokens/multi/{','.join(chunk)}",
+                params={"include": ",".join(include)},
+            ),
         )
 
     async def network_tokens_address_info(self, network: str, address: str) -> dict:
@@ -490,6 +751,164 @@ class AsyncGeckoTerminalAPI:
             params=params,
         )
 
+    async def network_pool_ohlcv_backfill(
+        self,
+        network: str,
+        pool_address: str,
+        timeframe: str,
+        *,
+        start: int,
+        end: int | None = None,
+        aggregate: int = 1,
+        currency: str = "usd",
+        token: str = "base",
+        store: OHLCVStore | None = None,
+    ) -> dict:
+        """Get OHLCV data of a pool over a time range of any length
+
+        The range is split into `before_timestamp` windows of up to `OHLCV_LIMIT`
+        candles which are fetched concurrently (at most `max_concurrency` at a time,
+        paced by the rate limiter if set). Boundary candles are de-duplicated.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            pool_address: Address of pool
+                e.g. 0x60594a405d53811d3bc4766596efd80fd545a270
+            timeframe: Timeframe of OHLCV data e.g. day, hour, minute
+            start: Start of the range (seconds since epoch)
+            end: End of the range (seconds since epoch), if None now
+            aggregate: Aggregate of OHLCV data e.g. day (1), hour ([1, 4, 12])
+                and minute ([1, 5, 15]) (default 1)
+            currency: Currency of OHLCV data e.g. usd, token (default usd)
+            token: Token of OHLCV data e.g. base, quote (default base)
+            store: On-disk candle store, stored candles are served locally and only
+                the missing sub-ranges are fetched and then stored
+
+        Returns:
+        -------
+            dict: A `network_pool_ohlcv()` response whose `ohlcv_list` holds every
+                candle in [start, end], newest first.
+        """
+        if end is None:
+            end = int(datetime.datetime.now(tz=datetime.UTC).timestamp())
+
+        def fetch(window: tuple[int, int]) -> Awaitable[dict]:
+            return self.network_pool_ohlcv(
+                network=network,
+                pool_address=pool_address,
+                timeframe=timeframe,
+                aggregate=aggregate,
+                before_timestamp=window[0],
+                limit=window[1],
+                currency=currency,
+                token=token,
+            )
+
+        if store is None:
+            windows = backfill_windows(start, end, timeframe, aggregate)
+            return self._as_models(
+                merge_ohlcv_responses(
+                    await self._map_concurrent(fetch, windows), start, end
+                )
+            )
+
+        key = (network, pool_address, timeframe, aggregate, currency, token)
+        ranges = await asyncio.to_thread(store.missing, key, start, end)
+        windows = [
+            window
+            for range_start, range_end in ranges
+            for window in backfill_windows(range_start, range_end, timeframe, aggregate)
+        ]
+        responses = await self._map_concurrent(fetch, windows)
+        envelope = (
+            await asyncio.to_thread(store.envelope, key) if not responses else None
+        )
+        if not responses and envelope is None:
+            # Fully stored, but without an envelope, e.g. the store predates them
+            responses = [await fetch((end, 1))]
+        if responses:
+            await asyncio.to_thread(store.put_envelope, key, responses[0])
+            fetched = merge_ohlcv_responses(responses)
+            await asyncio.to_thread(
+                store.put, key, fetched["data"]["attributes"]["ohlcv_list"], ranges
+            )
+        stored = {
+            "data": {
+                "attributes": {
+                    "ohlcv_list": await asyncio.to_thread(store.get, key, start, end)
+                }
+            }
+        }
+        head = responses if envelope is None else [envelope]
+        return self._as_models(merge_ohlcv_responses([*head, stored], start, end))
+
+    async def network_pool_ohlcv_repair(
+        self,
+        network: str,
+        pool_address: str,
+        timeframe: str,
+        response: dict,
+        *,
+        start: int | None = None,
+        end: int | None = None,
+        aggregate: int = 1,
+        currency: str = "usd",
+        token: str = "base",
+        fill: bool = False,
+    ) -> dict:
+        """Re-fetch the missing candles of an OHLCV series
+
+        Gaps found by `find_gaps()` are re-fetched, gaps close to each other share
+        one request window (see `repair_windows()`). Gaps still missing afterwards
+        are periods without trades and with `fill` they are filled forward by
+        `fill_gaps()`, which leaves the series evenly spaced.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            pool_address: Address of pool
+                e.g. 0x60594a405d53811d3bc4766596efd80fd545a270
+            timeframe: Timeframe of OHLCV data e.g. day, hour, minute
+            response: Response of `network_pool_ohlcv()` or
+                `network_pool_ohlcv_backfill()` for the same pool and parameters
+            start: Earliest timestamp the series should cover, if None its first candle
+            end: Latest timestamp the series should cover, if None its last candle
+            aggregate: Aggregate of OHLCV data e.g. day (1), hour ([1, 4, 12])
+                and minute ([1, 5, 15]) (default 1)
+            currency: Currency of OHLCV data e.g. usd, token (default usd)
+            token: Token of OHLCV data e.g. base, quote (default base)
+            fill: Fill gaps that could not be re-fetched forward (default False)
+
+        Returns:
+        -------
+            dict: `response` with the repaired `ohlcv_list`, newest first
+        """
+        candles = response["data"]["attributes"]["ohlcv_list"]
+        gaps = find_gaps(candles, timeframe, aggregate, start, end)
+
+        def fetch(window: tuple[int, int]) -> Awaitable[dict]:
+            return self.network_pool_ohlcv(
+                network=network,
+                pool_address=pool_address,
+                timeframe=timeframe,
+                aggregate=aggregate,
+                before_timestamp=window[0],
+                limit=window[1],
+                currency=currency,
+                token=token,
+            )
+
+        windows = repair_windows(gaps, timeframe, aggregate)
+        responses = await self._map_concurrent(fetch, windows)
+        repaired = merge_ohlcv_responses([response, *responses], start, end)
+        if fill:
+            attributes = repaired["data"]["attributes"]
+            attributes["ohlcv_list"] = fill_gaps(
+                attributes["ohlcv_list"], timeframe, aggregate
+            )
+        return self._as_models(repaired)
+
     async def network_pool_trades(
         self,
         network: str,
@@ -512,3 +931,192 @@ class AsyncGeckoTerminalAPI:
                 "trade_volume_in_usd_greater_than": trade_volume_in_usd_greater_than,
             },
         )
+
+    def iter_trending_pools(
+        self,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> AsyncIterator[dict]:
+        """Iterate over trending pools across all networks, page by page
+
+        Pages are fetched up to `lookahead` pages ahead concurrently and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex, network (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(self.trending_pools, include=include), lookahead
+        )
+
+    def iter_network_trending_pools(
+        self,
+        network: str,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> AsyncIterator[dict]:
+        """Iterate over trending pools on a network, page by page
+
+        Pages are fetched up to `lookahead` pages ahead concurrently and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(self.network_trending_pools, network=network, include=include),
+            lookahead,
+        )
+
+    def iter_network_pools(
+        self,
+        network: str,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> AsyncIterator[dict]:
+        """Iterate over top pools on a network, page by page
+
+        Pages are fetched up to `lookahead` pages ahead concurrently and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(self.network_pools, network=network, include=include), lookahead
+        )
+
+    def iter_network_dex_pools(
+        self,
+        network: str,
+        dex: str,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> AsyncIterator[dict]:
+        """Iterate over top pools on a network's dex, page by page
+
+        Pages are fetched up to `lookahead` pages ahead concurrently and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            dex: Dex id from `dexes()` e.g. sushiswap, raydium, uniswap_v3
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(self.network_dex_pools, network=network, dex=dex, include=include),
+            lookahead,
+        )
+
+    def iter_network_new_pools(
+        self,
+        network: str,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> AsyncIterator[dict]:
+        """Iterate over new pools on a network, page by page
+
+        Pages are fetched up to `lookahead` pages ahead concurrently and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(self.network_new_pools, network=network, include=include), lookahead
+        )
+
+    def iter_new_pools(
+        self,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> AsyncIterator[dict]:
+        """Iterate over new pools across all networks, page by page
+
+        Pages are fetched up to `lookahead` pages ahead concurrently and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex, network (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(partial(self.new_pools, include=include), lookahead)
+
+    def iter_search_network_pool(
+        self,
+        query: str,
+        network: str | None = None,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> AsyncIterator[dict]:
+        """Iterate over pools matching a search query, page by page
+
+        Pages are fetched up to `lookahead` pages ahead concurrently and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            query: Search query: can be pool address, token address, or token symbol
+                e.g. "ETH"
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(
+                self.search_network_pool, query=query, network=network, include=include
+            ),
+            lookahead,
+        )
+
+    def iter_network_token_pools(
+        self,
+        network: str,
+        token_address: str,
+        include: list | None = None,
+        lookahead: int = 2,
+    ) -> AsyncIterator[dict]:
+        """Iterate over top pools for a token on a network, page by page
+
+        Pages are fetched up to `lookahead` pages ahead concurrently and the
+        resources in `data` are yielded one by one.
+
+        Args:
+        ----
+            network: Network id from `networks()` e.g. eth, solana, arbitrum
+            token_address: Address of token
+                e.g. 0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48
+            include: List of related resources to include in response. Available
+                resources are: base_token, quote_token, dex (default all)
+            lookahead: Number of pages to prefetch (default 2)
+        """
+        return self._iter_resources(
+            partial(
+                self.network_token_pools,
+                network=network,
+                token_address=token_address,
+                include=include,
+            ),
+            lookahead,
+        )
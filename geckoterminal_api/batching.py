@@ -0,0 +1,104 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from .exceptions import GeckoTerminalAPIError
+from .limits import MAX_ADDRESSES
+
+
+class AsyncBatcher:
+    """Collect single-address lookups and resolve them with multi-address requests.
+
+    Lookups for the same group (e.g. the same network) arriving within `window`
+    seconds are sent together as one batch of up to `max_batch` addresses, a full
+    batch is sent immediately. Each caller receives its own result, addresses missing
+    from the batch response raise a 404 `GeckoTerminalAPIError` like the single
+    lookup would.
+    """
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[tuple, list[str]], Awaitable[dict[str, dict]]],
+        window: float = 0.005,
+        max_batch: int = MAX_ADDRESSES,
+    ) -> None:
+        """
+        Args:
+        ----
+            fetch_batch: Coroutine function taking a group and a list of addresses,
+                returning a result per address found
+            window: Seconds to wait for more lookups before sending a batch
+            max_batch: Maximum number of addresses per batch
+        """
+        self.fetch_batch = fetch_batch
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[tuple, dict[str, asyncio.Future]] = {}
+        self._timers: dict[tuple, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, group: tuple, address: str) -> dict:
+        """Queue a lookup of `address` in `group` and wait for its result"""
+        loop = asyncio.get_running_loop()
+        pending = self._pending.setdefault(group, {})
+        future = pending.get(address)
+        if future is None:
+            future = pending[address] = loop.create_future()
+            if len(pending) >= self.max_batch:
+                self._flush(group)
+            elif group not in self._timers:
+                self._timers[group] = loop.call_later(self.window, self._flush, group)
+        return await asyncio.shield(future)
+
+    def _flush(self, group: tuple) -> None:
+        timer = self._timers.pop(group, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(group, {})
+        if batch:
+            task = asyncio.create_task(self._run(group, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(lambda _: _cancel_unresolved(batch))
+
+    async def _run(self, group: tuple, batch: dict[str, asyncio.Future]) -> None:
+        try:
+            results = await self.fetch_batch(group, list(batch))
+        except Exception as exc:  # noqa: BLE001
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        lowered = {address.lower(): result for address, result in results.items()}
+        for address, future in batch.items():
+            if future.done():
+                continue
+            result = results.get(address) or lowered.get(address.lower())
+            if result is None:
+                future.set_exception(
+                    GeckoTerminalAPIError(status=404, err=f"{address} not found")
+                )
+            else:
+                future.set_result(result)
+
+    def close(self) -> None:
+        """Cancel pending lookups and in-flight batches"""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        for batch in self._pending.values():
+            for future in batch.values():
+                future.cancel()
+        self._pending.clear()
+        for task in self._tasks:
+            task.cancel()
+
+
+def _cancel_unresolved(batch: dict[str, asyncio.Future]) -> None:
+    """Cancel the lookups of a batch whose task ended without resolving them
+
+    The task may be cancelled by `close()` before or while it runs, its callers
+    must not wait forever.
+    """
+    for future in batch.values():
+        if not future.done():
+            future.cancel()
@@ -0,0 +1,194 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+# Endpoint patterns (`*` matches one path segment) mapped to TTLs in seconds,
+# the first matching pattern wins and a TTL of 0 disables caching
+DEFAULT_TTLS: dict[str, float] = {
+    "/networks": 3600,
+    "/networks/*/dexes": 3600,
+    "/networks/*/pools/*/info": 3600,
+    "/networks/*/tokens/*/info": 3600,
+    "/networks/*/pools/*/trades": 0,
+    "/simple/networks/*/token_price/*": 10,
+}
+
+
+def request_key(endpoint: str, params: dict | None = None) -> str:
+    """Normalized cache key for a request, independent of parameter order"""
+    if not params:
+        return endpoint
+    query = sorted((k, str(v)) for k, v in params.items() if v is not None)
+    return f"{endpoint}?{urlencode(query)}"
+
+
+class _CacheEntry:
+    __slots__ = ("expires_at", "size", "stale_until", "value")
+
+    def __init__(
+        self, value: dict, size: int, expires_at: float, stale_until: float
+    ) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class ResponseCache:
+    """Thread-safe in-memory LRU cache for decoded API responses.
+
+    Entries expire after a per-endpoint TTL and the least recently used entries are
+    evicted once either `max_entries` or `max_bytes` (measured on the raw response
+    body) is exceeded. Cached responses are shared between callers and must not be
+    mutated.
+
+    Expired entries are kept for a further per-endpoint stale window, during which
+    `lookup()` still returns them flagged as stale. `AsyncGeckoTerminalAPI` uses
+    this for stale-while-revalidate, `get()` never returns stale entries.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        *,
+        default_ttl: float = 30.0,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        stale_ttls: dict[str, float] | None = None,
+        default_stale_ttl: float = 60.0,
+    ) -> None:
+        """
+        Args:
+        ----
+            ttls: Endpoint patterns mapped to TTLs in seconds, `*` matches a single
+                path segment e.g. {"/networks/*/pools/*/ohlcv/*": 60}. Patterns are
+                checked before `DEFAULT_TTLS`
+            default_ttl: TTL in seconds for endpoints without a matching pattern
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of the cached response bodies
+            stale_ttls: Endpoint patterns mapped to the time in seconds an expired
+                response may still be served while it is refreshed
+            default_stale_ttl: Stale window for endpoints without a matching pattern
+        """
+        self.default_ttl = default_ttl
+        self.default_stale_ttl = default_stale_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._ttls = [
+            (_compile_pattern(pattern), ttl)
+            for pattern, ttl in [*(ttls or {}).items(), *DEFAULT_TTLS.items()]
+        ]
+        self._stale_ttls = [
+            (_compile_pattern(pattern), ttl)
+            for pattern, ttl in (stale_ttls or {}).items()
+        ]
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """TTL in seconds that applies to `endpoint`"""
+        return _match(self._ttls, endpoint, self.default_ttl)
+
+    def stale_ttl_for(self, endpoint: str) -> float:
+        """Stale window in seconds that applies to `endpoint`"""
+        return _match(self._stale_ttls, endpoint, self.default_stale_ttl)
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached response for `key`, or None if missing or expired"""
+        return self._lookup(key, allow_stale=False)[0]
+
+    def lookup(self, key: str) -> tuple[dict | None, bool]:
+        """Return the cached response for `key` and whether it is still fresh
+
+        Entries past their stale window are dropped and reported as missing.
+        """
+        return self._lookup(key, allow_stale=True)
+
+    def _lookup(self, key: str, *, allow_stale: bool) -> tuple[dict | None, bool]:
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry is None or entry.stale_until <= now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if entry.expires_at <= now:
+                if not allow_stale:
+                    self.misses += 1
+                    return None, False
+                self.stale_hits += 1
+                return entry.value, False
+            self.hits += 1
+            return entry.value, True
+
+    def set(self, key: str, endpoint: str, value: dict, size: int) -> None:
+        """Cache `value` for `key` using the TTL of `endpoint`
+
+        Args:
+        ----
+            key: Cache key from `request_key()`
+            endpoint: Endpoint the response was fetched from
+            value: Decoded response
+            size: Size of the raw response body in bytes
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            expires_at = time.monotonic() + ttl
+            self._entries[key] = _CacheEntry(
+                value, size, expires_at, expires_at + self.stale_ttl_for(endpoint)
+            )
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries, counters are kept"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        """Snapshot of the cache size and hit/miss/eviction counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def _match(
+    rules: list[tuple[re.Pattern, float]], endpoint: str, default: float
+) -> float:
+    for pattern, ttl in rules:
+        if pattern.match(endpoint):
+            return ttl
+    return default
+
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    return re.compile(re.escape(pattern).replace(r"\*", "[^/]+") + "$")
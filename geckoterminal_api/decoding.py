@@ -0,0 +1,60 @@
+import importlib
+import json
+from collections.abc import Callable
+
+# Decodes a raw response body into the JSON:API document
+JSONLoads = Callable[[bytes], dict]
+
+
+def _orjson_loads() -> JSONLoads | None:
+    try:
+        orjson = importlib.import_module("orjson")
+    except ImportError:
+        return None
+    return orjson.loads
+
+
+def _msgspec_loads() -> JSONLoads | None:
+    try:
+        msgspec_json = importlib.import_module("msgspec.json")
+    except ImportError:
+        return None
+    return msgspec_json.Decoder().decode
+
+
+def stdlib_loads(body: bytes) -> dict:
+    """Decode with the stdlib `json` module, which accepts UTF-8 bytes directly"""
+    return json.loads(body)
+
+
+# Name to factory, in order of preference
+DECODERS: dict[str, Callable[[], JSONLoads | None]] = {
+    "orjson": _orjson_loads,
+    "msgspec": _msgspec_loads,
+    "json": lambda: stdlib_loads,
+}
+
+
+def get_json_loads(name: str | None = None) -> JSONLoads:
+    """Return a decoder for raw response bodies
+
+    Args:
+    ----
+        name: "orjson", "msgspec" or "json", if None the first one installed in
+            that order
+
+    Raises:
+    ------
+        ValueError: If `name` is unknown or not installed
+    """
+    if name is None:
+        for factory in DECODERS.values():
+            loads = factory()
+            if loads is not None:
+                return loads
+    factory = DECODERS.get(name or "json")
+    loads = factory() if factory is not None else None
+    if loads is None:
+        msg = f"JSON decoder {name} is not available, choose from {list(DECODERS)}"
+        raise ValueError(msg)
+    return loads
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+from collections.abc import Coroutine
+from types import TracebackType
+from typing import Self, TypeVar
+
+from .async_api import AsyncGeckoTerminalAPI
+
+T = TypeVar("T")
+
+
+class AsyncEngine:
+    """Run an `AsyncGeckoTerminalAPI` on an event loop in a background thread.
+
+    `GeckoTerminalAPI(engine=engine)` sends its requests to this loop, so every
+    thread using such clients shares the async client's connection pool, rate
+    limiter, cache, request coalescing and priority scheduler. Calls block the
+    calling thread only, many threads can wait on the loop at the same time.
+
+    ```python
+    with AsyncEngine(AsyncGeckoTerminalAPI(coalesce_requests=True)) as engine:
+        gt = GeckoTerminalAPI(engine=engine)
+        gt.network_pool_address("eth", "0x60594a405d53811d3bc4766596efd80fd545a270")
+    ```
+    """
+
+    def __init__(self, client: AsyncGeckoTerminalAPI | None = None) -> None:
+        """
+        Args:
+        ----
+            client: Async client that sends the requests, if None a default one
+        """
+        self.client = client if client is not None else AsyncGeckoTerminalAPI()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="geckoterminal-engine", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coroutine: Coroutine[object, object, T]) -> T:
+        """Run a coroutine on the engine's loop and wait for its result"""
+        if self.loop.is_closed():
+            coroutine.close()
+            msg = "AsyncEngine is closed"
+            raise RuntimeError(msg)
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def get(self, endpoint: str, params: dict | None = None) -> dict:
+        """Send a GET request through the async client, see `_get()`"""
+        return self.run(
+            self.client._get(endpoint, params)  # noqa: SLF001  # pyright: ignore [reportPrivateUsage]
+        )
+
+    def close(self) -> None:
+        """Close the async client and stop the loop"""
+        if self.loop.is_closed():
+            return
+        self.run(self.client.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,210 @@
+import asyncio
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from .cache import request_key
+
+if TYPE_CHECKING:
+    from .async_api import AsyncGeckoTerminalAPI
+
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce")
+
+
+class Subscription:
+    """Async iterator over the updates of one `PollingHub` topic.
+
+    Every update is the full response of the polled method. A poll that failed
+    delivers its exception instead, which is raised by the iteration; iterating
+    again waits for the next poll.
+    """
+
+    def __init__(
+        self, hub: "PollingHub", key: str, max_queue: int, overflow: str
+    ) -> None:
+        self.hub = hub
+        self.key = key
+        self.overflow = overflow
+        self.queue: asyncio.Queue[dict | Exception] = asyncio.Queue(max_queue)
+        self.dropped = 0
+
+    def push(self, update: dict | Exception) -> None:
+        """Queue an update, applying the overflow policy if the queue is full"""
+        if self.queue.full():
+            if self.overflow == "coalesce":
+                # Only the newest update matters, discard everything queued
+                self.dropped += self.queue.qsize()
+                while not self.queue.empty():
+                    self.queue.get_nowait()
+            else:
+                self.dropped += 1
+                self.queue.get_nowait()
+        self.queue.put_nowait(update)
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> dict:
+        update = await self.queue.get()
+        if isinstance(update, Exception):
+            raise update
+        return update
+
+    def close(self) -> None:
+        """Unsubscribe, the topic stops polling when its last subscriber leaves"""
+        self.hub.unsubscribe(self)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class _Topic:
+    __slots__ = ("interval", "kwargs", "last", "method", "subscribers", "task")
+
+    def __init__(self, method: str, kwargs: dict, interval: float) -> None:
+        self.method = method
+        self.kwargs = kwargs
+        self.interval = interval
+        self.subscribers: list[Subscription] = []
+        self.last: dict | Exception | None = None
+        self.task: asyncio.Task | None = None
+
+
+class PollingHub:
+    """Poll each unique request once and fan the responses out to subscribers.
+
+    A topic is a client method with its arguments e.g. the trades of one pool.
+    Subscribing to a topic that is already polled adds a queue to it instead of
+    another poll, so the number of requests depends on the number of topics, not
+    subscribers. A new subscriber immediately receives the last response.
+
+    Each subscriber has a bounded queue. When a slow consumer's queue is full the
+    oldest update is dropped (`overflow="drop_oldest"`), or all queued updates are
+    replaced by the newest one (`overflow="coalesce"`), which suits state like
+    prices where only the latest value matters. Polling never waits for consumers.
+
+    ```python
+    hub = PollingHub(client, interval=5)
+    async with hub.subscribe(
+        "network_pool_trades", network="eth", pool_address=pool_address
+    ) as trades:
+        async for response in trades:
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncGeckoTerminalAPI",
+        *,
+        interval: float = 5.0,
+        max_queue: int = 100,
+        overflow: str = "drop_oldest",
+    ) -> None:
+        """
+        Args:
+        ----
+            client: Client used for polling
+            interval: Default seconds between polls of a topic
+            max_queue: Default number of updates buffered per subscriber
+            overflow: Default policy for full queues, "drop_oldest" or "coalesce"
+        """
+        self.client = client
+        self.interval = interval
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self._topics: dict[str, _Topic] = {}
+
+    def subscribe(
+        self,
+        method: str,
+        /,
+        *,
+        interval: float | None = None,
+        max_queue: int | None = None,
+        overflow: str | None = None,
+        **kwargs: object,
+    ) -> Subscription:
+        """Subscribe to the responses of a client method
+
+        Args:
+        ----
+            method: Name of an `AsyncGeckoTerminalAPI` method e.g.
+                network_pool_trades, network_addresses_token_price, network_pool_ohlcv
+            interval: Seconds between polls, the shortest interval requested by
+                the subscribers of a topic is used (default the hub's)
+            max_queue: Updates buffered for this subscriber (default the hub's)
+            overflow: "drop_oldest" or "coalesce" (default the hub's)
+            **kwargs: Keyword arguments of the method
+
+        Returns:
+        -------
+            Subscription: Async iterator over the responses
+        """
+        if not callable(getattr(self.client, method, None)) or method.startswith("_"):
+            msg = f"{method} is not a client method"
+            raise ValueError(msg)
+        overflow = overflow or self.overflow
+        if overflow not in OVERFLOW_POLICIES:
+            msg = f"overflow must be one of {OVERFLOW_POLICIES}"
+            raise ValueError(msg)
+        interval = self.interval if interval is None else interval
+        key = request_key(method, kwargs)
+        topic = self._topics.get(key)
+        if topic is None:
+            topic = self._topics[key] = _Topic(method, kwargs, interval)
+        topic.interval = min(topic.interval, interval)
+        subscription = Subscription(self, key, max_queue or self.max_queue, overflow)
+        topic.subscribers.append(subscription)
+        if topic.last is not None:
+            subscription.push(topic.last)
+        if topic.task is None:
+            topic.task = asyncio.create_task(self._poll(topic))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber, stopping the topic's poll if it was the last one"""
+        topic = self._topics.get(subscription.key)
+        if topic is None or subscription not in topic.subscribers:
+            return
+        topic.subscribers.remove(subscription)
+        if not topic.subscribers:
+            del self._topics[subscription.key]
+            if topic.task is not None:
+                topic.task.cancel()
+
+    async def _poll(self, topic: _Topic) -> None:
+        method = getattr(self.client, topic.method)
+        while True:
+            try:
+                update = await method(**topic.kwargs)
+            except Exception as exc:  # noqa: BLE001
+                update = exc
+            topic.last = update
+            for subscription in topic.subscribers:
+                subscription.push(update)
+            await asyncio.sleep(topic.interval)
+
+    @property
+    def stats(self) -> dict:
+        """Topics polled, subscribers and updates dropped for slow subscribers"""
+        subscriptions = [s for t in self._topics.values() for s in t.subscribers]
+        return {
+            "topics": len(self._topics),
+            "subscribers": len(subscriptions),
+            "dropped": sum(s.dropped for s in subscriptions),
+        }
+
+    def close(self) -> None:
+        """Stop all polls"""
+        for topic in self._topics.values():
+            if topic.task is not None:
+                topic.task.cancel()
+        self._topics.clear()
@@ -0,0 +1,185 @@
+from collections.abc import Iterable, Mapping
+
+from .limits import POOL_INCLUDES
+from .models import Resource
+
+
+def merge_responses(responses: list[dict]) -> dict:
+    """Merge JSON:API responses for chunks or pages of the same request
+
+    `data` lists are concatenated in order. Object `data` (e.g. simple token prices)
+    is merged attribute by attribute, with nested dictionaries combined. `included`
+    resources are de-duplicated by (type, id). Any other top-level members are taken
+    from the first response.
+
+    Args:
+    ----
+        responses: Responses to merge, in order
+    """
+    if not responses:
+        return {"data": []}
+    merged = dict(responses[0])
+    if isinstance(merged.get("data"), list):
+        merged["data"] = [item for r in responses for item in r.get("data") or []]
+    elif isinstance(merged.get("data"), dict):
+        merged["data"] = _merge_resource(
+            [r["data"] for r in responses if r.get("data")]
+        )
+
+    if any("included" in r for r in responses):
+        seen = set()
+        included = []
+        for r in responses:
+            for resource in r.get("included") or []:
+                key = (resource.get("type"), resource.get("id"))
+                if key not in seen:
+                    seen.add(key)
+                    included.append(resource)
+        merged["included"] = included
+    return merged
+
+
+def _merge_resource(resources: list[dict]) -> dict:
+    merged = dict(resources[0])
+    attributes = dict(merged.get("attributes") or {})
+    for resource in resources[1:]:
+        for name, value in (resource.get("attributes") or {}).items():
+            if isinstance(value, dict) and isinstance(attributes.get(name), dict):
+                attributes[name] = {**attributes[name], **value}
+            else:
+                attributes.setdefault(name, value)
+    merged["attributes"] = attributes
+    return merged
+
+
+def split_by_address(response: dict) -> dict[str, dict]:
+    """Split a multi-resource response into single-resource responses by address
+
+    Each resulting response holds one resource from `data` and only the `included`
+    resources referenced by its relationships, matching the shape of the
+    single-address endpoints.
+
+    Args:
+    ----
+        response: Response with a list of resources that have an `address` attribute
+    """
+    included = index_included(response)
+    documents = {}
+    for resource in response.get("data") or []:
+        address = (resource.get("attributes") or {}).get("address")
+        if address is None:
+            continue
+        document = {"data": resource}
+        if "included" in response:
+            document["included"] = [
+                included[ref] for ref in _references(resource) if ref in included
+            ]
+        documents[address] = document
+    return documents
+
+
+def _references(resource: dict) -> list[tuple[str, str]]:
+    refs = []
+    for relationship in (resource.get("relationships") or {}).values():
+        linkage = relationship.get("data")
+        for item in linkage if isinstance(linkage, list) else [linkage]:
+            if item and (ref := (item.get("type"), item.get("id"))) not in refs:
+                refs.append(ref)
+    return refs
+
+
+def index_included(responses: dict | list[dict]) -> dict[tuple[str, str], Mapping]:
+    """Index the `included` resources of responses by (type, id)
+
+    Built in one pass, after which every relationship resolves with a dictionary
+    lookup instead of a scan of `included`. Several responses, e.g. the pages or
+    chunks of one request, share one index; a resource included more than once is
+    indexed once, like in `merge_responses()`.
+
+    Args:
+    ----
+        responses: A response, or responses to index together
+    """
+    if isinstance(responses, dict):
+        responses = [responses]
+    index: dict[tuple[str, str], Mapping] = {}
+    for response in responses:
+        for resource in response.get("included") or []:
+            index.setdefault((resource.get("type"), resource.get("id")), resource)
+    return index
+
+
+def resolve(
+    resource: Mapping, name: str, index: Mapping[tuple[str, str], Mapping]
+) -> Mapping | list[Mapping] | None:
+    """Resource(s) related to `resource` by the relationship `name`
+
+    Args:
+    ----
+        resource: Resource whose relationship is resolved
+        name: Relationship name e.g. base_token, quote_token, dex, network
+        index: Index from `index_included()`
+
+    Returns:
+    -------
+        The related resource, None if the relationship is empty or the resource
+        was not included. A list for to-many relationships, without the resources
+        that were not included.
+    """
+    linkage: tuple | list[tuple] | None
+    if isinstance(resource, Resource):
+        linkage = resource.relationship(name)
+    else:
+        linkage = ((resource.get("relationships") or {}).get(name) or {}).get("data")
+        if isinstance(linkage, dict):
+            linkage = (linkage.get("type"), linkage.get("id"))
+        elif isinstance(linkage, list):
+            linkage = [(item.get("type"), item.get("id")) for item in linkage]
+    if isinstance(linkage, list):
+        return [index[ref] for ref in linkage if ref in index]
+    return None if linkage is None else index.get(linkage)
+
+
+def hydrate(
+    responses: dict | list[dict], names: Iterable[str] = POOL_INCLUDES
+) -> list[Mapping]:
+    """`data` resources of responses with their related resources resolved
+
+    The `included` resources of all responses are indexed once with
+    `index_included()`, so the resources of one page or chunk may refer to those
+    included with another. Raw resources are returned as shallow copies with one
+    member per relationship name holding the related resource, or None. Models are
+    returned as copies resolving their relationship properties (e.g.
+    `Pool.base_token`) through the shared index, the models of the responses,
+    which may be cached, are left unchanged.
+
+    ```python
+    pages = [gt.trending_pools(include=POOL_INCLUDES, page=p) for p in (1, 2)]
+    for pool in hydrate(pages):
+        print(pool["attributes"]["name"], pool["dex"]["attributes"]["name"])
+    ```
+
+    Args:
+    ----
+        responses: A response, or the responses of the pages or chunks of a request
+        names: Relationships to resolve (default base_token, quote_token, dex and
+            network)
+    """
+    if isinstance(responses, dict):
+        responses = [responses]
+    index = index_included(responses)
+    names = list(names)
+    hydrated = []
+    for response in responses:
+        data = response.get("data") or []
+        for resource in data if isinstance(data, list) else [data]:
+            if isinstance(resource, Resource):
+                hydrated.append(resource.with_included(index))
+            else:
+                hydrated.append(
+                    {
+                        **resource,
+                        **{name: resolve(resource, name, index) for name in names},
+                    }
+                )
+    return hydrated
@@ -14,3 +14,9 @@ OHLCV_LIMIT = 1000
 
 CURRENCIES = ["usd", "token"]
 TOKENS = ["base", "quote"]
+
+# Public API rate limit (calls per minute)
+RATE_LIMIT = 30
+
+# Length of one OHLCV candle per timeframe (seconds)
+TIMEFRAME_SECONDS = {"day": 86400, "hour": 3600, "minute": 60}
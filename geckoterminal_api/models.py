@@ -0,0 +1,544 @@
+import copy
+import datetime
+from collections.abc import Callable, Iterator, Mapping
+from itertools import repeat
+from typing import Any, ClassVar, Self, TypeVar, cast, override
+
+from .ohlcv import OHLCVSeries
+
+T = TypeVar("T")
+
+# (type, id) of a related resource, a list for to-many relationships
+Linkage = tuple[str, str] | list[tuple[str, str]] | None
+
+_MISSING: Any = object()
+
+
+def _float_map(value: dict) -> dict[str, float | None]:
+    return {k: None if v is None else float(v) for k, v in value.items()}
+
+
+def _transactions(value: dict) -> dict[str, dict[str, int]]:
+    return value
+
+
+def _candles(value: list) -> list[list[float]]:
+    return value
+
+
+def _linkage(data: dict | list | None) -> Linkage:
+    if isinstance(data, dict):
+        return (data["type"], data["id"])
+    return None if data is None else [(item["type"], item["id"]) for item in data]
+
+
+class Resource(Mapping[str, object]):
+    """A JSON:API resource with typed attributes.
+
+    The attributes a model declares are kept as the raw JSON values in a tuple and
+    decoded on first access, e.g. numeric strings to floats and timestamps to
+    datetimes, then cached. Missing and null attributes are None.
+
+    A model is also a read-only mapping with the `id`, `type`, `attributes` and
+    `relationships` members of the resource, so code written against the raw
+    responses keeps working, and it compares equal to the raw resource.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_extra",
+        "_raw",
+        "_relationships",
+        "id",
+        "included",
+        "type",
+    )
+
+    # Attributes with a property, in storage order
+    _fields: ClassVar[tuple[str, ...]] = ()
+    _index: ClassVar[dict[str, int]] = {}
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._index = {name: i for i, name in enumerate(cls._fields)}
+
+    def __init__(self, resource: Mapping) -> None:
+        """
+        Args:
+        ----
+            resource: Raw resource from the `data` or `included` of a response
+        """
+        self.id: str = resource["id"]
+        self.type: str = resource["type"]
+        attributes: dict = resource.get("attributes") or {}
+        self._raw = tuple(map(attributes.get, self._fields, repeat(_MISSING)))
+        # Attributes the model does not declare
+        self._extra = (
+            {k: v for k, v in attributes.items() if k not in self._index}
+            if len(attributes) > len(self._raw) - self._raw.count(_MISSING)
+            else None
+        )
+        relationships: dict | None = resource.get("relationships")
+        # Relationships holding only linkage are kept as (type, id) pairs
+        self._relationships: dict[str, Linkage | dict] | None = (
+            {
+                name: _linkage(relationship["data"])
+                if len(relationship) == 1 and "data" in relationship
+                else relationship
+                for name, relationship in relationships.items()
+            }
+            if relationships is not None
+            else None
+        )
+        self._cache: list | None = None
+        # (type, id) index of the resources included with it, see `to_models()`
+        self.included: Mapping[tuple[str, str], Mapping] | None = None
+
+    def _decoded(self, name: str, decode: Callable[[Any], T]) -> T | None:
+        index = self._index[name]
+        if self._cache is None:
+            self._cache = [_MISSING] * len(self._raw)
+        value = self._cache[index]
+        if value is _MISSING:
+            raw = self._raw[index]
+            value = None if raw is None or raw is _MISSING else decode(raw)
+            self._cache[index] = value
+        return cast("T | None", value)
+
+    @property
+    def attributes(self) -> dict:
+        """Raw attributes of the resource"""
+        attributes = {
+            name: value
+            for name, value in zip(self._fields, self._raw, strict=True)
+            if value is not _MISSING
+        }
+        if self._extra:
+            attributes.update(self._extra)
+        return attributes
+
+    @property
+    def relationships(self) -> dict | None:
+        """Raw relationships of the resource"""
+        if self._relationships is None:
+            return None
+        return {
+            name: relationship
+            if isinstance(relationship, dict)
+            else {"data": _linkage_data(relationship)}
+            for name, relationship in self._relationships.items()
+        }
+
+    def relationship(self, name: str) -> Linkage:
+        """(type, id) of the resources related by `name`, None if there is none"""
+        if self._relationships is None:
+            return None
+        relationship = self._relationships.get(name)
+        if isinstance(relationship, dict):
+            return _linkage(relationship.get("data"))
+        return relationship
+
+    def related(self, name: str) -> Mapping | list[Mapping] | None:
+        """Resource(s) related by `name`, resolved in `included`
+
+        None if the relationship is empty or the related resource was not included
+        with the response, see `jsonapi.hydrate()` to resolve across responses.
+        """
+        linkage = self.relationship(name)
+        if linkage is None or self.included is None:
+            return None
+        if isinstance(linkage, list):
+            return [self.included[ref] for ref in linkage if ref in self.included]
+        return self.included.get(linkage)
+
+    def with_included(self, included: Mapping[tuple[str, str], Mapping]) -> Self:
+        """Copy resolving its relationships in `included`, attributes are shared"""
+        resource = copy.copy(self)
+        resource.included = included
+        return resource
+
+    @override
+    def __getitem__(self, key: str) -> object:
+        match key:
+            case "id":
+                return self.id
+            case "type":
+                return self.type
+            case "attributes":
+                return self.attributes
+            case "relationships" if self._relationships is not None:
+                return self.relationships
+            case _:
+                raise KeyError(key)
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        yield from ("id", "type", "attributes")
+        if self._relationships is not None:
+            yield "relationships"
+
+    @override
+    def __len__(self) -> int:
+        return 3 if self._relationships is None else 4
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r})"
+
+
+def _linkage_data(linkage: Linkage) -> dict | list | None:
+    if isinstance(linkage, list):
+        return [{"type": type_, "id": id_} for type_, id_ in linkage]
+    return None if linkage is None else {"type": linkage[0], "id": linkage[1]}
+
+
+class Network(Resource):
+    """Network resource, e.g. of `networks()`"""
+
+    __slots__ = ()
+    _fields = ("name", "coingecko_asset_platform_id")
+
+    @property
+    def name(self) -> str | None:
+        return self._decoded("name", str)
+
+    @property
+    def coingecko_asset_platform_id(self) -> str | None:
+        return self._decoded("coingecko_asset_platform_id", str)
+
+
+class Dex(Resource):
+    """DEX resource, e.g. of `network_dexes()`"""
+
+    __slots__ = ()
+    _fields = ("name",)
+
+    @property
+    def name(self) -> str | None:
+        return self._decoded("name", str)
+
+
+class Token(Resource):
+    """Token resource, e.g. of `network_token()`"""
+
+    __slots__ = ()
+    _fields = (
+        "address",
+        "name",
+        "symbol",
+        "decimals",
+        "image_url",
+        "coingecko_coin_id",
+        "total_supply",
+        "price_usd",
+        "fdv_usd",
+        "market_cap_usd",
+        "total_reserve_in_usd",
+        "volume_usd",
+    )
+
+    @property
+    def address(self) -> str | None:
+        return self._decoded("address", str)
+
+    @property
+    def name(self) -> str | None:
+        return self._decoded("name", str)
+
+    @property
+    def symbol(self) -> str | None:
+        return self._decoded("symbol", str)
+
+    @property
+    def decimals(self) -> int | None:
+        return self._decoded("decimals", int)
+
+    @property
+    def image_url(self) -> str | None:
+        return self._decoded("image_url", str)
+
+    @property
+    def coingecko_coin_id(self) -> str | None:
+        return self._decoded("coingecko_coin_id", str)
+
+    @property
+    def total_supply(self) -> float | None:
+        return self._decoded("total_supply", float)
+
+    @property
+    def price_usd(self) -> float | None:
+        return self._decoded("price_usd", float)
+
+    @property
+    def fdv_usd(self) -> float | None:
+        return self._decoded("fdv_usd", float)
+
+    @property
+    def market_cap_usd(self) -> float | None:
+        return self._decoded("market_cap_usd", float)
+
+    @property
+    def total_reserve_in_usd(self) -> float | None:
+        return self._decoded("total_reserve_in_usd", float)
+
+    @property
+    def volume_usd(self) -> dict[str, float | None] | None:
+        """USD volume by period, e.g. h24"""
+        return self._decoded("volume_usd", _float_map)
+
+
+class Pool(Resource):
+    """Pool resource, e.g. of `network_pools()`"""
+
+    __slots__ = ()
+    _fields = (
+        "address",
+        "name",
+        "pool_created_at",
+        "base_token_price_usd",
+        "base_token_price_native_currency",
+        "base_token_price_quote_token",
+        "quote_token_price_usd",
+        "quote_token_price_native_currency",
+        "quote_token_price_base_token",
+        "fdv_usd",
+        "market_cap_usd",
+        "reserve_in_usd",
+        "price_change_percentage",
+        "volume_usd",
+        "transactions",
+    )
+
+    @property
+    def address(self) -> str | None:
+        return self._decoded("address", str)
+
+    @property
+    def name(self) -> str | None:
+        return self._decoded("name", str)
+
+    @property
+    def pool_created_at(self) -> datetime.datetime | None:
+        return self._decoded("pool_created_at", datetime.datetime.fromisoformat)
+
+    @property
+    def base_token_price_usd(self) -> float | None:
+        return self._decoded("base_token_price_usd", float)
+
+    @property
+    def base_token_price_native_currency(self) -> float | None:
+        return self._decoded("base_token_price_native_currency", float)
+
+    @property
+    def base_token_price_quote_token(self) -> float | None:
+        return self._decoded("base_token_price_quote_token", float)
+
+    @property
+    def quote_token_price_usd(self) -> float | None:
+        return self._decoded("quote_token_price_usd", float)
+
+    @property
+    def quote_token_price_native_currency(self) -> float | None:
+        return self._decoded("quote_token_price_native_currency", float)
+
+    @property
+    def quote_token_price_base_token(self) -> float | None:
+        return self._decoded("quote_token_price_base_token", float)
+
+    @property
+    def fdv_usd(self) -> float | None:
+        return self._decoded("fdv_usd", float)
+
+    @property
+    def market_cap_usd(self) -> float | None:
+        return self._decoded("market_cap_usd", float)
+
+    @property
+    def reserve_in_usd(self) -> float | None:
+        return self._decoded("reserve_in_usd", float)
+
+    @property
+    def price_change_percentage(self) -> dict[str, float | None] | None:
+        """Price change in percent by period, e.g. m5, h1, h6, h24"""
+        return self._decoded("price_change_percentage", _float_map)
+
+    @property
+    def volume_usd(self) -> dict[str, float | None] | None:
+        """USD volume by period, e.g. m5, h1, h6, h24"""
+        return self._decoded("volume_usd", _float_map)
+
+    @property
+    def transactions(self) -> dict[str, dict[str, int]] | None:
+        """Buy and sell counts by period, e.g. {"h1": {"buys": 3, "sells": 1}}"""
+        return self._decoded("transactions", _transactions)
+
+    @property
+    def base_token(self) -> Token | None:
+        """Base token, once hydrated"""
+        token = self.related("base_token")
+        return token if isinstance(token, Token) else None
+
+    @property
+    def quote_token(self) -> Token | None:
+        """Quote token, once hydrated"""
+        token = self.related("quote_token")
+        return token if isinstance(token, Token) else None
+
+    @property
+    def dex(self) -> Dex | None:
+        """DEX of the pool, once hydrated"""
+        dex = self.related("dex")
+        return dex if isinstance(dex, Dex) else None
+
+    @property
+    def network(self) -> Network | None:
+        """Network of the pool, once hydrated"""
+        network = self.related("network")
+        return network if isinstance(network, Network) else None
+
+
+class Trade(Resource):
+    """Trade resource of `network_pool_trades()`"""
+
+    __slots__ = ()
+    _fields = (
+        "block_number",
+        "block_timestamp",
+        "tx_hash",
+        "tx_from_address",
+        "kind",
+        "from_token_address",
+        "to_token_address",
+        "from_token_amount",
+        "to_token_amount",
+        "price_from_in_currency_token",
+        "price_to_in_currency_token",
+        "price_from_in_usd",
+        "price_to_in_usd",
+        "volume_in_usd",
+    )
+
+    @property
+    def block_number(self) -> int | None:
+        return self._decoded("block_number", int)
+
+    @property
+    def block_timestamp(self) -> datetime.datetime | None:
+        return self._decoded("block_timestamp", datetime.datetime.fromisoformat)
+
+    @property
+    def tx_hash(self) -> str | None:
+        return self._decoded("tx_hash", str)
+
+    @property
+    def tx_from_address(self) -> str | None:
+        return self._decoded("tx_from_address", str)
+
+    @property
+    def kind(self) -> str | None:
+        """buy or sell"""
+        return self._decoded("kind", str)
+
+    @property
+    def from_token_address(self) -> str | None:
+        return self._decoded("from_token_address", str)
+
+    @property
+    def to_token_address(self) -> str | None:
+        return self._decoded("to_token_address", str)
+
+    @property
+    def from_token_amount(self) -> float | None:
+        return self._decoded("from_token_amount", float)
+
+    @property
+    def to_token_amount(self) -> float | None:
+        return self._decoded("to_token_amount", float)
+
+    @property
+    def price_from_in_currency_token(self) -> float | None:
+        return self._decoded("price_from_in_currency_token", float)
+
+    @property
+    def price_to_in_currency_token(self) -> float | None:
+        return self._decoded("price_to_in_currency_token", float)
+
+    @property
+    def price_from_in_usd(self) -> float | None:
+        return self._decoded("price_from_in_usd", float)
+
+    @property
+    def price_to_in_usd(self) -> float | None:
+        return self._decoded("price_to_in_usd", float)
+
+    @property
+    def volume_in_usd(self) -> float | None:
+        return self._decoded("volume_in_usd", float)
+
+
+class OHLCV(Resource):
+    """OHLCV resource of `network_pool_ohlcv()`"""
+
+    __slots__ = ()
+    _fields = ("ohlcv_list",)
+
+    @property
+    def ohlcv_list(self) -> list[list[float]] | None:
+        """[timestamp, open, high, low, close, volume] candles, newest first"""
+        return self._decoded("ohlcv_list", _candles)
+
+    def series(self) -> OHLCVSeries:
+        """Candles as a columnar `OHLCVSeries`"""
+        return OHLCVSeries.from_candles(self.ohlcv_list or [])
+
+
+# Resource type to model
+MODELS: dict[str, type[Resource]] = {
+    "network": Network,
+    "dex": Dex,
+    "token": Token,
+    "pool": Pool,
+    "trade": Trade,
+    "ohlcv_request_response": OHLCV,
+}
+
+
+def to_model(resource: Mapping) -> Mapping:
+    """Model of a raw resource, resources of other types are returned as they are"""
+    if isinstance(resource, Resource):
+        return resource
+    model = MODELS.get(resource.get("type"))  # pyright: ignore [reportArgumentType]
+    return resource if model is None else model(resource)
+
+
+def to_models(response: dict) -> dict:
+    """Copy of a response with its `data` and `included` resources as models
+
+    Models created here resolve their relationships in the `included` resources
+    of the response, e.g. `Pool.base_token`. Resources that already are models
+    are kept as they are.
+    """
+    converted = dict(response)
+    created: list[Resource] = []
+
+    def convert(resource: Mapping) -> Mapping:
+        model = to_model(resource)
+        if model is not resource and isinstance(model, Resource):
+            created.append(model)
+        return model
+
+    data = response.get("data")
+    if isinstance(data, list):
+        converted["data"] = [convert(resource) for resource in data]
+    elif isinstance(data, Mapping):
+        converted["data"] = convert(data)
+    if response.get("included"):
+        included = [convert(r) for r in response["included"]]
+        converted["included"] = included
+        # Built once per response, the models never change after decoding
+        index: dict[tuple[str, str], Mapping] = {
+            (r["type"], r["id"]): r for r in included
+        }
+        for model in created:
+            model.included = index
+    return converted
@@ -0,0 +1,521 @@
+import datetime
+import importlib
+import itertools
+import math
+from array import array
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from .limits import OHLCV_LIMIT, TIMEFRAME_SECONDS
+
+if TYPE_CHECKING:
+    from .api import GeckoTerminalAPI
+    from .async_api import AsyncGeckoTerminalAPI
+
+# NumPy is optional, without it `OHLCVSeries` falls back to the `array` module
+try:
+    np = importlib.import_module("numpy")
+except ImportError:
+    np = None
+
+
+def candle_interval(timeframe: str, aggregate: int = 1) -> int:
+    """Length of one candle in seconds e.g. 900 for timeframe "minute", aggregate 15"""
+    return TIMEFRAME_SECONDS[timeframe] * aggregate
+
+
+def backfill_windows(
+    start: int,
+    end: int,
+    timeframe: str,
+    aggregate: int = 1,
+    limit: int = OHLCV_LIMIT,
+) -> list[tuple[int, int]]:
+    """Split the range [start, end] into non-overlapping OHLCV request windows
+
+    Args:
+    ----
+        start: Earliest candle timestamp wanted (seconds since epoch)
+        end: Latest candle timestamp wanted (seconds since epoch)
+        timeframe: Timeframe of OHLCV data e.g. day, hour, minute
+        aggregate: Aggregate of OHLCV data
+        limit: Maximum candles per request
+
+    Returns:
+    -------
+        list[tuple[int, int]]: (before_timestamp, limit) pairs, newest window first.
+            The last window only requests the candles needed to reach `start`.
+    """
+    interval = candle_interval(timeframe, aggregate)
+    windows = []
+    before = end
+    while before >= start:
+        needed = math.floor((before - start) / interval) + 1
+        windows.append((before, min(limit, needed)))
+        before -= limit * interval
+    return windows
+
+
+def merge_candles(
+    candle_lists: list[list[list]], start: int | None = None, end: int | None = None
+) -> list[list]:
+    """Merge OHLCV lists into one series, newest candle first like the API
+
+    Candles sharing a timestamp (e.g. at window boundaries) are de-duplicated, the
+    one seen last wins. Candles outside [start, end] are dropped.
+
+    Args:
+    ----
+        candle_lists: Lists of [timestamp, open, high, low, close, volume] candles
+        start: Earliest timestamp to keep, if None no lower bound
+        end: Latest timestamp to keep, if None no upper bound
+    """
+    by_timestamp = {}
+    for candles in candle_lists:
+        for candle in candles:
+            timestamp = candle[0]
+            if (start is None or timestamp >= start) and (
+                end is None or timestamp <= end
+            ):
+                by_timestamp[timestamp] = candle
+    return [by_timestamp[t] for t in sorted(by_timestamp, reverse=True)]
+
+
+def merge_ohlcv_responses(
+    responses: list[dict], start: int | None = None, end: int | None = None
+) -> dict:
+    """Merge `network_pool_ohlcv()` responses into one response
+
+    The `ohlcv_list` is replaced by the merged series from `merge_candles()`, all
+    other members are taken from the first response.
+    """
+    if not responses:
+        return {"data": {"attributes": {"ohlcv_list": []}}}
+    merged = dict(responses[0])
+    merged["data"] = {
+        **merged["data"],
+        "attributes": {
+            **merged["data"]["attributes"],
+            "ohlcv_list": merge_candles(
+                [r["data"]["attributes"]["ohlcv_list"] for r in responses], start, end
+            ),
+        },
+    }
+    return merged
+
+
+def find_gaps(
+    candles: list[list],
+    timeframe: str,
+    aggregate: int = 1,
+    start: int | None = None,
+    end: int | None = None,
+) -> list[tuple[int, int]]:
+    """Find the missing candles of a series
+
+    Candles are expected every `candle_interval()` seconds on the grid of the
+    existing timestamps. With `start` or `end` the missing candles before the first
+    and after the last candle are reported as well.
+
+    Args:
+    ----
+        candles: [timestamp, open, high, low, close, volume] candles in any order
+        timeframe: Timeframe of OHLCV data e.g. day, hour, minute
+        aggregate: Aggregate of OHLCV data
+        start: Earliest timestamp the series should cover
+        end: Latest timestamp the series should cover
+
+    Returns:
+    -------
+        list[tuple[int, int]]: (first, last) timestamps of each run of missing
+            candles, oldest first
+    """
+    interval = candle_interval(timeframe, aggregate)
+    timestamps = sorted({int(candle[0]) for candle in candles})
+    if not timestamps:
+        if start is None or end is None or start > end:
+            return []
+        return [(start, end)]
+    gaps = []
+    if start is not None:
+        # First grid timestamp at or after start
+        first = timestamps[0] - (timestamps[0] - start) // interval * interval
+        if first < timestamps[0]:
+            gaps.append((first, timestamps[0] - interval))
+    gaps.extend(
+        (previous + interval, current - interval)
+        for previous, current in itertools.pairwise(timestamps)
+        if current - previous > interval
+    )
+    if end is not None:
+        last = timestamps[-1] + (end - timestamps[-1]) // interval * interval
+        if last > timestamps[-1]:
+            gaps.append((timestamps[-1] + interval, last))
+    return gaps
+
+
+def repair_windows(
+    gaps: list[tuple[int, int]],
+    timeframe: str,
+    aggregate: int = 1,
+    limit: int = OHLCV_LIMIT,
+) -> list[tuple[int, int]]:
+    """OHLCV request windows covering the gaps found by `find_gaps()`
+
+    Gaps close to each other are merged into one span of up to `limit` candles, so
+    a sparse series costs one request per `limit` candles instead of one per gap.
+
+    Args:
+    ----
+        gaps: (first, last) timestamps of the missing candles, oldest first
+        timeframe: Timeframe of OHLCV data e.g. day, hour, minute
+        aggregate: Aggregate of OHLCV data
+        limit: Maximum candles per request
+
+    Returns:
+    -------
+        list[tuple[int, int]]: (before_timestamp, limit) pairs, newest window first
+    """
+    interval = candle_interval(timeframe, aggregate)
+    spans: list[tuple[int, int]] = []
+    for gap_start, gap_end in gaps:
+        if spans and gap_end - spans[-1][0] < limit * interval:
+            spans[-1] = (spans[-1][0], gap_end)
+        else:
+            spans.append((gap_start, gap_end))
+    return [
+        window
+        for span_start, span_end in reversed(spans)
+        for window in backfill_windows(
+            span_start, span_end, timeframe, aggregate, limit
+        )
+    ]
+
+
+def fill_gaps(candles: list[list], timeframe: str, aggregate: int = 1) -> list[list]:
+    """Fill the missing candles of a series forward, newest candle first
+
+    A missing candle is a period without trades: open, high, low and close are the
+    previous close and volume is 0. The result is evenly spaced from the first to
+    the last candle.
+
+    Args:
+    ----
+        candles: [timestamp, open, high, low, close, volume] candles in any order
+        timeframe: Timeframe of OHLCV data e.g. day, hour, minute
+        aggregate: Aggregate of OHLCV data
+    """
+    interval = candle_interval(timeframe, aggregate)
+    filled: list[list] = []
+    for candle in sorted(merge_candles([candles]), key=lambda c: c[0]):
+        if filled:
+            close = filled[-1][4]
+            filled.extend(
+                [timestamp, close, close, close, close, 0]
+                for timestamp in range(filled[-1][0] + interval, candle[0], interval)
+            )
+        filled.append(candle)
+    filled.reverse()
+    return filled
+
+
+class OHLCVSeries:
+    """Columnar OHLCV candles, oldest first.
+
+    Each field is a contiguous array: `timestamp` holds int64 seconds since epoch,
+    the price and volume fields float64. With NumPy installed the fields are NumPy
+    arrays built from the JSON lists in one vectorized pass, otherwise they are
+    memoryviews over stdlib `array`s. Slicing a series returns views, not copies.
+    """
+
+    __slots__ = ("close", "high", "low", "open", "timestamp", "volume")
+
+    fields = ("timestamp", "open", "high", "low", "close", "volume")
+
+    def __init__(
+        self,
+        *,
+        timestamp: Sequence[int],
+        open: Sequence[float],  # noqa: A002
+        high: Sequence[float],
+        low: Sequence[float],
+        close: Sequence[float],
+        volume: Sequence[float],
+    ) -> None:
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    @classmethod
+    def from_candles(cls, candles: list[list]) -> "OHLCVSeries":
+        """Build a series from [timestamp, open, high, low, close, volume] lists"""
+        ordered = (
+            candles[::-1] if candles and candles[0][0] > candles[-1][0] else candles
+        )
+        if np is not None:
+            block = np.ascontiguousarray(
+                np.asarray(ordered, dtype=np.float64).reshape(-1, 6).T
+            )
+            return cls._from_columns([block[0].astype(np.int64), *block[1:]])
+        columns = [array("q", (int(c[0]) for c in ordered))]
+        columns += [array("d", (c[i] for c in ordered)) for i in range(1, 6)]
+        return cls._from_columns([memoryview(column) for column in columns])
+
+    @classmethod
+    def _from_columns(cls, columns: list) -> "OHLCVSeries":
+        return cls(**dict(zip(cls.fields, columns, strict=True)))
+
+    @classmethod
+    def from_response(cls, response: dict) -> "OHLCVSeries":
+        """Build a series from a `network_pool_ohlcv()` response"""
+        return cls.from_candles(response["data"]["attributes"]["ohlcv_list"])
+
+    @property
+    def backend(self) -> str:
+        """ "numpy" or "array", depending on the array type holding the fields"""
+        return "array" if isinstance(self.timestamp, memoryview) else "numpy"
+
+    def resample(
+        self, interval: int, base_interval: int, *, drop_partial: bool = False
+    ) -> "OHLCVSeries":
+        """Aggregate the candles into longer candles e.g. hour/4 from hour/1
+
+        Buckets are aligned to the epoch like the API's candles: open is the first
+        open, high the highest high, low the lowest low, close the last close and
+        volume the summed volume of the candles in a bucket. Candles missing
+        inside the series are treated as periods without trades. The first and
+        last bucket are partial when the series starts after the first or ends
+        before the last base candle of the bucket.
+
+        Args:
+        ----
+            interval: Length of the new candles in seconds from `candle_interval()`
+                e.g. `candle_interval("hour", 2)`, a multiple of `base_interval`
+            base_interval: Length of the candles of this series in seconds
+            drop_partial: Drop partial first and last buckets (default False)
+        """
+        if interval <= 0 or base_interval <= 0 or interval % base_interval:
+            msg = f"interval {interval} is not a multiple of {base_interval}"
+            raise ValueError(msg)
+        if not len(self):
+            return self
+        if self.backend == "numpy" and np is not None:
+            timestamp = np.asarray(self.timestamp)
+            buckets = timestamp - timestamp % interval
+            starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+            ends = np.r_[starts[1:], len(buckets)] - 1
+            resampled = self._from_columns(
+                [
+                    buckets[starts],
+                    np.asarray(self.open)[starts],
+                    np.maximum.reduceat(self.high, starts),
+                    np.minimum.reduceat(self.low, starts),
+                    np.asarray(self.close)[ends],
+                    np.add.reduceat(self.volume, starts),
+                ]
+            )
+        else:
+            resampled = self._resample_array(interval)
+        if drop_partial:
+            first = int(resampled.timestamp[0])
+            last = int(resampled.timestamp[-1])
+            head = 1 if int(self.timestamp[0]) > first else 0
+            tail = 1 if int(self.timestamp[-1]) + base_interval < last + interval else 0
+            resampled = resampled[head : len(resampled) - tail]
+        return resampled
+
+    def _resample_array(self, interval: int) -> "OHLCVSeries":
+        timestamps = array("q")
+        opens, highs, lows, closes, volumes = (array("d") for _ in range(5))
+        for t, o, h, lo, c, v in zip(
+            *(self.column(f) for f in self.fields), strict=True
+        ):
+            bucket = t - t % interval
+            if timestamps and timestamps[-1] == bucket:
+                highs[-1] = max(highs[-1], h)
+                lows[-1] = min(lows[-1], lo)
+                closes[-1] = c
+                volumes[-1] += v
+            else:
+                timestamps.append(bucket)
+                opens.append(o)
+                highs.append(h)
+                lows.append(lo)
+                closes.append(c)
+                volumes.append(v)
+        columns = [timestamps, opens, highs, lows, closes, volumes]
+        return self._from_columns([memoryview(column) for column in columns])
+
+    def to_candles(self) -> list[list]:
+        """Convert back to [timestamp, open, high, low, close, volume] lists"""
+        return [
+            [int(t), o, h, lo, c, v]
+            for t, o, h, lo, c, v in zip(
+                *(self.column(f) for f in self.fields), strict=True
+            )
+        ]
+
+    def column(self, field: str) -> Sequence:
+        """Return the array holding `field`"""
+        return getattr(self, field)
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __getitem__(self, index: slice) -> "OHLCVSeries":
+        return self._from_columns([self.column(f)[index] for f in self.fields])
+
+
+# Identifies an OHLCV series by network, pool address, timeframe, aggregate,
+# currency and token
+SeriesKey = tuple[str, str, str, int, str, str]
+
+
+class _OHLCVSyncBase:
+    def __init__(
+        self, marks: dict[SeriesKey, int] | None = None, initial_limit: int = 100
+    ) -> None:
+        """
+        Args:
+        ----
+            marks: High-water marks to resume from, the timestamp of the newest
+                candle already held per series
+            initial_limit: Number of candles fetched for a series without a mark
+        """
+        self.marks: dict[SeriesKey, int] = marks if marks is not None else {}
+        self.initial_limit = initial_limit
+
+    def _limit(self, key: SeriesKey, now: int) -> int | None:
+        """Smallest limit covering the gap since the mark
+
+        None means more than `OHLCV_LIMIT` candles are missing and a backfill is
+        needed.
+        """
+        mark = self.marks.get(key)
+        if mark is None:
+            return self.initial_limit
+        # The candle at the mark may still have been open, so it is fetched again
+        needed = (now - mark) // candle_interval(key[2], key[3]) + 1
+        return max(1, needed) if needed <= OHLCV_LIMIT else None
+
+    def _advance(self, key: SeriesKey, response: dict) -> list[list]:
+        candles = response["data"]["attributes"]["ohlcv_list"]
+        mark = self.marks.get(key)
+        if mark is not None:
+            candles = [c for c in candles if c[0] >= mark]
+        if candles:
+            self.marks[key] = max(mark or 0, *(c[0] for c in candles))
+        return candles
+
+
+class OHLCVSync(_OHLCVSyncBase):
+    """Fetch only the OHLCV candles newer than the last sync, per series.
+
+    A high-water mark (the newest candle timestamp seen) is kept per (network,
+    pool_address, timeframe, aggregate, currency, token). Each `sync()` requests the
+    smallest `limit` covering the time since the mark, falling back to a backfill
+    when more than `OHLCV_LIMIT` candles are missing. The returned candles start at
+    the mark, so the previously newest, possibly still open, candle is returned
+    again and should replace the stored one.
+    """
+
+    def __init__(
+        self,
+        client: "GeckoTerminalAPI",
+        marks: dict[SeriesKey, int] | None = None,
+        initial_limit: int = 100,
+    ) -> None:
+        super().__init__(marks, initial_limit)
+        self.client = client
+
+    def sync(
+        self,
+        network: str,
+        pool_address: str,
+        timeframe: str,
+        *,
+        aggregate: int = 1,
+        currency: str = "usd",
+        token: str = "base",
+    ) -> list[list]:
+        """Fetch the candles since the last sync of this series, newest first"""
+        key = (network, pool_address, timeframe, aggregate, currency, token)
+        now = int(datetime.datetime.now(tz=datetime.UTC).timestamp())
+        limit = self._limit(key, now)
+        if limit is None:
+            response = self.client.network_pool_ohlcv_backfill(
+                network,
+                pool_address,
+                timeframe,
+                start=self.marks[key],
+                end=now,
+                aggregate=aggregate,
+                currency=currency,
+                token=token,
+            )
+        else:
+            response = self.client.network_pool_ohlcv(
+                network=network,
+                pool_address=pool_address,
+                timeframe=timeframe,
+                aggregate=aggregate,
+                before_timestamp=now,
+                limit=limit,
+                currency=currency,
+                token=token,
+            )
+        return self._advance(key, response)
+
+
+class AsyncOHLCVSync(_OHLCVSyncBase):
+    """Asynchronous `OHLCVSync` for `AsyncGeckoTerminalAPI`."""
+
+    def __init__(
+        self,
+        client: "AsyncGeckoTerminalAPI",
+        marks: dict[SeriesKey, int] | None = None,
+        initial_limit: int = 100,
+    ) -> None:
+        super().__init__(marks, initial_limit)
+        self.client = client
+
+    async def sync(
+        self,
+        network: str,
+        pool_address: str,
+        timeframe: str,
+        *,
+        aggregate: int = 1,
+        currency: str = "usd",
+        token: str = "base",
+    ) -> list[list]:
+        """Fetch the candles since the last sync of this series, newest first"""
+        key = (network, pool_address, timeframe, aggregate, currency, token)
+        now = int(datetime.datetime.now(tz=datetime.UTC).timestamp())
+        limit = self._limit(key, now)
+        if limit is None:
+            response = await self.client.network_pool_ohlcv_backfill(
+                network,
+                pool_address,
+                timeframe,
+                start=self.marks[key],
+                end=now,
+                aggregate=aggregate,
+                currency=currency,
+                token=token,
+            )
+        else:
+            response = await self.client.network_pool_ohlcv(
+                network=network,
+                pool_address=pool_address,
+                timeframe=timeframe,
+                aggregate=aggregate,
+                before_timestamp=now,
+                limit=limit,
+                currency=currency,
+                token=token,
+            )
+        return self._advance(key, response)
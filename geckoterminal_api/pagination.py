@@ -0,0 +1,73 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .limits import MAX_PAGE
+
+
+async def aiter_pages(
+    fetch: Callable[..., Awaitable[dict]],
+    lookahead: int = 2,
+    max_page: int = MAX_PAGE,
+) -> AsyncIterator[dict]:
+    """Yield pages in order while fetching up to `lookahead` further pages
+
+    Iteration stops at the first page without data or after `max_page`. Pending
+    prefetches are cancelled when the consumer stops early, use
+    `contextlib.aclosing()` to make this happen immediately on `break`.
+
+    Args:
+    ----
+        fetch: Coroutine function called with a `page` keyword argument
+        lookahead: Number of pages to fetch ahead of the one being consumed
+        max_page: Last page to fetch
+    """
+    pending: deque[asyncio.Task] = deque()
+    next_page = 1
+    try:
+        while True:
+            while next_page <= max_page and len(pending) <= lookahead:
+                pending.append(asyncio.ensure_future(fetch(page=next_page)))
+                next_page += 1
+            if not pending:
+                return
+            page = await pending.popleft()
+            if not page.get("data"):
+                return
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def iter_pages(
+    fetch: Callable[..., dict], lookahead: int = 2, max_page: int = MAX_PAGE
+) -> Iterator[dict]:
+    """Yield pages in order while fetching up to `lookahead` further pages on threads
+
+    Iteration stops at the first page without data or after `max_page`. Prefetches
+    that have not started are cancelled when the generator is closed.
+
+    Args:
+    ----
+        fetch: Function called with a `page` keyword argument
+        lookahead: Number of pages to fetch ahead of the one being consumed
+        max_page: Last page to fetch
+    """
+    executor = ThreadPoolExecutor(max_workers=lookahead + 1)
+    pending: deque[Future] = deque()
+    next_page = 1
+    try:
+        while True:
+            while next_page <= max_page and len(pending) <= lookahead:
+                pending.append(executor.submit(fetch, page=next_page))
+                next_page += 1
+            if not pending:
+                return
+            page = pending.popleft().result()
+            if not page.get("data"):
+                return
+            yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,178 @@
+import asyncio
+import itertools
+import math
+import time
+from array import array
+from collections.abc import Iterable
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from .limits import MAX_ADDRESSES, RATE_LIMIT
+
+if TYPE_CHECKING:
+    from .async_api import AsyncGeckoTerminalAPI
+
+
+class PriceWatcher:
+    """Keep the USD prices of many tokens fresh within a request budget.
+
+    Tokens are grouped by network into batches of up to `MAX_ADDRESSES` addresses,
+    one `network_addresses_token_price()` request each. The batches are refreshed
+    round-robin, evenly spaced so that every batch is refreshed once per `period`,
+    but never more often than `requests_per_minute` allows. If the budget cannot
+    refresh every batch within `period`, the round takes longer, see `stats`.
+
+    Prices and the time they were refreshed are kept in two flat float arrays
+    indexed by token, missing prices are NaN.
+
+    ```python
+    async with PriceWatcher(client, tokens, period=60) as watcher:
+        await asyncio.sleep(60)
+        watcher.price("eth", "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2")
+    ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncGeckoTerminalAPI",
+        tokens: Iterable[tuple[str, str]],
+        *,
+        period: float = 60.0,
+        requests_per_minute: float = RATE_LIMIT,
+        batch_size: int = MAX_ADDRESSES,
+    ) -> None:
+        """
+        Args:
+        ----
+            client: Client used for the price requests
+            tokens: (network, token address) pairs to watch
+            period: Target seconds in which every token is refreshed once
+            requests_per_minute: Request budget of the watcher (default 30)
+            batch_size: Addresses per request (default `MAX_ADDRESSES`)
+        """
+        if requests_per_minute <= 0:
+            msg = (
+                f"requests_per_minute must be positive, {requests_per_minute} provided"
+            )
+            raise ValueError(msg)
+        self.client = client
+        self.period = period
+        self.requests_per_minute = requests_per_minute
+        self._index: dict[tuple[str, str], int] = {}
+        by_network: dict[str, list[str]] = {}
+        for network, address in tokens:
+            if (network, address) not in self._index:
+                self._index[network, address] = len(self._index)
+                by_network.setdefault(network, []).append(address)
+        self.batches = [
+            (network, addresses[i : i + batch_size])
+            for network, addresses in by_network.items()
+            for i in range(0, len(addresses), batch_size)
+        ]
+        self.prices = array("d", [math.nan]) * len(self._index)
+        self.updated_at = array("d", [0.0]) * len(self._index)
+        self._task: asyncio.Task | None = None
+        self._in_flight: set[asyncio.Task] = set()
+        self._requests = 0
+        self._errors = 0
+        self.last_error: Exception | None = None
+
+    @property
+    def interval(self) -> float:
+        """Seconds between two batch requests"""
+        if not self.batches:
+            return self.period
+        return max(self.period / len(self.batches), 60 / self.requests_per_minute)
+
+    def start(self) -> None:
+        """Start refreshing, called by `async with`"""
+        if self._task is None and self.batches:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        busy: set[int] = set()
+        for i in itertools.cycle(range(len(self.batches))):
+            # Skip a batch whose previous request is still running
+            if i not in busy:
+                busy.add(i)
+                task = asyncio.create_task(self.refresh(i))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+                task.add_done_callback(lambda _, i=i: busy.discard(i))
+            next_at += self.interval
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+
+    async def refresh(self, batch: int) -> None:
+        """Request the prices of one batch and update the table"""
+        network, addresses = self.batches[batch]
+        self._requests += 1
+        try:
+            response = await self.client.network_addresses_token_price(
+                network, addresses
+            )
+        except Exception as exc:  # noqa: BLE001
+            self._errors += 1
+            self.last_error = exc
+            return
+        now = time.time()
+        token_prices = response["data"]["attributes"]["token_prices"] or {}
+        lowered = {address.lower(): price for address, price in token_prices.items()}
+        for address in addresses:
+            price = token_prices.get(address) or lowered.get(address.lower())
+            if price is None:
+                continue
+            row = self._index[network, address]
+            self.prices[row] = float(price)
+            self.updated_at[row] = now
+
+    def price(self, network: str, address: str) -> float | None:
+        """Latest USD price of a token, None if it has no price yet"""
+        price = self.prices[self._index[network, address]]
+        return None if math.isnan(price) else price
+
+    def age(self, network: str, address: str) -> float:
+        """Seconds since the price of a token was refreshed, inf if never"""
+        updated_at = self.updated_at[self._index[network, address]]
+        return math.inf if not updated_at else time.time() - updated_at
+
+    @property
+    def max_age(self) -> float:
+        """Seconds since the stalest price was refreshed, inf if one never was"""
+        if not self.updated_at:
+            return 0.0
+        oldest = min(self.updated_at)
+        return math.inf if not oldest else time.time() - oldest
+
+    @property
+    def stats(self) -> dict:
+        """Tokens, batches, achievable round duration, requests, errors and max age"""
+        return {
+            "tokens": len(self._index),
+            "batches": len(self.batches),
+            "period": self.interval * len(self.batches),
+            "requests": self._requests,
+            "errors": self._errors,
+            "max_age": self.max_age,
+        }
+
+    def close(self) -> None:
+        """Stop refreshing"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for task in self._in_flight:
+            task.cancel()
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
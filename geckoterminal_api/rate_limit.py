@@ -0,0 +1,113 @@
+import asyncio
+import math
+import threading
+import time
+
+from .limits import RATE_LIMIT
+
+
+class RateLimiter:
+    """Token-bucket rate limiter for pacing requests to a calls-per-minute budget.
+
+    Tokens refill continuously at `calls_per_minute / 60` per second, up to `burst`.
+    Every request reserves one token. If the bucket is empty the reservation pushes
+    the balance negative and the caller sleeps until its token has refilled, so the
+    lock is never held while waiting. The same instance can therefore pace threads
+    (`acquire`) and asyncio tasks (`acquire_async`), and may be shared between a
+    `GeckoTerminalAPI` and an `AsyncGeckoTerminalAPI`.
+    """
+
+    def __init__(self, calls_per_minute: float = RATE_LIMIT, burst: int = 1) -> None:
+        """
+        Args:
+        ----
+            calls_per_minute: Sustained request budget (default 30)
+            burst: Maximum number of requests that may be sent back-to-back after
+                an idle period (default 1)
+        """
+        if calls_per_minute <= 0:
+            msg = f"calls_per_minute must be positive, {calls_per_minute} provided"
+            raise ValueError(msg)
+        if burst < 1:
+            msg = f"burst must be at least 1, {burst} provided"
+            raise ValueError(msg)
+        self.calls_per_minute = calls_per_minute
+        self.burst = burst
+        self._rate = calls_per_minute / 60
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._waited = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _reserve(self) -> float:
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self._rate)
+            self._acquired += 1
+            self._waited += wait
+            return wait
+
+    def _release(self) -> None:
+        with self._lock:
+            self._tokens += 1
+            self._acquired -= 1
+
+    def acquire(self) -> float:
+        """Block the calling thread until a token is available.
+
+        Returns
+        -------
+            float: Seconds spent waiting for the token.
+        """
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait without blocking the event loop until a token is available.
+
+        If the waiting task is cancelled its reservation is handed back.
+
+        Returns
+        -------
+            float: Seconds spent waiting for the token.
+        """
+        wait = self._reserve()
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._release()
+                raise
+        return wait
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently in the bucket, negative when callers are queued."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    @property
+    def stats(self) -> dict:
+        """Snapshot of the limiter configuration and counters."""
+        with self._lock:
+            self._refill()
+            return {
+                "calls_per_minute": self.calls_per_minute,
+                "burst": self.burst,
+                "tokens": self._tokens,
+                "queued": max(0, math.ceil(-self._tokens)),
+                "acquired": self._acquired,
+                "waited_seconds": self._waited,
+            }
@@ -0,0 +1,67 @@
+import datetime
+import random
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry policy for rate limited and transient server errors.
+
+    Delays follow exponential backoff with full jitter: before retry `n` the client
+    sleeps a random duration in `[0, min(backoff_cap, backoff_base * 2 ** (n - 1))]`.
+    When the response carries a `Retry-After` header the client waits at least that
+    long, bounded by `backoff_cap`.
+
+    Args:
+    ----
+        max_attempts: Total number of attempts, including the first (default 5)
+        backoff_base: Backoff ceiling in seconds before the first retry (default 1)
+        backoff_cap: Upper bound on any single delay in seconds (default 60)
+        jitter: Randomise delays with full jitter (default True)
+        respect_retry_after: Honor the `Retry-After` response header (default True)
+        retry_statuses: HTTP status codes that are retried (default 429 and 5xx)
+    """
+
+    max_attempts: int = 5
+    backoff_base: float = 1.0
+    backoff_cap: float = 60.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+
+    def should_retry(self, status: int, attempt: int) -> bool:
+        """Whether a response with `status` on attempt number `attempt` is retried"""
+        return status in self.retry_statuses and attempt < self.max_attempts
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait after failed attempt number `attempt`
+
+        Args:
+        ----
+            attempt: Number of the attempt that failed, starting at 1
+            retry_after: Value of the `Retry-After` header, if any
+        """
+        ceiling = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        delay = random.uniform(0, ceiling) if self.jitter else ceiling  # noqa: S311
+        if self.respect_retry_after and retry_after:
+            delay = max(delay, min(self.backoff_cap, parse_retry_after(retry_after)))
+        return delay
+
+
+def parse_retry_after(value: str) -> float:
+    """Parse a `Retry-After` header given as delta-seconds or an HTTP date"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if date.tzinfo is None:
+        # The asctime format carries no zone, HTTP dates are always in UTC
+        date = date.replace(tzinfo=datetime.UTC)
+    return max(0.0, (date - datetime.datetime.now(tz=datetime.UTC)).total_seconds())
@@ -0,0 +1,159 @@
+import asyncio
+import contextlib
+import contextvars
+import math
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Generator
+
+# Highest priority first
+LANES = ("interactive", "normal", "bulk")
+
+_lane: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "geckoterminal_priority", default="normal"
+)
+
+
+@contextlib.contextmanager
+def request_priority(lane: str) -> Generator[None]:
+    """Send the requests made inside the block, and tasks started in it, in `lane`"""
+    if lane not in LANES:
+        msg = f"lane must be one of {LANES}, {lane} provided"
+        raise ValueError(msg)
+    token = _lane.set(lane)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+def current_lane() -> str:
+    """Lane of the requests made in the current context"""
+    return _lane.get()
+
+
+class _LaneStats:
+    __slots__ = ("granted", "max_wait", "waited")
+
+    def __init__(self) -> None:
+        self.granted = 0
+        self.waited = 0.0
+        self.max_wait = 0.0
+
+
+class PriorityScheduler:
+    """Admit requests in priority lanes to a limited number of slots.
+
+    A request holds a slot while it waits for the rate limiter and while it is
+    sent. When a slot frees up it goes to the oldest waiter of the highest lane
+    that has one, so interactive requests overtake queued normal and bulk ones.
+    To keep bulk from starving, while bulk requests wait at least
+    `min_bulk_share` of the slots granted go to them.
+
+    The lane is taken from the context, see `request_priority()`.
+    """
+
+    def __init__(self, concurrency: int = 4, min_bulk_share: float = 0.1) -> None:
+        """
+        Args:
+        ----
+            concurrency: Number of requests admitted at the same time (default 4)
+            min_bulk_share: Minimum share of slots granted to waiting bulk requests
+                (default 0.1), 0 to only serve bulk when nothing else waits
+        """
+        if concurrency < 1:
+            msg = f"concurrency must be at least 1, {concurrency} provided"
+            raise ValueError(msg)
+        if not 0 <= min_bulk_share <= 1:
+            msg = f"min_bulk_share must be within [0, 1], {min_bulk_share} provided"
+            raise ValueError(msg)
+        self.concurrency = concurrency
+        self.min_bulk_share = min_bulk_share
+        # Grants to other lanes after which a waiting bulk request goes next
+        self._bulk_every = (
+            math.ceil(1 / min_bulk_share) - 1 if min_bulk_share else math.inf
+        )
+        self._since_bulk = 0
+        self._free = concurrency
+        self._waiters: dict[str, deque[asyncio.Future]] = {
+            lane: deque() for lane in LANES
+        }
+        self._stats = {lane: _LaneStats() for lane in LANES}
+
+    async def acquire(self, lane: str | None = None) -> None:
+        """Wait for a slot in `lane`, by default the lane of the current context"""
+        lane = lane or current_lane()
+        if lane not in LANES:
+            msg = f"lane must be one of {LANES}, {lane} provided"
+            raise ValueError(msg)
+        if self._free and not any(self._waiters.values()):
+            self._free -= 1
+            self._granted(lane, 0.0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(future)
+        queued_at = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancellation
+                self.release()
+            else:
+                self._waiters[lane].remove(future)
+            raise
+        self._record_wait(lane, time.monotonic() - queued_at)
+
+    def release(self) -> None:
+        """Free a slot, handing it to the next waiter if there is one"""
+        lane = self._next_lane()
+        if lane is None:
+            self._free += 1
+            return
+        self._granted(lane, None)
+        self._waiters[lane].popleft().set_result(None)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, lane: str | None = None) -> AsyncGenerator[None]:
+        """Hold a slot for the duration of the block"""
+        await self.acquire(lane)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _next_lane(self) -> str | None:
+        waiting = [lane for lane in LANES if self._waiters[lane]]
+        if not waiting:
+            return None
+        if "bulk" in waiting and self._since_bulk >= self._bulk_every:
+            return "bulk"
+        return waiting[0]
+
+    def _granted(self, lane: str, wait: float | None) -> None:
+        self._stats[lane].granted += 1
+        if lane == "bulk":
+            self._since_bulk = 0
+        elif self._waiters["bulk"]:
+            self._since_bulk += 1
+        if wait is not None:
+            self._record_wait(lane, wait)
+
+    def _record_wait(self, lane: str, wait: float) -> None:
+        stats = self._stats[lane]
+        stats.waited += wait
+        stats.max_wait = max(stats.max_wait, wait)
+
+    @property
+    def stats(self) -> dict:
+        """Per lane: queued requests, slots granted, total, mean and max wait"""
+        return {
+            lane: {
+                "queued": len(self._waiters[lane]),
+                "granted": stats.granted,
+                "waited_seconds": stats.waited,
+                "mean_wait": stats.waited / stats.granted if stats.granted else 0.0,
+                "max_wait": stats.max_wait,
+            }
+            for lane, stats in self._stats.items()
+        }
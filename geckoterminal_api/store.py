@@ -0,0 +1,238 @@
+import datetime
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+
+from .ohlcv import SeriesKey, candle_interval
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    network TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    aggregate INTEGER NOT NULL,
+    currency TEXT NOT NULL,
+    token TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume REAL NOT NULL,
+    PRIMARY KEY (network, pool, timeframe, aggregate, currency, token, timestamp)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    network TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    aggregate INTEGER NOT NULL,
+    currency TEXT NOT NULL,
+    token TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    "end" INTEGER NOT NULL,
+    PRIMARY KEY (network, pool, timeframe, aggregate, currency, token, start)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS envelopes (
+    network TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    aggregate INTEGER NOT NULL,
+    currency TEXT NOT NULL,
+    token TEXT NOT NULL,
+    document TEXT NOT NULL,
+    PRIMARY KEY (network, pool, timeframe, aggregate, currency, token)
+) WITHOUT ROWID;
+"""
+
+_SELECT_CANDLES = """
+SELECT timestamp, open, high, low, close, volume FROM candles
+WHERE network = ? AND pool = ? AND timeframe = ? AND aggregate = ? AND currency = ?
+    AND token = ? AND timestamp BETWEEN ? AND ?
+ORDER BY timestamp DESC
+"""
+
+_INSERT_CANDLE = """
+INSERT OR REPLACE INTO candles (
+    network, pool, timeframe, aggregate, currency, token,
+    timestamp, open, high, low, close, volume
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_COVERAGE = """
+SELECT start, "end" FROM coverage
+WHERE network = ? AND pool = ? AND timeframe = ? AND aggregate = ? AND currency = ?
+    AND token = ?
+ORDER BY start
+"""
+
+_DELETE_COVERAGE = """
+DELETE FROM coverage
+WHERE network = ? AND pool = ? AND timeframe = ? AND aggregate = ? AND currency = ?
+    AND token = ?
+"""
+
+_SELECT_ENVELOPE = """
+SELECT document FROM envelopes
+WHERE network = ? AND pool = ? AND timeframe = ? AND aggregate = ? AND currency = ?
+    AND token = ?
+"""
+
+_INSERT_ENVELOPE = """
+INSERT OR REPLACE INTO envelopes (
+    network, pool, timeframe, aggregate, currency, token, document
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_COVERAGE = """
+INSERT INTO coverage (
+    network, pool, timeframe, aggregate, currency, token, start, "end"
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class OHLCVStore:
+    """Persistent SQLite store for closed OHLCV candles.
+
+    Candles are keyed by series (network, pool, timeframe, aggregate, currency,
+    token) and timestamp, the primary key doubles as the time index. The store also
+    records which time ranges have been fetched, so periods without trades are not
+    requested again, and the response envelope (`data` id, type and `meta`) of each
+    series. Only closed candles are stored since they never change.
+
+    The database runs in WAL mode: many processes can read concurrently while one
+    writes. Each thread uses its own connection, `close()` closes all of them, e.g.
+    those opened on executor threads by `AsyncGeckoTerminalAPI`.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], timeout: float = 30.0) -> None:
+        """
+        Args:
+        ----
+            path: Path of the SQLite database file, created if missing
+            timeout: Seconds to wait for a lock held by another writer
+        """
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        self._local = threading.local()
+        # Every open connection, so close() reaches those of other threads
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Used by its thread only, but closed by whichever thread calls close()
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def get(self, key: SeriesKey, start: int, end: int) -> list[list]:
+        """Stored candles of a series within [start, end], newest first"""
+        rows = self._connection().execute(_SELECT_CANDLES, (*key, start, end))
+        return [list(row) for row in rows]
+
+    def missing(self, key: SeriesKey, start: int, end: int) -> list[tuple[int, int]]:
+        """Sub-ranges of [start, end] that have not been fetched yet, oldest first"""
+        interval = candle_interval(key[2], key[3])
+        gaps = []
+        cursor = start
+        for covered_start, covered_end in self._coverage(self._connection(), key):
+            if covered_end < cursor:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start - 1))
+            cursor = max(cursor, covered_end + interval)
+        if cursor <= end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def put(
+        self,
+        key: SeriesKey,
+        candles: list[list],
+        covered: list[tuple[int, int]],
+        now: int | None = None,
+    ) -> None:
+        """Store the closed candles of a series and mark time ranges as fetched
+
+        Args:
+        ----
+            key: Series the candles belong to
+            candles: [timestamp, open, high, low, close, volume] candles
+            covered: (start, end) ranges the candles were fetched for, candles
+                missing from them are treated as periods without trades
+            now: Current time in seconds since epoch, defaults to the system clock
+        """
+        if now is None:
+            now = int(datetime.datetime.now(tz=datetime.UTC).timestamp())
+        interval = candle_interval(key[2], key[3])
+        # Newest candle that is closed and will not change anymore
+        last_closed = now - now % interval - interval
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                _INSERT_CANDLE,
+                [(*key, *candle[:6]) for candle in candles if candle[0] <= last_closed],
+            )
+            ranges = self._coverage(connection, key)
+            ranges += [(s, min(e, last_closed)) for s, e in covered if s <= last_closed]
+            connection.execute(_DELETE_COVERAGE, key)
+            connection.executemany(
+                _INSERT_COVERAGE,
+                [(*key, s, e) for s, e in _merge_ranges(ranges, interval)],
+            )
+
+    def envelope(self, key: SeriesKey) -> dict | None:
+        """Stored response of a series without candles, None if there is none"""
+        row = self._connection().execute(_SELECT_ENVELOPE, key).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put_envelope(self, key: SeriesKey, response: Mapping) -> None:
+        """Store the members of a `network_pool_ohlcv()` response besides candles"""
+        data = response.get("data") or {}
+        attributes = {**(data.get("attributes") or {}), "ohlcv_list": []}
+        envelope = {
+            **response,
+            "data": {**data, "attributes": attributes},
+        }
+        connection = self._connection()
+        with connection:
+            connection.execute(_INSERT_ENVELOPE, (*key, json.dumps(envelope)))
+
+    @staticmethod
+    def _coverage(
+        connection: sqlite3.Connection, key: SeriesKey
+    ) -> list[tuple[int, int]]:
+        return connection.execute(_SELECT_COVERAGE, key).fetchall()
+
+    def close(self) -> None:
+        """Close the connections of all threads, later calls open new ones"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
+
+
+def _merge_ranges(ranges: list[tuple[int, int]], gap: int) -> list[tuple[int, int]]:
+    """Merge overlapping ranges and ranges at most `gap` apart"""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + gap:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
@@ -0,0 +1,373 @@
+import abc
+import asyncio
+import datetime
+import time
+from collections import OrderedDict, deque
+from collections.abc import Coroutine, Iterable
+from types import TracebackType
+from typing import TYPE_CHECKING, Self, override
+
+from .limits import MAX_PAGE
+
+if TYPE_CHECKING:
+    from .async_api import AsyncGeckoTerminalAPI
+
+
+class _PollingStream(abc.ABC):
+    """Async iterator over event tuples put on a bounded queue by polling tasks
+
+    A poller that fails is reported to the consumer like a failed request: its
+    exception is raised by an iteration instead of the stream waiting forever.
+    """
+
+    def __init__(self, max_queue: int) -> None:
+        self.max_queue = max_queue
+        self._queue: asyncio.Queue[tuple | Exception] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._failure: Exception | None = None
+
+    @abc.abstractmethod
+    def _pollers(self, queue: asyncio.Queue[tuple | Exception]) -> list[Coroutine]:
+        """Coroutines putting events, or a request error, on `queue`"""
+
+    def start(self) -> None:
+        """Start polling, called by `async with` or the first iteration"""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(self.max_queue)
+        self._tasks = [asyncio.create_task(c) for c in self._pollers(self._queue)]
+        for task in self._tasks:
+            task.add_done_callback(self._poller_done)
+
+    def _poller_done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if not isinstance(exc, Exception):
+            return
+        if self._queue is not None and not self._queue.full():
+            self._queue.put_nowait(exc)
+        else:
+            # The consumer is not waiting on a full queue, the next iteration
+            # raises it ahead of the queued events
+            self._failure = exc
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> tuple:
+        self.start()
+        if self._queue is None:
+            raise StopAsyncIteration
+        if self._failure is not None:
+            failure, self._failure = self._failure, None
+            raise failure
+        item = await self._queue.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    @property
+    def queued(self) -> int:
+        """Number of events waiting for the consumer"""
+        return 0 if self._queue is None else self._queue.qsize()
+
+    def close(self) -> None:
+        """Stop polling"""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class TradeStream(_PollingStream):
+    """Async iterator over new trades of one or many pools.
+
+    Every pool is polled with `network_pool_trades()` by its own task. Trades are
+    de-duplicated by id (or tx hash) against a bounded per-pool seen-set and new
+    ones are put, oldest first, on a bounded queue as (network, pool address,
+    trade) tuples. When the consumer falls behind
+    the queue fills up and polling pauses until there is room again.
+
+    The poll interval adapts per pool: it halves while new trades arrive, drops to
+    `min_interval` when a whole batch was new (trades may have been missed) and
+    grows by `backoff` while the pool is quiet, up to `max_interval`. A failed poll
+    is raised by the next iteration and the pool is polled again after
+    `max_interval`, so a consumer catching the error keeps following every pool.
+
+    ```python
+    async with TradeStream(client, [("eth", pool_address)]) as stream:
+        async for network, pool_address, trade in stream:
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncGeckoTerminalAPI",
+        pools: Iterable[tuple[str, str]],
+        *,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        max_seen: int = 1000,
+        max_queue: int = 1000,
+        trade_volume_in_usd_greater_than: int | None = 0,
+        include_recent: bool = False,
+    ) -> None:
+        """
+        Args:
+        ----
+            client: Client used for polling
+            pools: (network, pool address) pairs to follow
+            min_interval: Shortest seconds between polls of a pool
+            max_interval: Longest seconds between polls of a pool
+            backoff: Factor the interval grows by after a poll without new trades
+            max_seen: Trade ids remembered per pool, should exceed the number of
+                trades one `network_pool_trades()` call returns (300)
+            max_queue: Trades buffered for the consumer before polling pauses
+            trade_volume_in_usd_greater_than: Minimum trade volume in USD
+            include_recent: Also yield the trades returned by the first poll
+                (default False, only trades seen after the stream started)
+        """
+        super().__init__(max_queue)
+        self.client = client
+        self.pools = list(dict.fromkeys(pools))
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_seen = max_seen
+        self.trade_volume_in_usd_greater_than = trade_volume_in_usd_greater_than
+        self.include_recent = include_recent
+        self.intervals = dict.fromkeys(self.pools, min_interval)
+        self._seen: dict[tuple[str, str], OrderedDict[str, None]] = {
+            pool: OrderedDict() for pool in self.pools
+        }
+
+    @override
+    def _pollers(self, queue: asyncio.Queue[tuple | Exception]) -> list[Coroutine]:
+        return [self._poll(queue, *pool) for pool in self.pools]
+
+    async def _poll(
+        self,
+        queue: asyncio.Queue[tuple | Exception],
+        network: str,
+        pool_address: str,
+    ) -> None:
+        pool = (network, pool_address)
+        first = True
+        while True:
+            try:
+                response = await self.client.network_pool_trades(
+                    network, pool_address, self.trade_volume_in_usd_greater_than
+                )
+            except Exception as exc:  # noqa: BLE001
+                # Reported to the consumer, the pool is polled again after backing off
+                await queue.put(exc)
+                self.intervals[pool] = self.max_interval
+                await asyncio.sleep(self.intervals[pool])
+                continue
+            trades = response.get("data") or []
+            new = self._new_trades(pool, trades)
+            if not first or self.include_recent:
+                for trade in new:
+                    await queue.put((network, pool_address, trade))
+            if first:
+                first = False
+            elif new and len(new) == len(trades):
+                self.intervals[pool] = self.min_interval
+            elif new:
+                self.intervals[pool] = max(self.min_interval, self.intervals[pool] / 2)
+            else:
+                self.intervals[pool] = min(
+                    self.max_interval, self.intervals[pool] * self.backoff
+                )
+            await asyncio.sleep(self.intervals[pool])
+
+    def _new_trades(self, pool: tuple[str, str], trades: list[dict]) -> list[dict]:
+        """Unseen trades oldest first, the API lists the newest first"""
+        seen = self._seen[pool]
+        new = []
+        for trade in reversed(trades):
+            key = trade.get("id") or (trade.get("attributes") or {}).get("tx_hash")
+            if key is None or key in seen:
+                continue
+            seen[key] = None
+            if len(seen) > self.max_seen:
+                seen.popitem(last=False)
+            new.append(trade)
+        return new
+
+
+def _created_at(pool: dict) -> float:
+    created_at = pool.get("attributes", {}).get("pool_created_at")
+    if not created_at:
+        return 0.0
+    return datetime.datetime.fromisoformat(created_at).timestamp()
+
+
+class NewPoolWatcher(_PollingStream):
+    """Async iterator over pools created after the watcher started.
+
+    Each network is polled with `network_new_pools()` by its own task, with
+    `networks=None` a single task polls `new_pools()` across all networks. A cursor
+    on the newest `pool_created_at` seen per network decides how much to fetch:
+    page 1 only, unless every pool on it is newer than the cursor, in which case
+    the next page is fetched too, up to `max_pages`. Pools are de-duplicated by id
+    and yielded oldest first as (network, pool, time-to-detect) tuples, the
+    time-to-detect being the seconds from `pool_created_at` to detection. `stats`
+    summarizes it over recent pools. A failed poll is raised by the next iteration
+    and the network is polled again, backing off up to `max_interval`.
+
+    ```python
+    async with NewPoolWatcher(client, ["eth", "solana"]) as watcher:
+        async for network, pool, time_to_detect in watcher:
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncGeckoTerminalAPI",
+        networks: Iterable[str] | None = None,
+        *,
+        interval: float = 10.0,
+        max_interval: float = 60.0,
+        max_pages: int = MAX_PAGE,
+        max_seen: int = 10_000,
+        max_queue: int = 1000,
+        include: list | None = None,
+        include_recent: bool = False,
+    ) -> None:
+        """
+        Args:
+        ----
+            client: Client used for polling
+            networks: Network ids to watch, if None all networks via `new_pools()`
+            interval: Seconds between polls of a network
+            max_interval: Longest seconds between polls while they fail, the wait
+                doubles from `interval` after every failed poll
+            max_pages: Most pages fetched by one poll
+            max_seen: Pool ids remembered per network
+            max_queue: Pools buffered for the consumer before polling pauses
+            include: Related resources to include e.g. base_token, quote_token,
+                dex, network (default all)
+            include_recent: Also yield the pools returned by the first poll
+                (default False, only pools created after the watcher started)
+        """
+        super().__init__(max_queue)
+        self.client = client
+        self.networks = None if networks is None else list(dict.fromkeys(networks))
+        self.interval = interval
+        self.max_interval = max_interval
+        self.max_pages = max_pages
+        self.max_seen = max_seen
+        self.include = include
+        self.include_recent = include_recent
+        self.cursors: dict[str | None, float] = {}
+        self._time_to_detect: deque[float] = deque(maxlen=1000)
+        self._detected = 0
+
+    @override
+    def _pollers(self, queue: asyncio.Queue[tuple | Exception]) -> list[Coroutine]:
+        networks = [None] if self.networks is None else self.networks
+        return [self._poll(queue, network) for network in networks]
+
+    async def _fetch_page(self, network: str | None, page: int) -> list[dict]:
+        if network is None:
+            response = await self.client.new_pools(include=self.include, page=page)
+        else:
+            response = await self.client.network_new_pools(
+                network, include=self.include, page=page
+            )
+        return response.get("data") or []
+
+    async def _poll(
+        self, queue: asyncio.Queue[tuple | Exception], network: str | None
+    ) -> None:
+        seen: OrderedDict[str, None] = OrderedDict()
+        first = True
+        wait = self.interval
+        while True:
+            try:
+                new = await self._new_pools(network, seen)
+            except Exception as exc:  # noqa: BLE001
+                # Reported to the consumer, polling goes on after backing off
+                await queue.put(exc)
+                wait = min(self.max_interval, wait * 2)
+                await asyncio.sleep(wait)
+                continue
+            wait = self.interval
+            detected_at = time.time()
+            if not first or self.include_recent:
+                for created_at, pool in new:
+                    time_to_detect = max(0.0, detected_at - created_at)
+                    self._time_to_detect.append(time_to_detect)
+                    self._detected += 1
+                    # The linkage data is null for pools without a network
+                    linkage = (
+                        (pool.get("relationships") or {}).get("network") or {}
+                    ).get("data") or {}
+                    pool_network = linkage.get("id")
+                    await queue.put(
+                        (pool_network or network or "", pool, time_to_detect)
+                    )
+            first = False
+            await asyncio.sleep(self.interval)
+
+    async def _new_pools(
+        self, network: str | None, seen: OrderedDict[str, None]
+    ) -> list[tuple[float, dict]]:
+        """Unseen pools since the cursor as (created at, pool), oldest first"""
+        cursor = self.cursors.get(network)
+        new = []
+        for page in range(1, self.max_pages + 1):
+            pools = await self._fetch_page(network, page)
+            oldest = None
+            for pool in pools:
+                created_at = _created_at(pool)
+                oldest = created_at if oldest is None else min(oldest, created_at)
+                pool_id = pool.get("id")
+                if pool_id is None or pool_id in seen:
+                    continue
+                if cursor is not None and created_at < cursor:
+                    continue
+                seen[pool_id] = None
+                if len(seen) > self.max_seen:
+                    seen.popitem(last=False)
+                new.append((created_at, pool))
+            # Fetch further pages only while the cursor has fallen off this one
+            if cursor is None or oldest is None or oldest <= cursor:
+                break
+        if new:
+            self.cursors[network] = max(cursor or 0.0, *(c for c, _ in new))
+        new.sort(key=lambda item: item[0])
+        return new
+
+    @property
+    def stats(self) -> dict:
+        """Pools detected and time-to-detect in seconds over the last 1000 pools"""
+        latencies = sorted(self._time_to_detect)
+        return {
+            "detected": self._detected,
+            "time_to_detect_last": (
+                self._time_to_detect[-1] if self._time_to_detect else None
+            ),
+            "time_to_detect_mean": (
+                sum(latencies) / len(latencies) if latencies else None
+            ),
+            "time_to_detect_p95": (
+                latencies[int(0.95 * (len(latencies) - 1))] if latencies else None
+            ),
+        }
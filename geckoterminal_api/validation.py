@@ -18,9 +18,9 @@ def validate(**limit_kwargs):  # pyright: ignore [reportMissingParameterType]
                     GeckoTerminalParameterWarning,
                     stacklevel=2,
                 )
-            if "include" in kwargs and not set(kwargs["include"]).issubset(
-                limit_kwargs["include_list"]
-            ):
+            if kwargs.get("include") is not None and not set(
+                kwargs["include"]
+            ).issubset(limit_kwargs["include_list"]):
                 warnings.warn(
                     f"Include list can have: {limit_kwargs['include_list']}",
                     GeckoTerminalParameterWarning,
@@ -28,6 +28,7 @@ def validate(**limit_kwargs):  # pyright: ignore [reportMissingParameterType]
                 )
             if (
                 "addresses" in kwargs
+                and "max_addresses" in limit_kwargs
                 and (n_addr := len(kwargs["addresses"])) > limit_kwargs["max_addresses"]
             ):
                 warnings.warn(
@@ -0,0 +1,45 @@
+import json
+from collections.abc import Iterable
+
+INTERVAL = 60
+
+
+class FakeOHLCV:
+    """Stand-in for a client's `_request` serving minute candles at `timestamps`
+
+    Like the API, a request returns up to `limit` candles at or before
+    `before_timestamp`, newest first. With `overlap` that many candles past the
+    window are returned as well, like boundary candles repeated across windows.
+    """
+
+    def __init__(self, timestamps: Iterable[int], overlap: int = 0) -> None:
+        self.timestamps = set(timestamps)
+        self.overlap = overlap
+        # (before_timestamp, limit) of every request
+        self.requests: list[tuple[int, int]] = []
+
+    def __call__(self, endpoint: str, params: dict | None = None) -> bytes:
+        assert params is not None
+        assert endpoint.endswith("/ohlcv/minute")
+        before, limit = params["before_timestamp"], params["limit"]
+        self.requests.append((before, limit))
+        top = before - before % INTERVAL
+        candles = [
+            [t, 1.0, 2.0, 0.5, 1.5, 10.0]
+            for t in range(top, top - (limit + self.overlap) * INTERVAL, -INTERVAL)
+            if t in self.timestamps
+        ]
+        return json.dumps(
+            {
+                "data": {
+                    "id": "ohlcv",
+                    "type": "ohlcv_request_response",
+                    "attributes": {"ohlcv_list": candles},
+                },
+                "meta": {"base": {"symbol": "WETH"}, "quote": {"symbol": "USDC"}},
+            }
+        ).encode()
+
+    async def fetch(self, endpoint: str, params: dict | None = None) -> bytes:
+        """Async variant for `AsyncGeckoTerminalAPI._request`"""
+        return self(endpoint, params)
@@ -0,0 +1,67 @@
+import json
+import threading
+import time
+
+import aiohttp
+import pytest
+
+from geckoterminal_api import AsyncGeckoTerminalAPI, GeckoTerminalAPI
+from geckoterminal_api.exceptions import GeckoTerminalAPIError
+
+
+@pytest.fixture
+def threads() -> set[int]:
+    return set()
+
+
+@pytest.fixture
+def gt(monkeypatch: pytest.MonkeyPatch, threads: set[int]) -> GeckoTerminalAPI:
+    client = GeckoTerminalAPI(max_concurrency=8)
+
+    def request(endpoint: str, _params: dict | None = None) -> bytes:
+        threads.add(threading.get_ident())
+        if endpoint.endswith("/bad"):
+            raise GeckoTerminalAPIError(status=404, err="Not Found")
+        # Later calls finish first
+        time.sleep(0.05 if endpoint.endswith("/0") else 0.01)
+        return json.dumps({"data": {"endpoint": endpoint}}).encode()
+
+    monkeypatch.setattr(client, "_request", request)
+    return client
+
+
+def test_batch_returns_results_in_order(
+    gt: GeckoTerminalAPI, threads: set[int]
+) -> None:
+    calls = [
+        ("network_pool_address", {"network": "eth", "address": str(i)})
+        for i in range(20)
+    ]
+    calls.append(("network_pool_address", {"network": "eth", "address": "bad"}))
+    calls.append(("_get", {"endpoint": "/networks"}))
+    results = gt.batch(calls)
+    assert [r["data"]["endpoint"] for r in results[:20]] == [
+        f"/networks/eth/pools/{i}" for i in range(20)
+    ]
+    assert isinstance(results[20], GeckoTerminalAPIError)
+    assert isinstance(results[21], ValueError)
+    assert len(threads) > 1
+
+
+def test_batch_as_completed_streams_results(gt: GeckoTerminalAPI) -> None:
+    calls = [
+        ("network_pool_address", {"network": "eth", "address": str(i)})
+        for i in range(4)
+    ]
+    indexes = [index for index, _ in gt.batch_as_completed(calls)]
+    assert sorted(indexes) == [0, 1, 2, 3]
+    assert indexes[-1] == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_session_is_not_closed() -> None:
+    session = aiohttp.ClientSession()
+    client = AsyncGeckoTerminalAPI(session=session)
+    await client.close()
+    assert not session.closed
+    await session.close()
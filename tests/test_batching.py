@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+import pytest
+
+from geckoterminal_api import AsyncGeckoTerminalAPI
+from geckoterminal_api.batching import AsyncBatcher
+from geckoterminal_api.exceptions import GeckoTerminalAPIError
+from geckoterminal_api.limits import MAX_ADDRESSES
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_batched_per_group() -> None:
+    batches = []
+
+    async def fetch_batch(group: tuple, addresses: list[str]) -> dict[str, dict]:
+        batches.append((group, addresses))
+        return {a: {"data": {"group": group[0], "address": a}} for a in addresses}
+
+    batcher = AsyncBatcher(fetch_batch, window=0.01)
+    n_lookups = MAX_ADDRESSES + 5
+    results = await asyncio.gather(
+        *(batcher.load(("eth",), f"0x{i}") for i in range(n_lookups)),
+        batcher.load(("solana",), "So1"),
+        batcher.load(("eth",), f"0x{n_lookups - 1}"),
+    )
+    assert sorted(len(addresses) for _, addresses in batches) == [1, 5, MAX_ADDRESSES]
+    assert results[3] == {"data": {"group": "eth", "address": "0x3"}}
+    assert results[-2] == {"data": {"group": "solana", "address": "So1"}}
+    assert results[-1] is results[n_lookups - 1]
+
+
+@pytest.mark.asyncio
+async def test_missing_addresses_and_errors() -> None:
+    async def fetch_batch(_group: tuple, addresses: list[str]) -> dict[str, dict]:
+        if "0xbad" in addresses:
+            msg = "boom"
+            raise RuntimeError(msg)
+        return {"0xABC": {"data": 1}}
+
+    batcher = AsyncBatcher(fetch_batch, window=0.01)
+    found, missing = await asyncio.gather(
+        batcher.load(("eth",), "0xabc"),
+        batcher.load(("eth",), "0xdef"),
+        return_exceptions=True,
+    )
+    assert found == {"data": 1}
+    assert isinstance(missing, GeckoTerminalAPIError)
+    assert missing.status == 404  # noqa: PLR2004
+    with pytest.raises(RuntimeError, match="boom"):
+        await batcher.load(("eth",), "0xbad")
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_in_flight_batches() -> None:
+    started = asyncio.Event()
+
+    async def fetch_batch(_group: tuple, _addresses: list[str]) -> dict[str, dict]:
+        started.set()
+        await asyncio.sleep(60)
+        return {}
+
+    batcher = AsyncBatcher(fetch_batch, window=0.001)
+    running = asyncio.ensure_future(batcher.load(("eth",), "0xa"))
+    await started.wait()
+    # A full batch is flushed at once, its task has not started when closed
+    batcher.max_batch = 1
+    queued = asyncio.ensure_future(batcher.load(("eth",), "0xb"))
+    await asyncio.sleep(0)
+    batcher.close()
+    for lookup in (running, queued):
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(lookup, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_client_batches_pool_lookups(monkeypatch: pytest.MonkeyPatch) -> None:
+    endpoints = []
+
+    async def request(endpoint: str, _params: dict | None = None) -> bytes:
+        endpoints.append(endpoint)
+        addresses = [a for a in endpoint.rsplit("/", 1)[1].split(",") if a != "0xc"]
+        return json.dumps(
+            {
+                "data": [
+                    {
+                        "type": "pool",
+                        "id": f"eth_{a}",
+                        "attributes": {"address": a},
+                        "relationships": {
+                            "base_token": {"data": {"type": "token", "id": f"t{a}"}}
+                        },
+                    }
+                    for a in addresses
+                ],
+                "included": [{"type": "token", "id": f"t{a}"} for a in addresses],
+            }
+        ).encode()
+
+    gt = AsyncGeckoTerminalAPI(batch_window=0.01)
+    monkeypatch.setattr(gt, "_request", request)
+    a, b, c = await asyncio.gather(
+        gt.network_pool_address("eth", "0xa"),
+        gt.network_pool_address("eth", "0xb"),
+        gt.network_pool_address("eth", "0xc"),
+        return_exceptions=True,
+    )
+    await gt.close()
+    assert endpoints == ["/networks/eth/pools/multi/0xa,0xb,0xc"]
+    assert isinstance(a, dict)
+    assert a["data"]["id"] == "eth_0xa"
+    assert a["included"] == [{"type": "token", "id": "t0xa"}]
+    assert isinstance(b, dict)
+    assert b["data"]["id"] == "eth_0xb"
+    assert isinstance(c, GeckoTerminalAPIError)
+    assert c.status == 404  # noqa: PLR2004
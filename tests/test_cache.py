@@ -0,0 +1,140 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from geckoterminal_api import AsyncGeckoTerminalAPI, GeckoTerminalAPIError
+from geckoterminal_api.cache import ResponseCache, request_key
+
+TTL = 0.01
+N_CALLERS = 10
+
+
+def test_request_key_is_normalized() -> None:
+    assert request_key("/networks", {"page": 1, "include": "dex"}) == request_key(
+        "/networks", {"include": "dex", "page": 1, "network": None}
+    )
+    assert request_key("/networks") == "/networks"
+
+
+def test_ttl_patterns() -> None:
+    cache = ResponseCache(ttls={"/networks/*/pools/*/ohlcv/*": 60}, default_ttl=5)
+    assert cache.ttl_for("/networks/eth/pools/0xabc/ohlcv/day") == 60  # noqa: PLR2004
+    assert cache.ttl_for("/networks/eth/pools/0xabc/trades") == 0
+    assert cache.ttl_for("/networks/eth/dexes") == 3600  # noqa: PLR2004
+    assert cache.ttl_for("/networks/eth/dexes/uniswap/pools") == cache.default_ttl
+
+
+def test_hit_miss_and_expiry() -> None:
+    cache = ResponseCache(default_ttl=0.05, default_stale_ttl=0)
+    assert cache.get("/a") is None
+    cache.set("/a", "/a", {"data": 1}, size=10)
+    assert cache.get("/a") == {"data": 1}
+    time.sleep(0.06)
+    assert cache.get("/a") is None
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 2  # noqa: PLR2004
+    assert len(cache) == 0
+
+
+def test_uncached_endpoints() -> None:
+    cache = ResponseCache()
+    cache.set("/x", "/networks/eth/pools/0xabc/trades", {"data": []}, size=10)
+    assert cache.get("/x") is None
+
+
+def test_lru_eviction_by_count_and_bytes() -> None:
+    cache = ResponseCache(max_entries=2, max_bytes=100)
+    cache.set("/a", "/a", {}, size=10)
+    cache.set("/b", "/b", {}, size=10)
+    cache.get("/a")
+    cache.set("/c", "/c", {}, size=10)
+    assert cache.get("/b") is None
+    assert cache.get("/a") is not None
+    cache.set("/d", "/d", {}, size=95)
+    assert len(cache) == 1
+    assert cache.stats["bytes"] == 95  # noqa: PLR2004
+    assert cache.stats["evictions"] == 3  # noqa: PLR2004
+
+
+def test_stale_lookup() -> None:
+    cache = ResponseCache(default_ttl=0.05, stale_ttls={"/networks/*/pools": 0.1})
+    cache.set("/a", "/networks/eth/pools", {"data": 1}, size=10)
+    cache.set("/b", "/networks/eth/new_pools", {"data": 2}, size=10)
+    assert cache.lookup("/a") == ({"data": 1}, True)
+    time.sleep(0.06)
+    assert cache.get("/a") is None
+    assert cache.lookup("/a") == ({"data": 1}, False)
+    assert cache.lookup("/b") == ({"data": 2}, False)
+    time.sleep(0.1)
+    assert cache.lookup("/a") == (None, False)
+    assert cache.stats["stale_hits"] == 2  # noqa: PLR2004
+
+
+def stale_client() -> AsyncGeckoTerminalAPI:
+    """Client whose /networks responses go stale after `TTL`"""
+    return AsyncGeckoTerminalAPI(
+        cache=ResponseCache(ttls={"/networks": TTL}), stale_while_revalidate=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    cancelled = []
+    release = asyncio.Event()
+
+    async def request(*_: object) -> bytes:
+        calls.append(len(calls))
+        if len(calls) > 1:
+            try:
+                await release.wait()
+            except asyncio.CancelledError:
+                cancelled.append(len(calls))
+                raise
+        return json.dumps({"data": len(calls)}).encode()
+
+    gt = stale_client()
+    monkeypatch.setattr(gt, "_request", request)
+    assert await gt.networks() == {"data": 1}
+    await asyncio.sleep(2 * TTL)
+
+    # Served stale without waiting for the refresh, which is started once
+    stale = await asyncio.wait_for(
+        asyncio.gather(*(gt.networks() for _ in range(N_CALLERS))), timeout=1
+    )
+    assert stale == [{"data": 1}] * N_CALLERS
+    await asyncio.sleep(0)
+    assert len(calls) == 2  # noqa: PLR2004
+
+    await gt.close()
+    await asyncio.sleep(0)
+    assert cancelled == [2]
+
+
+@pytest.mark.asyncio
+async def test_stale_served_after_failed_refresh(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+
+    async def request(*_: object) -> bytes:
+        calls.append(len(calls))
+        if len(calls) == 2:  # noqa: PLR2004
+            raise GeckoTerminalAPIError(status=503, err="Service Unavailable")
+        return json.dumps({"data": len(calls)}).encode()
+
+    gt = stale_client()
+    monkeypatch.setattr(gt, "_request", request)
+    await gt.networks()
+    await asyncio.sleep(2 * TTL)
+    assert await gt.networks() == {"data": 1}
+    await asyncio.sleep(TTL)
+    # The refresh failed, the stale entry is still served and refreshed again
+    assert len(calls) == 2  # noqa: PLR2004
+    assert await gt.networks() == {"data": 1}
+    await asyncio.sleep(TTL / 2)
+    assert len(calls) == 3  # noqa: PLR2004
+    assert await gt.networks() == {"data": 3}
+    await gt.close()
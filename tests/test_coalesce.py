@@ -0,0 +1,83 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from geckoterminal_api.coalesce import AsyncSingleFlight, SingleFlight
+
+N_CALLERS = 20
+
+
+def test_threads_share_one_call() -> None:
+    flight = SingleFlight()
+    calls = 0
+    lock = threading.Lock()
+
+    def fetch() -> dict:
+        nonlocal calls
+        with lock:
+            calls += 1
+        time.sleep(0.1)
+        return {"data": 1}
+
+    with ThreadPoolExecutor(N_CALLERS) as pool:
+        results = list(pool.map(lambda _: flight.do("key", fetch), range(N_CALLERS)))
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+    assert len(flight) == 0
+
+
+def test_threads_share_exception() -> None:
+    flight = SingleFlight()
+
+    def fetch() -> dict:
+        time.sleep(0.1)
+        msg = "boom"
+        raise ValueError(msg)
+
+    def call(_: int) -> str:
+        try:
+            flight.do("key", fetch)
+        except ValueError as exc:
+            return str(exc)
+        return "no error"
+
+    with ThreadPoolExecutor(N_CALLERS) as pool:
+        assert set(pool.map(call, range(N_CALLERS))) == {"boom"}
+
+
+@pytest.mark.asyncio
+async def test_tasks_share_one_call() -> None:
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    async def fetch() -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"data": 1}
+
+    results = await asyncio.gather(
+        *(flight.do("key", fetch) for _ in range(N_CALLERS)),
+        flight.do("other", fetch),
+    )
+    assert calls == 2  # noqa: PLR2004
+    assert all(r is results[0] for r in results[:N_CALLERS])
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others() -> None:
+    flight = AsyncSingleFlight()
+
+    async def fetch() -> dict:
+        await asyncio.sleep(0.05)
+        return {"data": 1}
+
+    first = asyncio.create_task(flight.do("key", fetch))
+    second = asyncio.create_task(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == {"data": 1}
@@ -0,0 +1,45 @@
+import importlib
+import json
+
+import pytest
+
+from geckoterminal_api import GeckoTerminalAPI
+from geckoterminal_api.decoding import get_json_loads, stdlib_loads
+
+BODY = json.dumps(
+    {"data": {"attributes": {"price": "1.5", "name": "Ünïcode"}}}
+).encode()
+
+
+@pytest.mark.parametrize("name", [None, "orjson", "msgspec", "json"])
+def test_decoders_agree(name: str | None) -> None:
+    try:
+        loads = get_json_loads(name)
+    except ValueError:
+        pytest.skip(f"{name} is not installed")
+    assert loads(BODY) == json.loads(BODY)
+
+
+def test_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    def import_module(name: str) -> None:
+        raise ImportError(name)
+
+    monkeypatch.setattr(importlib, "import_module", import_module)
+    assert get_json_loads() is stdlib_loads
+    with pytest.raises(ValueError, match="not available"):
+        get_json_loads("orjson")
+    with pytest.raises(ValueError, match="not available"):
+        get_json_loads("yaml")
+
+
+def test_client_uses_decoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    bodies = []
+
+    def loads(body: bytes) -> dict:
+        bodies.append(body)
+        return {"data": []}
+
+    gt = GeckoTerminalAPI(json_loads=loads)
+    monkeypatch.setattr(gt, "_request", lambda *_: b'{"data": [1]}')
+    assert gt.networks() == {"data": []}
+    assert bodies == [b'{"data": [1]}']
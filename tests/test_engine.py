@@ -0,0 +1,32 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from geckoterminal_api import AsyncGeckoTerminalAPI, GeckoTerminalAPI
+from geckoterminal_api.engine import AsyncEngine
+
+
+def test_sync_calls_share_the_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = AsyncGeckoTerminalAPI(coalesce_requests=True)
+    requests = []
+
+    async def request(endpoint: str, _params: dict | None = None) -> bytes:
+        requests.append(threading.current_thread().name)
+        await asyncio.sleep(0.05)
+        return json.dumps({"data": {"endpoint": endpoint}}).encode()
+
+    monkeypatch.setattr(client, "_request", request)
+    with AsyncEngine(client) as engine:
+        gt = GeckoTerminalAPI(engine=engine)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: gt.network_pool_address("eth", "0x1"), range(8))
+            )
+        assert results[0] == {"data": {"endpoint": "/networks/eth/pools/0x1"}}
+        # Identical calls from all threads were coalesced on the engine's loop
+        assert requests == ["geckoterminal-engine"]
+    with pytest.raises(RuntimeError, match="closed"):
+        gt.network_pool_address("eth", "0x1")
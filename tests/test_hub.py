@@ -0,0 +1,87 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from geckoterminal_api.exceptions import GeckoTerminalAPIError
+from geckoterminal_api.hub import PollingHub
+
+
+class FakePricesClient:
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+
+    async def network_addresses_token_price(
+        self, network: str, addresses: list[str]
+    ) -> dict:
+        if network == "bad":
+            raise GeckoTerminalAPIError(status=404, err=network)
+        self.calls[network] += 1
+        return {"data": {"addresses": addresses, "poll": self.calls[network]}}
+
+
+@pytest.mark.asyncio
+async def test_one_poll_per_topic() -> None:
+    client = FakePricesClient()
+    hub = PollingHub(client, interval=0.01)
+    subscriptions = [
+        hub.subscribe("network_addresses_token_price", network="eth", addresses=["0x1"])
+        for _ in range(5)
+    ]
+    other = hub.subscribe(
+        "network_addresses_token_price", network="solana", addresses=["0x1"]
+    )
+    updates = [await anext(s) for s in subscriptions]
+    assert {u["data"]["poll"] for u in updates} == {1}
+    await asyncio.sleep(0.05)
+    assert hub.stats["topics"] == 2  # noqa: PLR2004
+    # Polls per topic do not grow with the number of subscribers
+    assert abs(client.calls["eth"] - client.calls["solana"]) <= 1
+    for subscription in [*subscriptions, other]:
+        subscription.close()
+    assert hub.stats == {"topics": 0, "subscribers": 0, "dropped": 0}
+    calls = client.calls.total()
+    await asyncio.sleep(0.03)
+    assert client.calls.total() == calls
+
+
+@pytest.mark.asyncio
+async def test_slow_subscribers_drop_or_coalesce() -> None:
+    client = FakePricesClient()
+    hub = PollingHub(client, interval=0.005, max_queue=3)
+    dropping = hub.subscribe(
+        "network_addresses_token_price", network="eth", addresses=["0x1"]
+    )
+    coalescing = hub.subscribe(
+        "network_addresses_token_price",
+        network="eth",
+        addresses=["0x1"],
+        overflow="coalesce",
+    )
+    await asyncio.sleep(0.1)
+    polls = client.calls["eth"]
+    assert dropping.queue.qsize() == 3  # noqa: PLR2004
+    assert [(await anext(dropping))["data"]["poll"] for _ in range(3)] == [
+        polls - 2,
+        polls - 1,
+        polls,
+    ]
+    coalesced = [coalescing.queue.get_nowait() for _ in range(coalescing.queue.qsize())]
+    assert len(coalesced) <= 3  # noqa: PLR2004
+    assert coalesced[-1]["data"]["poll"] == polls
+    assert dropping.dropped == polls - 3
+    hub.close()
+
+
+@pytest.mark.asyncio
+async def test_errors_are_delivered_and_polling_continues() -> None:
+    hub = PollingHub(FakePricesClient(), interval=0.01)
+    subscription = hub.subscribe(
+        "network_addresses_token_price", network="bad", addresses=["0x1"]
+    )
+    for _ in range(2):
+        with pytest.raises(GeckoTerminalAPIError):
+            await anext(subscription)
+    with pytest.raises(ValueError, match="not a client method"):
+        hub.subscribe("_get", endpoint="/networks")
+    hub.close()
@@ -0,0 +1,149 @@
+from geckoterminal_api import Pool, Token
+from geckoterminal_api.jsonapi import (
+    hydrate,
+    index_included,
+    merge_responses,
+    resolve,
+    split_by_address,
+)
+from geckoterminal_api.models import to_models
+
+
+def test_merge_list_data() -> None:
+    first = {
+        "data": [{"type": "pool", "id": "a"}],
+        "included": [{"type": "dex", "id": "uni"}, {"type": "token", "id": "weth"}],
+    }
+    second = {
+        "data": [{"type": "pool", "id": "b"}],
+        "included": [{"type": "token", "id": "weth"}, {"type": "token", "id": "usdc"}],
+    }
+    merged = merge_responses([first, second])
+    assert [d["id"] for d in merged["data"]] == ["a", "b"]
+    assert [i["id"] for i in merged["included"]] == ["uni", "weth", "usdc"]
+
+
+def test_merge_object_data() -> None:
+    def prices(values: dict) -> dict:
+        return {
+            "data": {
+                "id": "id",
+                "type": "simple_token_price",
+                "attributes": {"token_prices": values},
+            }
+        }
+
+    merged = merge_responses([prices({"0xa": "1"}), prices({"0xb": "2"})])
+    assert merged["data"]["attributes"]["token_prices"] == {"0xa": "1", "0xb": "2"}
+    assert "included" not in merged
+
+
+def test_merge_nothing() -> None:
+    assert merge_responses([]) == {"data": []}
+
+
+def test_split_by_address() -> None:
+    def pool(address: str, token: str) -> dict:
+        return {
+            "type": "pool",
+            "id": f"eth_{address}",
+            "attributes": {"address": address},
+            "relationships": {
+                "base_token": {"data": {"type": "token", "id": token}},
+                "dex": {"data": {"type": "dex", "id": "uni"}},
+            },
+        }
+
+    response = {
+        "data": [pool("0xa", "weth"), pool("0xb", "usdc")],
+        "included": [
+            {"type": "token", "id": "weth"},
+            {"type": "token", "id": "usdc"},
+            {"type": "dex", "id": "uni"},
+        ],
+    }
+    documents = split_by_address(response)
+    assert documents["0xa"]["data"]["id"] == "eth_0xa"
+    assert [i["id"] for i in documents["0xa"]["included"]] == ["weth", "uni"]
+    assert [i["id"] for i in documents["0xb"]["included"]] == ["usdc", "uni"]
+
+
+def _pool(address: str, base: str) -> dict:
+    return {
+        "type": "pool",
+        "id": f"eth_{address}",
+        "attributes": {"address": address},
+        "relationships": {
+            "base_token": {"data": {"type": "token", "id": base}},
+            "quote_token": {"data": {"type": "token", "id": "weth"}},
+            "dex": {"data": None},
+        },
+    }
+
+
+PAGES = [
+    {
+        "data": [_pool("0xa", "usdc")],
+        "included": [
+            {"type": "token", "id": "usdc", "attributes": {"symbol": "USDC"}},
+            {"type": "token", "id": "weth", "attributes": {"symbol": "WETH"}},
+        ],
+    },
+    {
+        "data": [_pool("0xb", "dai")],
+        "included": [{"type": "token", "id": "dai", "attributes": {"symbol": "DAI"}}],
+    },
+]
+
+
+def test_index_included() -> None:
+    index = index_included(PAGES)
+    assert list(index) == [("token", "usdc"), ("token", "weth"), ("token", "dai")]
+    assert index_included(PAGES[1]) == {("token", "dai"): PAGES[1]["included"][0]}
+
+
+def test_resolve() -> None:
+    index = index_included(PAGES)
+    pool = PAGES[1]["data"][0]
+    assert resolve(pool, "base_token", index) == PAGES[1]["included"][0]
+    assert resolve(pool, "dex", index) is None
+    assert resolve(pool, "network", index) is None
+    token = {
+        "type": "token",
+        "id": "weth",
+        "relationships": {
+            "top_pools": {
+                "data": [{"type": "pool", "id": "a"}, {"type": "token", "id": "dai"}]
+            }
+        },
+    }
+    assert resolve(token, "top_pools", index) == [PAGES[1]["included"][0]]
+
+
+def test_hydrate_across_pages() -> None:
+    pools = hydrate(PAGES)
+    assert [p["attributes"]["address"] for p in pools] == ["0xa", "0xb"]
+    # The quote token of the second page was included with the first
+    assert pools[1]["quote_token"]["attributes"]["symbol"] == "WETH"
+    assert pools[1]["base_token"]["attributes"]["symbol"] == "DAI"
+    assert pools[1]["dex"] is None
+    assert "base_token" not in PAGES[1]["data"][0]
+
+
+def test_hydrate_models() -> None:
+    pages = [to_models(page) for page in PAGES]
+    pool = pages[1]["data"][0]
+    assert isinstance(pool, Pool)
+    # Resolved within its own response, the quote token was included with page 1
+    assert isinstance(pool.base_token, Token)
+    assert pool.base_token.symbol == "DAI"
+    assert pool.quote_token is None
+    pools = hydrate(pages)
+    assert pools == [pages[0]["data"][0], pool]
+    assert pools[1] is not pool
+    assert isinstance(pools[1], Pool)
+    assert isinstance(pools[1].quote_token, Token)
+    assert pools[1].quote_token.symbol == "WETH"
+    assert pools[1].dex is None
+    # The models of the responses are left as they are
+    assert pool.quote_token is None
@@ -0,0 +1,119 @@
+import datetime
+import json
+
+import pytest
+
+from geckoterminal_api import OHLCV, GeckoTerminalAPI, Pool, Token, Trade
+from geckoterminal_api.models import to_models
+
+POOL = {
+    "id": "eth_0x60594a405d53811d3bc4766596efd80fd545a270",
+    "type": "pool",
+    "attributes": {
+        "address": "0x60594a405d53811d3bc4766596efd80fd545a270",
+        "name": "WETH / DAI 0.05%",
+        "pool_created_at": "2021-05-05T17:43:47Z",
+        "base_token_price_usd": "3401.25",
+        "reserve_in_usd": "12345678.9012",
+        "fdv_usd": None,
+        "price_change_percentage": {"m5": "0.1", "h24": "-2.5"},
+        "transactions": {"h1": {"buys": 3, "sells": 1}},
+        "locked_liquidity_percentage": "12.5",
+    },
+    "relationships": {
+        "base_token": {"data": {"id": "eth_0xc02a", "type": "token"}},
+        "quote_token": {"data": {"id": "eth_0x6b17", "type": "token"}},
+        "dex": {"data": {"id": "uniswap_v3", "type": "dex"}},
+    },
+}
+
+
+POOL_LIST_RELATIONS = {
+    "top_pools": {
+        "data": [{"type": "pool", "id": "a"}, {"type": "pool", "id": "b"}],
+    },
+    "links": {"data": None, "meta": {"count": 0}},
+}
+
+
+def test_attributes_are_decoded() -> None:
+    pool = Pool(POOL)
+    assert pool.id == POOL["id"]
+    assert pool.name == "WETH / DAI 0.05%"
+    assert pool.base_token_price_usd == 3401.25  # noqa: PLR2004
+    assert pool.pool_created_at == datetime.datetime(
+        2021, 5, 5, 17, 43, 47, tzinfo=datetime.UTC
+    )
+    assert pool.price_change_percentage == {"m5": 0.1, "h24": -2.5}
+    assert pool.transactions == {"h1": {"buys": 3, "sells": 1}}
+    # Null and missing attributes
+    assert pool.fdv_usd is None
+    assert pool.market_cap_usd is None
+
+
+def test_decoded_once() -> None:
+    pool = Pool(POOL)
+    assert pool.price_change_percentage is pool.price_change_percentage
+    assert pool.pool_created_at is pool.pool_created_at
+
+
+def test_relationships() -> None:
+    pool = Pool(POOL)
+    assert pool.relationship("base_token") == ("token", "eth_0xc02a")
+    assert pool.relationship("network") is None
+    multi = Token({"id": "t", "type": "token", "relationships": POOL_LIST_RELATIONS})
+    assert multi.relationship("top_pools") == [("pool", "a"), ("pool", "b")]
+    assert multi["relationships"] == POOL_LIST_RELATIONS
+
+
+def test_reads_like_the_raw_resource() -> None:
+    pool = Pool(POOL)
+    assert pool == POOL
+    assert pool["attributes"]["locked_liquidity_percentage"] == "12.5"
+    assert pool.get("links") is None
+    assert json.loads(json.dumps(dict(pool))) == POOL
+    with pytest.raises(AttributeError):
+        pool.extra = 1  # pyright: ignore [reportAttributeAccessIssue]
+
+
+def test_to_models() -> None:
+    trade = {
+        "id": "1",
+        "type": "trade",
+        "attributes": {
+            "block_number": 19000000,
+            "block_timestamp": "2024-01-13T12:00:00Z",
+            "volume_in_usd": "1500.5",
+        },
+    }
+    ohlcv = {
+        "id": "x",
+        "type": "ohlcv_request_response",
+        "attributes": {"ohlcv_list": [[60, 1, 2, 0.5, 1.5, 10]]},
+    }
+    response = to_models({"data": [trade, {"id": "p", "type": "other"}]})
+    model, other = response["data"]
+    assert isinstance(model, Trade)
+    assert model.volume_in_usd == 1500.5  # noqa: PLR2004
+    assert other == {"id": "p", "type": "other"}
+    candles = to_models({"data": ohlcv, "meta": {}})
+    assert isinstance(candles["data"], OHLCV)
+    assert candles["meta"] == {}
+    assert candles["data"].series().to_candles() == [[60, 1, 2, 0.5, 1.5, 10]]
+
+
+def test_client_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    gt = GeckoTerminalAPI(models=True)
+    dex = {"id": "uniswap_v3", "type": "dex", "attributes": {"name": "Uniswap V3"}}
+    body = json.dumps({"data": [POOL], "included": [dex]})
+    monkeypatch.setattr(gt, "_request", lambda *_: body.encode())
+    response = gt.network_pools("eth")
+    assert isinstance(response["data"][0], Pool)
+    assert response["data"][0].reserve_in_usd == 12345678.9012  # noqa: PLR2004
+    assert response["included"][0]["id"] == "uniswap_v3"
+    # Relationships resolve within the response, without hydrate()
+    assert response["data"][0].dex == dex
+    assert response["data"][0].base_token is None
+    raw = GeckoTerminalAPI()
+    monkeypatch.setattr(raw, "_request", lambda *_: body.encode())
+    assert type(raw.network_pools("eth")["data"][0]) is dict
@@ -0,0 +1,258 @@
+import pytest
+
+from geckoterminal_api import AsyncGeckoTerminalAPI, GeckoTerminalAPI, ohlcv
+from geckoterminal_api.limits import OHLCV_LIMIT
+from geckoterminal_api.ohlcv import (
+    OHLCVSeries,
+    OHLCVSync,
+    backfill_windows,
+    candle_interval,
+    fill_gaps,
+    find_gaps,
+    merge_candles,
+    merge_ohlcv_responses,
+    repair_windows,
+)
+from tests.fakes import FakeOHLCV
+
+END = 1_700_000_000
+GAP = 120_000
+
+
+def candles(*timestamps: int) -> list[list]:
+    return [[t, 1.0, 2.0, 0.5, 1.5, 10.0] for t in timestamps]
+
+
+def test_candle_interval() -> None:
+    assert candle_interval("minute", 15) == 15 * 60
+    assert candle_interval("day") == 86400  # noqa: PLR2004
+
+
+def test_backfill_windows_cover_range() -> None:
+    interval = candle_interval("minute")
+    start = END - 2500 * interval
+    windows = backfill_windows(start, END, "minute")
+    assert [before for before, _ in windows] == [
+        END - i * OHLCV_LIMIT * interval for i in range(3)
+    ]
+    assert [limit for _, limit in windows] == [OHLCV_LIMIT, OHLCV_LIMIT, 501]
+
+
+def test_backfill_windows_empty_range() -> None:
+    assert backfill_windows(END, END - 1, "day") == []
+
+
+def test_merge_candles_deduplicates_and_sorts() -> None:
+    merged = merge_candles([candles(300, 240, 180), candles(180, 120, 60)], start=100)
+    assert [c[0] for c in merged] == [300, 240, 180, 120]
+
+
+def test_merge_ohlcv_responses() -> None:
+    def response(*timestamps: int) -> dict:
+        return {
+            "data": {"id": "x", "attributes": {"ohlcv_list": candles(*timestamps)}},
+            "meta": {"base": {"symbol": "WETH"}},
+        }
+
+    merged = merge_ohlcv_responses([response(120, 60), response(60, 0)])
+    assert [c[0] for c in merged["data"]["attributes"]["ohlcv_list"]] == [120, 60, 0]
+    assert merged["meta"] == {"base": {"symbol": "WETH"}}
+
+
+def test_find_gaps() -> None:
+    series = candles(600, 60, 120, 360)
+    assert find_gaps(series, "minute") == [(180, 300), (420, 540)]
+    assert find_gaps(series, "minute", start=0, end=700) == [
+        (0, 0),
+        (180, 300),
+        (420, 540),
+        (660, 660),
+    ]
+    assert find_gaps([], "minute", start=0, end=120) == [(0, 120)]
+    assert find_gaps(candles(0, 900), "minute", 15) == []
+
+
+def test_repair_windows() -> None:
+    gaps = [(120, 120), (300, 360), (6000, 6000)]
+    assert repair_windows(gaps, "minute") == [(6000, 99)]
+    assert repair_windows(gaps, "minute", limit=5) == [(6000, 1), (360, 5)]
+    # A gap longer than the limit is split like a backfill
+    assert repair_windows([(0, 540)], "minute", limit=5) == [(540, 5), (240, 5)]
+    assert repair_windows([], "minute") == []
+
+
+def test_fill_gaps_forward_fills_no_trade_periods() -> None:
+    filled = fill_gaps(candles(0, 180), "minute")
+    assert [c[0] for c in filled] == [180, 120, 60, 0]
+    assert filled[1] == [120, 1.5, 1.5, 1.5, 1.5, 0]
+    assert find_gaps(filled, "minute") == []
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_ohlcv_series(monkeypatch: pytest.MonkeyPatch, *, use_numpy: bool) -> None:
+    if not use_numpy:
+        monkeypatch.setattr(ohlcv, "np", None)
+    elif ohlcv.np is None:
+        pytest.skip("NumPy is not installed")
+    newest_first = [
+        [180, 3, 4, 2, 3.5, 30],
+        [120, 2, 3, 1, 2.5, 20],
+        [60, 1, 2, 0.5, 1.5, 10],
+    ]
+    series = OHLCVSeries.from_response(
+        {"data": {"attributes": {"ohlcv_list": newest_first}}}
+    )
+    assert series.backend == ("numpy" if use_numpy else "array")
+    assert len(series) == 3  # noqa: PLR2004
+    assert list(series.timestamp) == [60, 120, 180]
+    assert list(series.close) == [1.5, 2.5, 3.5]
+    tail = series[1:]
+    assert list(tail.volume) == [20, 30]
+    series.volume[2] = 99
+    assert tail.volume[1] == 99  # noqa: PLR2004
+    assert tail.to_candles() == [[120, 2, 3, 1, 2.5, 20], [180, 3, 4, 2, 3.5, 99]]
+    assert len(OHLCVSeries.from_candles([])) == 0
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_ohlcv_series_resample(
+    monkeypatch: pytest.MonkeyPatch, *, use_numpy: bool
+) -> None:
+    if not use_numpy:
+        monkeypatch.setattr(ohlcv, "np", None)
+    elif ohlcv.np is None:
+        pytest.skip("NumPy is not installed")
+    hour = candle_interval("hour")
+    # Hours 3 to 10 without hour 6, price i and volume 1 in hour i
+    hours = [3, 4, 5, 7, 8, 9, 10]
+    series = OHLCVSeries.from_candles(
+        [[i * hour, i, i + 0.5, i - 0.5, i + 0.25, 1] for i in hours]
+    )
+    resampled = series.resample(candle_interval("hour", 4), hour)
+    assert resampled.to_candles() == [
+        [0, 3, 3.5, 2.5, 3.25, 1],
+        [4 * hour, 4, 7.5, 3.5, 7.25, 3],
+        [8 * hour, 8, 10.5, 7.5, 10.25, 3],
+    ]
+    complete = series.resample(candle_interval("hour", 4), hour, drop_partial=True)
+    assert complete.to_candles() == [[4 * hour, 4, 7.5, 3.5, 7.25, 3]]
+    with pytest.raises(ValueError, match="multiple"):
+        series.resample(90 * 60, hour)
+
+
+class FakeOHLCVClient:
+    """Serves minute candles up to the requested `before_timestamp`"""
+
+    def __init__(self) -> None:
+        self.limits = []
+
+    def network_pool_ohlcv(self, before_timestamp: int, limit: int, **_kwargs) -> dict:
+        self.limits.append(limit)
+        top = before_timestamp - before_timestamp % 60
+        return {
+            "data": {
+                "attributes": {
+                    "ohlcv_list": candles(*range(top, top - limit * 60, -60))
+                }
+            }
+        }
+
+
+def test_ohlcv_sync_fetches_only_new_candles() -> None:
+    client = FakeOHLCVClient()
+    sync = OHLCVSync(client, initial_limit=50)
+    first = sync.sync("eth", "0xpool", "minute")
+    assert len(first) == 50  # noqa: PLR2004
+    key = ("eth", "0xpool", "minute", 1, "usd", "base")
+    assert sync.marks[key] == first[0][0]
+
+    mark = sync.marks[key] = first[0][0] - 3 * 60
+    again = sync.sync("eth", "0xpool", "minute")
+    assert client.limits[-1] in {4, 5}
+    assert again[-1][0] == mark
+    assert sync.marks[key] == again[0][0] >= first[0][0]
+
+
+def timestamps(response: dict) -> list[int]:
+    return [c[0] for c in response["data"]["attributes"]["ohlcv_list"]]
+
+
+def test_backfill(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Every window also returns the first candle of the next one
+    fake = FakeOHLCV(range(60_000, 210_000, 60), overlap=1)
+    gt = GeckoTerminalAPI()
+    monkeypatch.setattr(gt, "_request", fake)
+    response = gt.network_pool_ohlcv_backfill(
+        "eth", "0xpool", "minute", start=60_000, end=209_940
+    )
+    assert sorted(fake.requests, reverse=True) == [
+        (209_940, OHLCV_LIMIT),
+        (149_940, OHLCV_LIMIT),
+        (89_940, 500),
+    ]
+    assert timestamps(response) == list(range(209_940, 59_999, -60))
+    assert response["meta"] == {"base": {"symbol": "WETH"}, "quote": {"symbol": "USDC"}}
+
+
+def test_repair(monkeypatch: pytest.MonkeyPatch) -> None:
+    series = [*range(60_000, 100_000, 60), *range(100_560, 180_000, 60)]
+    response = {
+        "data": {
+            "id": "ohlcv",
+            "type": "ohlcv_request_response",
+            "attributes": {"ohlcv_list": candles(*reversed(series), 180_120)},
+        }
+    }
+    # 180_000 and 180_060 had no trades
+    fake = FakeOHLCV([*range(60_000, 180_000, 60), 180_120])
+    gt = GeckoTerminalAPI()
+    monkeypatch.setattr(gt, "_request", fake)
+    repaired = gt.network_pool_ohlcv_repair("eth", "0xpool", "minute", response)
+    # Only the windows covering the gaps are requested
+    assert sorted(fake.requests) == [(100_500, 9), (180_060, 2)]
+    assert timestamps(repaired) == [180_120, *range(179_940, 59_999, -60)]
+    assert repaired["data"]["type"] == "ohlcv_request_response"
+
+    filled = gt.network_pool_ohlcv_repair(
+        "eth", "0xpool", "minute", response, fill=True
+    )
+    assert timestamps(filled) == list(range(180_120, 59_999, -60))
+
+
+def test_repair_sparse_series(monkeypatch: pytest.MonkeyPatch) -> None:
+    # A no-trade minute every 7 minutes over 1000 candles
+    series = [t for t in range(60_000, 120_000, 60) if t // 60 % 7]
+    response = {"data": {"attributes": {"ohlcv_list": candles(*reversed(series))}}}
+    fake = FakeOHLCV(series)
+    gt = GeckoTerminalAPI()
+    monkeypatch.setattr(gt, "_request", fake)
+    repaired = gt.network_pool_ohlcv_repair("eth", "0xpool", "minute", response)
+    gaps = find_gaps(response["data"]["attributes"]["ohlcv_list"], "minute")
+    assert len(gaps) > 100  # noqa: PLR2004
+    # One window from the oldest to the newest gap
+    assert fake.requests == [(gaps[-1][1], (gaps[-1][1] - gaps[0][0]) // 60 + 1)]
+    assert timestamps(repaired) == series[::-1]
+
+
+@pytest.mark.asyncio
+async def test_async_backfill_and_repair(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = FakeOHLCV(range(60_000, 210_000, 60), overlap=1)
+    gt = AsyncGeckoTerminalAPI()
+    monkeypatch.setattr(gt, "_request", fake.fetch)
+    response = await gt.network_pool_ohlcv_backfill(
+        "eth", "0xpool", "minute", start=60_000, end=209_940
+    )
+    assert sorted(fake.requests, reverse=True) == [
+        (209_940, OHLCV_LIMIT),
+        (149_940, OHLCV_LIMIT),
+        (89_940, 500),
+    ]
+    assert timestamps(response) == list(range(209_940, 59_999, -60))
+
+    fake.requests.clear()
+    attributes = response["data"]["attributes"]
+    attributes["ohlcv_list"] = [c for c in attributes["ohlcv_list"] if c[0] != GAP]
+    repaired = await gt.network_pool_ohlcv_repair("eth", "0xpool", "minute", response)
+    await gt.close()
+    assert fake.requests == [(GAP, 1)]
+    assert timestamps(repaired) == list(range(209_940, 59_999, -60))
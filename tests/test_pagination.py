@@ -0,0 +1,67 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from geckoterminal_api.limits import MAX_PAGE
+from geckoterminal_api.pagination import aiter_pages, iter_pages
+
+LAST_PAGE = 3
+
+
+def fake_page(page: int) -> dict:
+    return {"data": [page] if page <= LAST_PAGE else []}
+
+
+def test_iter_pages_stops_at_empty_page() -> None:
+    requested = []
+
+    def fetch(page: int) -> dict:
+        requested.append(page)
+        return fake_page(page)
+
+    pages = [p["data"][0] for p in iter_pages(fetch, lookahead=2)]
+    assert pages == [1, 2, 3]
+    assert max(requested) <= LAST_PAGE + 3
+
+
+def test_iter_pages_respects_max_page() -> None:
+    pages = list(iter_pages(lambda page: {"data": [page]}, lookahead=4))
+    assert len(pages) == MAX_PAGE
+
+
+@pytest.mark.asyncio
+async def test_aiter_pages_prefetches_concurrently() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def fetch(page: int) -> dict:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return fake_page(page)
+
+    pages = [p["data"][0] async for p in aiter_pages(fetch, lookahead=2)]
+    assert pages == [1, 2, 3]
+    assert peak == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_aiter_pages_cancels_prefetch_on_early_stop() -> None:
+    cancelled = []
+
+    async def fetch(page: int) -> dict:
+        try:
+            await asyncio.sleep(0 if page == 1 else 1)
+        except asyncio.CancelledError:
+            cancelled.append(page)
+            raise
+        return fake_page(page)
+
+    async with contextlib.aclosing(aiter_pages(fetch, lookahead=2)) as pages:
+        async for _ in pages:
+            break
+    await asyncio.sleep(0)
+    assert cancelled == [2, 3]
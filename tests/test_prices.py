@@ -0,0 +1,58 @@
+import asyncio
+import math
+
+import pytest
+
+from geckoterminal_api.exceptions import GeckoTerminalAPIError
+from geckoterminal_api.limits import MAX_ADDRESSES
+from geckoterminal_api.prices import PriceWatcher
+
+TOKENS = [("eth", f"0xA{i}") for i in range(70)] + [("bad", "0x1"), ("solana", "So1")]
+
+
+class FakePriceClient:
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, int]] = []
+
+    async def network_addresses_token_price(
+        self, network: str, addresses: list[str]
+    ) -> dict:
+        self.requests.append((network, len(addresses)))
+        if network == "bad":
+            raise GeckoTerminalAPIError(status=404, err=network)
+        # Lowercase like the API returns EVM addresses, one token without a price
+        prices = {a.lower(): "1.5" for a in addresses if a != "0xA69"}
+        return {"data": {"attributes": {"token_prices": prices}}}
+
+
+def test_batches_and_interval() -> None:
+    watcher = PriceWatcher(FakePriceClient(), TOKENS, period=10)
+    assert [(n, len(a)) for n, a in watcher.batches] == [
+        ("eth", MAX_ADDRESSES),
+        ("eth", MAX_ADDRESSES),
+        ("eth", 10),
+        ("bad", 1),
+        ("solana", 1),
+    ]
+    # 5 batches in 10 seconds would need 30 requests per minute
+    assert watcher.interval == 2  # noqa: PLR2004
+    watcher.requests_per_minute = 15
+    assert watcher.interval == 4  # noqa: PLR2004
+    assert watcher.stats["period"] == 20  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_round_robin_refresh() -> None:
+    client = FakePriceClient()
+    watcher = PriceWatcher(client, TOKENS, period=0.05, requests_per_minute=6000)
+    assert watcher.max_age == math.inf
+    async with watcher:
+        await asyncio.sleep(0.08)
+    networks = [network for network, _ in client.requests]
+    assert networks[:7] == ["eth", "eth", "eth", "bad", "solana", "eth", "eth"]
+    assert watcher.price("eth", "0xA3") == 1.5  # noqa: PLR2004
+    assert watcher.price("eth", "0xA69") is None
+    assert watcher.age("eth", "0xA3") < 1
+    assert watcher.age("bad", "0x1") == math.inf
+    assert watcher.stats["errors"] >= 1
+    assert isinstance(watcher.last_error, GeckoTerminalAPIError)
@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+import pytest
+
+from geckoterminal_api.rate_limit import RateLimiter
+
+# Three calls at 600 calls/min with no burst take at least two 0.1 s intervals
+PACED_DURATION = 0.19
+
+
+def test_burst_is_not_delayed() -> None:
+    limiter = RateLimiter(calls_per_minute=60, burst=3)
+    waits = [limiter.acquire() for _ in range(limiter.burst)]
+    assert waits == [0.0] * limiter.burst
+    assert limiter.stats["acquired"] == limiter.burst
+
+
+def test_requests_are_paced() -> None:
+    limiter = RateLimiter(calls_per_minute=600, burst=1)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start >= PACED_DURATION
+    assert limiter.stats["waited_seconds"] > 0
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="calls_per_minute"):
+        RateLimiter(calls_per_minute=0)
+    with pytest.raises(ValueError, match="burst"):
+        RateLimiter(burst=0)
+
+
+@pytest.mark.asyncio
+async def test_async_acquire_queues_tasks() -> None:
+    limiter = RateLimiter(calls_per_minute=600, burst=1)
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+    assert time.monotonic() - start >= PACED_DURATION
+
+
+@pytest.mark.asyncio
+async def test_cancelled_wait_returns_token() -> None:
+    limiter = RateLimiter(calls_per_minute=60, burst=1)
+    await limiter.acquire_async()
+    task = asyncio.create_task(limiter.acquire_async())
+    await asyncio.sleep(0)
+    assert limiter.stats["queued"] == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.stats["queued"] == 0
@@ -0,0 +1,104 @@
+import asyncio
+import datetime
+import time
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import requests
+
+from geckoterminal_api import AsyncGeckoTerminalAPI, GeckoTerminalAPI
+from geckoterminal_api.rate_limit import RateLimiter
+from geckoterminal_api.retry import RetryPolicy, parse_retry_after
+
+# Rate limited with a Retry-After of 5 s, then unavailable, then served
+STATUSES = [(429, {"Retry-After": "5"}), (503, {}), (200, {})]
+# The Retry-After wins over the 1 s backoff, then the 2 s backoff of attempt 2
+DELAYS = [5, 2]
+
+
+def test_should_retry() -> None:
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry(429, attempt=1)
+    assert policy.should_retry(503, attempt=2)
+    assert not policy.should_retry(503, attempt=3)
+    assert not policy.should_retry(404, attempt=1)
+
+
+def test_exponential_backoff_is_capped() -> None:
+    policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+    assert [policy.delay(n) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+def test_full_jitter_stays_below_ceiling() -> None:
+    policy = RetryPolicy(backoff_base=2, backoff_cap=60)
+    assert all(0 <= policy.delay(3) <= 2 * 2**2 for _ in range(100))
+
+
+def test_retry_after_is_honored() -> None:
+    policy = RetryPolicy(backoff_base=0.1, backoff_cap=30, jitter=False)
+    assert policy.delay(1, retry_after="12") == 12  # noqa: PLR2004
+    assert policy.delay(1, retry_after="120") == policy.backoff_cap
+    ignoring = RetryPolicy(backoff_base=0.1, jitter=False, respect_retry_after=False)
+    assert ignoring.delay(1, retry_after="12") == ignoring.backoff_base
+
+
+def test_parse_retry_after() -> None:
+    later = datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(seconds=30)
+    assert 0 < parse_retry_after(format_datetime(later, usegmt=True)) <= 30  # noqa: PLR2004
+    assert parse_retry_after("3.5") == 3.5  # noqa: PLR2004
+    assert parse_retry_after("garbage") == 0
+    # asctime dates have no zone
+    assert parse_retry_after("Sun Nov  6 08:49:37 1994") == 0
+    assert parse_retry_after("Sun Nov  6 08:49:37 2094") > 0
+    asctime = later.strftime("%a %b %d %H:%M:%S %Y")
+    assert 0 < parse_retry_after(asctime) <= 30  # noqa: PLR2004
+
+
+def test_client_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    get = MagicMock(
+        side_effect=[
+            MagicMock(status_code=status, headers=headers, content=b"{}")
+            for status, headers in STATUSES
+        ]
+    )
+    sleep = MagicMock()
+    monkeypatch.setattr(requests.Session, "get", get)
+    monkeypatch.setattr(time, "sleep", sleep)
+    limiter = RateLimiter(calls_per_minute=60, burst=len(STATUSES))
+    gt = GeckoTerminalAPI(
+        rate_limiter=limiter, retry_policy=RetryPolicy(backoff_base=1, jitter=False)
+    )
+    assert gt.networks() == {}
+    assert get.call_count == len(STATUSES)
+    assert limiter.stats["acquired"] == len(STATUSES)
+    assert [call.args[0] for call in sleep.call_args_list] == DELAYS
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    responses = []
+    for status, headers in STATUSES:
+        response = MagicMock(status=status, headers=headers)
+        response.read = AsyncMock(return_value=b"{}")
+        context = MagicMock()
+        context.__aenter__.return_value = response
+        responses.append(context)
+    session = MagicMock()
+    session.get.side_effect = responses
+    sleep = AsyncMock()
+    blocking_sleep = MagicMock()
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    monkeypatch.setattr(time, "sleep", blocking_sleep)
+    limiter = RateLimiter(calls_per_minute=60, burst=len(STATUSES))
+    gt = AsyncGeckoTerminalAPI(
+        session=session,
+        rate_limiter=limiter,
+        retry_policy=RetryPolicy(backoff_base=1, jitter=False),
+    )
+    assert await gt.networks() == {}
+    await gt.close()
+    assert session.get.call_count == len(STATUSES)
+    assert limiter.stats["acquired"] == len(STATUSES)
+    assert [call.args[0] for call in sleep.await_args_list] == DELAYS
+    blocking_sleep.assert_not_called()
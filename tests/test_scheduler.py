@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from geckoterminal_api.scheduler import (
+    PriorityScheduler,
+    current_lane,
+    request_priority,
+)
+
+
+async def run_in_lanes(
+    scheduler: PriorityScheduler, lanes: list[str], order: list[str]
+) -> None:
+    async def request(lane: str) -> None:
+        async with scheduler.slot(lane):
+            order.append(lane)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(request(lane) for lane in lanes))
+
+
+@pytest.mark.asyncio
+async def test_higher_lanes_are_served_first() -> None:
+    scheduler = PriorityScheduler(concurrency=1, min_bulk_share=0)
+    order: list[str] = []
+    await run_in_lanes(
+        scheduler, ["bulk", "bulk", "normal", "interactive", "normal"], order
+    )
+    # The first request takes the free slot, then queued requests by lane
+    assert order == ["bulk", "interactive", "normal", "normal", "bulk"]
+    stats = scheduler.stats
+    assert stats["bulk"]["granted"] == 2  # noqa: PLR2004
+    assert stats["normal"]["queued"] == 0
+    assert stats["bulk"]["max_wait"] >= stats["interactive"]["max_wait"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_gets_minimum_share() -> None:
+    scheduler = PriorityScheduler(concurrency=1, min_bulk_share=0.25)
+    order: list[str] = []
+    await run_in_lanes(scheduler, ["normal"] + ["bulk"] * 3 + ["normal"] * 9, order)
+    # Every 4th slot goes to a waiting bulk request
+    assert [i for i, lane in enumerate(order) if lane == "bulk"] == [4, 8, 12]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_leave_the_queue() -> None:
+    scheduler = PriorityScheduler(concurrency=1)
+    await scheduler.acquire()
+    waiter = asyncio.create_task(scheduler.acquire("bulk"))
+    await asyncio.sleep(0)
+    assert scheduler.stats["bulk"]["queued"] == 1
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert scheduler.stats["bulk"]["queued"] == 0
+    scheduler.release()
+    await asyncio.wait_for(scheduler.acquire("interactive"), 1)
+
+
+@pytest.mark.asyncio
+async def test_request_priority_is_inherited_by_tasks() -> None:
+    assert current_lane() == "normal"
+    with request_priority("bulk"):
+        task = asyncio.create_task(asyncio.sleep(0, current_lane()))
+    assert current_lane() == "normal"
+    assert await task == "bulk"
+    with pytest.raises(ValueError, match="lane"), request_priority("urgent"):
+        pass
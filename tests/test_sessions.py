@@ -0,0 +1,58 @@
+import socket
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from geckoterminal_api import GeckoTerminalAPI
+from geckoterminal_api.adapters import SocketOptionsAdapter, keepalive_socket_options
+
+
+def test_pool_options() -> None:
+    gt = GeckoTerminalAPI(pool_maxsize=64, pool_block=True, tcp_keepalive=30)
+    adapter = gt.session.get_adapter("https://api.geckoterminal.com")
+    assert isinstance(adapter, SocketOptionsAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64  # noqa: PLR2004
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    options = adapter.poolmanager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+    assert GeckoTerminalAPI(max_concurrency=32).pool_maxsize == 32  # noqa: PLR2004
+
+
+def test_keepalive_socket_options() -> None:
+    options = keepalive_socket_options(60, interval=5, count=3)
+    assert options[0] == (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        assert (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 5) in options
+
+
+@pytest.mark.parametrize("session_per_thread", [True, False])
+def test_session_per_thread(*, session_per_thread: bool) -> None:
+    gt = GeckoTerminalAPI(session_per_thread=session_per_thread)
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(gt.session))
+    thread.start()
+    thread.join()
+    assert gt.session is gt.session
+    assert (sessions[0] is not gt.session) is session_per_thread
+
+
+def test_request_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    get = MagicMock(return_value=MagicMock(status_code=200, content=b"{}"))
+    monkeypatch.setattr(requests.Session, "get", get)
+    gt = GeckoTerminalAPI(timeout=(3, 10))
+    other = GeckoTerminalAPI(timeout=7)
+    gt.networks()
+    with gt.request_timeout(2):
+        gt.networks(page=2)
+        # Other clients keep their own timeout
+        other.networks()
+    gt.networks(page=3)
+    assert [call.kwargs["timeout"] for call in get.call_args_list] == [
+        (3, 10),
+        2,
+        7,
+        (3, 10),
+    ]
@@ -0,0 +1,143 @@
+from pathlib import Path
+
+import pytest
+
+from geckoterminal_api import OHLCV, AsyncGeckoTerminalAPI, GeckoTerminalAPI
+from geckoterminal_api.store import OHLCVStore
+from tests.fakes import FakeOHLCV
+
+KEY = ("eth", "0xpool", "minute", 1, "usd", "base")
+NOW = 1_700_000_070
+
+
+def candles(*timestamps: int) -> list[list]:
+    return [[t, 1.0, 2.0, 0.5, 1.5, 10.0] for t in timestamps]
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> OHLCVStore:
+    return OHLCVStore(tmp_path / "ohlcv.sqlite3")
+
+
+def test_only_closed_candles_are_stored(store: OHLCVStore) -> None:
+    # The candle starting at NOW - 30 is still open
+    store.put(KEY, candles(NOW - 30, NOW - 90, NOW - 150), [(NOW - 150, NOW)], NOW)
+    assert [c[0] for c in store.get(KEY, 0, NOW)] == [NOW - 90, NOW - 150]
+    assert store.missing(KEY, NOW - 150, NOW) == [(NOW - 30, NOW)]
+
+
+def test_missing_ranges(store: OHLCVStore) -> None:
+    store.put(KEY, candles(1000, 1060), [(1000, 1060)], NOW)
+    store.put(KEY, candles(1300), [(1300, 1360)], NOW)
+    assert store.missing(KEY, 900, 1500) == [(900, 999), (1120, 1299), (1420, 1500)]
+    assert store.missing(KEY, 1000, 1060) == []
+    # Adjacent ranges are merged, periods without candles stay covered
+    store.put(KEY, [], [(1120, 1240)], NOW)
+    assert store.missing(KEY, 1000, 1360) == []
+    assert store.missing(("eth", "other", "minute", 1, "usd", "base"), 0, 10) == [
+        (0, 10)
+    ]
+
+
+def test_store_is_shared_between_connections(tmp_path: Path) -> None:
+    path = tmp_path / "ohlcv.sqlite3"
+    OHLCVStore(path).put(KEY, candles(1000), [(1000, 1000)], NOW)
+    reader = OHLCVStore(path)
+    assert reader.get(KEY, 0, NOW) == candles(1000)
+    reader.close()
+
+
+def test_envelope(store: OHLCVStore) -> None:
+    assert store.envelope(KEY) is None
+    store.put_envelope(
+        KEY, {"data": {"id": "o", "attributes": {"ohlcv_list": [[1]]}}, "meta": {}}
+    )
+    assert store.envelope(KEY) == {
+        "data": {"id": "o", "attributes": {"ohlcv_list": []}},
+        "meta": {},
+    }
+
+
+def test_backfill_from_store(
+    store: OHLCVStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake = FakeOHLCV(range(60_000, 72_000, 60))
+    gt = GeckoTerminalAPI()
+    monkeypatch.setattr(gt, "_request", fake)
+
+    def backfill(start: int, end: int) -> dict:
+        return gt.network_pool_ohlcv_backfill(
+            "eth", "0xpool", "minute", start=start, end=end, store=store
+        )
+
+    def envelope(response: dict) -> dict:
+        data = response["data"]
+        attributes = {k: v for k, v in data["attributes"].items() if k != "ohlcv_list"}
+        return {**response, "data": {**data, "attributes": attributes}}
+
+    cold = backfill(60_000, 65_940)
+    assert fake.requests == [(65_940, 100)]
+    assert [c[0] for c in cold["data"]["attributes"]["ohlcv_list"]] == list(
+        range(65_940, 59_999, -60)
+    )
+    assert cold["data"]["type"] == "ohlcv_request_response"
+
+    # Only the range after the stored one is requested
+    fake.requests.clear()
+    partial = backfill(63_000, 68_940)
+    assert fake.requests == [(68_940, 50)]
+    assert len(partial["data"]["attributes"]["ohlcv_list"]) == 100  # noqa: PLR2004
+    assert envelope(partial) == envelope(cold)
+
+    fake.requests.clear()
+    warm = backfill(60_000, 68_940)
+    assert fake.requests == []
+    assert len(warm["data"]["attributes"]["ohlcv_list"]) == 150  # noqa: PLR2004
+    assert envelope(warm) == envelope(cold)
+    assert warm["meta"] == {"base": {"symbol": "WETH"}, "quote": {"symbol": "USDC"}}
+
+    gt.models = True
+    assert isinstance(backfill(60_000, 68_940)["data"], OHLCV)
+
+
+def test_backfill_fetches_missing_envelope(
+    store: OHLCVStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Candles stored before envelopes were
+    store.put(KEY, candles(60_000, 60_060), [(60_000, 60_060)], NOW)
+    fake = FakeOHLCV([60_000, 60_060])
+    gt = GeckoTerminalAPI()
+    monkeypatch.setattr(gt, "_request", fake)
+    response = gt.network_pool_ohlcv_backfill(
+        *KEY[:3], start=60_000, end=60_060, store=store
+    )
+    assert fake.requests == [(60_060, 1)]
+    assert response["meta"]["base"] == {"symbol": "WETH"}
+    assert [c[0] for c in response["data"]["attributes"]["ohlcv_list"]] == [
+        60_060,
+        60_000,
+    ]
+    assert store.envelope(KEY) is not None
+
+
+@pytest.mark.asyncio
+async def test_close_reaches_executor_connections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "ohlcv.sqlite3"
+    store = OHLCVStore(path)
+    fake = FakeOHLCV(range(60_000, 66_000, 60))
+    gt = AsyncGeckoTerminalAPI()
+    monkeypatch.setattr(gt, "_request", fake.fetch)
+    await gt.network_pool_ohlcv_backfill(
+        *KEY[:3], start=60_000, end=65_940, store=store
+    )
+    await gt.close()
+    # SQLite removes the write-ahead log once the last connection is closed
+    wal = tmp_path / "ohlcv.sqlite3-wal"
+    assert wal.exists()
+    store.close()
+    assert not wal.exists()
+    # Reopened on use
+    assert len(store.get(KEY, 60_000, 65_940)) == 100  # noqa: PLR2004
+    store.close()
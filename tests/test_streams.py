@@ -0,0 +1,201 @@
+import asyncio
+import datetime
+
+import pytest
+
+from geckoterminal_api.exceptions import GeckoTerminalAPIError
+from geckoterminal_api.streams import NewPoolWatcher, TradeStream
+
+
+def trade(i: int) -> dict:
+    return {"id": f"eth_{i}", "type": "trade", "attributes": {"tx_hash": f"0x{i}"}}
+
+
+class FakeTradesClient:
+    """Serves overlapping trade batches, newest first like the API"""
+
+    def __init__(self, batches: list[list[int]]) -> None:
+        self.batches = batches
+        self.calls = 0
+
+    async def network_pool_trades(
+        self, network: str, pool_address: str, _volume: int | None = 0
+    ) -> dict:
+        if network == "bad":
+            raise GeckoTerminalAPIError(status=404, err=pool_address)
+        batch = self.batches[min(self.calls, len(self.batches) - 1)]
+        self.calls += 1
+        return {"data": [trade(i) for i in reversed(batch)]}
+
+
+@pytest.mark.asyncio
+async def test_trade_stream_yields_new_trades_in_order() -> None:
+    client = FakeTradesClient([[1, 2, 3], [2, 3, 4, 5], [4, 5, 6], [6]])
+    async with TradeStream(
+        client,
+        [("eth", "0xpool")],
+        min_interval=0.01,
+        max_interval=0.05,
+    ) as stream:
+        received = [await anext(stream) for _ in range(3)]
+        assert [t["id"] for _, _, t in received] == ["eth_4", "eth_5", "eth_6"]
+        assert received[0][:2] == ("eth", "0xpool")
+        await asyncio.sleep(0.1)
+        # Quiet pool: the interval backs off to the maximum
+        assert stream.intervals["eth", "0xpool"] == 0.05  # noqa: PLR2004
+        assert stream.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_trade_stream_backpressure_and_seen_limit() -> None:
+    client = FakeTradesClient([[1, 2, 3, 4], [1, 2, 3, 4]])
+    stream = TradeStream(
+        client,
+        [("eth", "0xpool")],
+        min_interval=0.01,
+        max_seen=2,
+        max_queue=3,
+        include_recent=True,
+    )
+    stream.start()
+    await asyncio.sleep(0.05)
+    # The queue is full, polling waits for the consumer
+    assert stream.queued == 3  # noqa: PLR2004
+    assert client.calls == 1
+    ids = [(await anext(stream))[2]["id"] for _ in range(6)]
+    # Only the 2 newest ids are remembered, so 1 and 2 come again
+    assert ids == ["eth_1", "eth_2", "eth_3", "eth_4", "eth_1", "eth_2"]
+    stream.close()
+
+
+@pytest.mark.asyncio
+async def test_trade_stream_raises_poll_errors() -> None:
+    stream = TradeStream(FakeTradesClient([[]]), [("bad", "0xpool")])
+    with pytest.raises(GeckoTerminalAPIError):
+        await anext(stream)
+    stream.close()
+
+
+@pytest.mark.asyncio
+async def test_trade_stream_recovers_from_poll_errors() -> None:
+    class FlakyClient(FakeTradesClient):
+        async def network_pool_trades(
+            self, network: str, pool_address: str, _volume: int | None = 0
+        ) -> dict:
+            if self.calls == 1:
+                self.calls += 1
+                raise GeckoTerminalAPIError(status=429, err="Rate Limited")
+            return await super().network_pool_trades(network, pool_address, _volume)
+
+    client = FlakyClient([[1], [1], [1, 2]])
+    async with TradeStream(
+        client, [("eth", "0xpool")], min_interval=0.01, max_interval=0.02
+    ) as stream:
+        with pytest.raises(GeckoTerminalAPIError):
+            await asyncio.wait_for(anext(stream), timeout=1)
+        assert stream.intervals["eth", "0xpool"] == 0.02  # noqa: PLR2004
+        _, _, new = await asyncio.wait_for(anext(stream), timeout=1)
+        assert new["id"] == "eth_2"
+
+
+@pytest.mark.asyncio
+async def test_trade_stream_raises_poller_failures() -> None:
+    class BrokenClient(FakeTradesClient):
+        async def network_pool_trades(
+            self, network: str, pool_address: str, _volume: int | None = 0
+        ) -> dict:
+            await super().network_pool_trades(network, pool_address, _volume)
+            return {"data": ["not a trade"]}
+
+    stream = TradeStream(BrokenClient([[]]), [("eth", "0xpool")])
+    with pytest.raises(AttributeError):
+        await asyncio.wait_for(anext(stream), timeout=1)
+    stream.close()
+
+
+PAGE_SIZE = 20
+
+
+def new_pool(i: int) -> dict:
+    created_at = datetime.datetime.fromtimestamp(1_700_000_000 + i, tz=datetime.UTC)
+    return {
+        "id": f"eth_0x{i}",
+        "type": "pool",
+        "attributes": {"pool_created_at": created_at.isoformat()},
+        "relationships": {"network": {"data": {"id": "eth", "type": "network"}}},
+    }
+
+
+class FakeNewPoolsClient:
+    """Serves the newest pools first in pages of 20"""
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.pages: list[int] = []
+
+    async def network_new_pools(
+        self, _network: str, include: list | None = None, page: int = 1
+    ) -> dict:
+        assert include is None
+        self.pages.append(page)
+        newest = self.count - (page - 1) * PAGE_SIZE
+        return {
+            "data": [new_pool(i) for i in range(newest, max(newest - PAGE_SIZE, 0), -1)]
+        }
+
+
+@pytest.mark.asyncio
+async def test_new_pool_watcher_follows_cursor() -> None:
+    client = FakeNewPoolsClient(50)
+    async with NewPoolWatcher(client, ["eth"], interval=0.01) as watcher:
+        await asyncio.sleep(0.05)
+        assert set(client.pages) == {1}
+        # 25 new pools push the cursor off page 1
+        client.count += 25
+        pools = [await anext(watcher) for _ in range(25)]
+        assert [p["id"] for _, p, _ in pools] == [f"eth_0x{i}" for i in range(51, 76)]
+        assert pools[0][0] == "eth"
+        assert pools[0][2] > 0
+        assert client.pages.count(2) == 1
+        await asyncio.sleep(0.05)
+        assert watcher.queued == 0
+        assert watcher.stats["detected"] == 25  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_new_pool_watcher_without_network_linkage() -> None:
+    class NoNetworkClient(FakeNewPoolsClient):
+        async def network_new_pools(
+            self, _network: str, include: list | None = None, page: int = 1
+        ) -> dict:
+            response = await super().network_new_pools(_network, include, page)
+            for pool in response["data"]:
+                pool["relationships"]["network"] = {"data": None}
+            return response
+
+    watcher = NewPoolWatcher(NoNetworkClient(3), ["base"], include_recent=True)
+    network, pool, _ = await asyncio.wait_for(anext(watcher), timeout=1)
+    assert (network, pool["id"]) == ("base", "eth_0x1")
+    watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_new_pool_watcher_recovers_from_poll_errors() -> None:
+    class FlakyClient(FakeNewPoolsClient):
+        async def network_new_pools(
+            self, _network: str, include: list | None = None, page: int = 1
+        ) -> dict:
+            if len(self.pages) == 1:
+                self.pages.append(page)
+                raise GeckoTerminalAPIError(status=503, err="Service Unavailable")
+            return await super().network_new_pools(_network, include, page)
+
+    client = FlakyClient(3)
+    async with NewPoolWatcher(
+        client, ["eth"], interval=0.01, max_interval=0.02
+    ) as watcher:
+        with pytest.raises(GeckoTerminalAPIError):
+            await asyncio.wait_for(anext(watcher), timeout=1)
+        client.count += 1
+        _, pool, _ = await asyncio.wait_for(anext(watcher), timeout=1)
+        assert pool["id"] == "eth_0x4"